@@ -0,0 +1,289 @@
+"""
+대국 기록 병렬 분석기
+큰 대국 기록 보관 파일을 스트리밍으로 읽어 일정한 크기의 묶음(청크)으로 나누고,
+워커 프로세스마다 묶음의 대국을 Game.make_move로 다시 두며 부분 통계를 모은 뒤 합칩니다.
+동시에 처리 중인 묶음 수를 워커 수의 두 배로 제한하므로 보관 파일 크기와 관계없이 메모리가 일정합니다
+(오프닝 표만 서로 다른 수순의 수만큼 커집니다).
+
+집계 항목:
+    오프닝 수순별 승률, 평균 대국 길이, 흑(선수)의 승률 우위, 금수로 거부된 수의 빈도, 초당 처리 대국 수
+
+사용법:
+    python -m analytics games.omok more_games.omok
+    python -m analytics selfplay.jsonl --workers 4 --chunk-size 2000 --opening-plies 4 --output stats.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from board import Board
+from game import Game
+from game_record import MAGIC, GameRecord, GameResult, read_records
+from sparse_board import SparseBoard
+
+
+# selfplay JSONL 기록의 결과 문자열 -> GameResult
+_JSON_RESULTS = {"black": GameResult.BLACK_WIN, "white": GameResult.WHITE_WIN, "draw": GameResult.DRAW,
+                 "unfinished": GameResult.UNFINISHED}
+
+# 결과별 집계 키
+_RESULT_KEYS = {
+    GameResult.BLACK_WIN: "black",
+    GameResult.WHITE_WIN: "white",
+    GameResult.DRAW: "draw",
+    GameResult.UNFINISHED: "unfinished",
+}
+
+# 워커 프로세스에서 보드 크기별로 재사용하는 게임 (None은 무한 보드)
+_games: Dict[Optional[int], Game] = {}
+
+
+class Aggregate:
+    """대국 묶음 하나 또는 여러 묶음을 합친 부분 통계"""
+    
+    def __init__(self):
+        """빈 통계를 만듭니다."""
+        self.games = 0
+        self.moves = 0
+        self.results = {key: 0 for key in _RESULT_KEYS.values()}
+        self.openings: Dict[Tuple[Tuple[int, int], ...], List[int]] = {}  # 수순 -> [대국, 흑승, 백승, 무승부]
+        self.rejected_games = 0  # 다시 두다가 거부된 수가 있는 대국 수
+        self.forbidden: Dict[str, int] = {}  # 금수 종류 -> 거부 횟수
+    
+    def add_game(self, record: GameRecord, opening_plies: int):
+        """
+        대국 한 판을 Game.make_move로 다시 두며 통계에 더합니다.
+        
+        금수 등으로 거부된 수가 나오면 그 대국은 거기서 멈추고 거부 통계에 더합니다.
+        
+        Args:
+            record (GameRecord): 대국 기록
+            opening_plies (int): 오프닝으로 묶을 첫 수의 개수
+        """
+        game = _games.get(record.board_size)
+        if game is None:
+            # 크기가 없는 기록(selfplay --board-size 0)은 무한 보드에서 다시 둠
+            board = Board(record.board_size) if record.board_size is not None else SparseBoard(None)
+            game = _games[record.board_size] = Game("흑", "백", board)
+        else:
+            game.reset_game()
+        
+        for row, col in record.moves:
+            if not game.make_move(row, col):
+                self.rejected_games += 1
+                if game.last_forbidden:
+                    self.forbidden[game.last_forbidden] = self.forbidden.get(game.last_forbidden, 0) + 1
+                break
+        
+        result_key = _RESULT_KEYS[record.result]
+        self.games += 1
+        self.moves += game.get_move_count()
+        self.results[result_key] += 1
+        
+        if len(record.moves) >= opening_plies:
+            opening = tuple(tuple(move) for move in record.moves[:opening_plies])
+            entry = self.openings.get(opening)
+            if entry is None:
+                entry = self.openings[opening] = [0, 0, 0, 0]
+            entry[0] += 1
+            if result_key != "unfinished":
+                entry[("black", "white", "draw").index(result_key) + 1] += 1
+    
+    def merge(self, other: "Aggregate"):
+        """다른 부분 통계를 이 통계에 더합니다."""
+        self.games += other.games
+        self.moves += other.moves
+        for key, count in other.results.items():
+            self.results[key] += count
+        for opening, counts in other.openings.items():
+            entry = self.openings.get(opening)
+            if entry is None:
+                self.openings[opening] = counts[:]
+            else:
+                for index, count in enumerate(counts):
+                    entry[index] += count
+        self.rejected_games += other.rejected_games
+        for kind, count in other.forbidden.items():
+            self.forbidden[kind] = self.forbidden.get(kind, 0) + count
+    
+    def summary(self, top_openings: int = 10, min_games: int = 1) -> dict:
+        """
+        통계를 보고서 딕셔너리로 정리합니다.
+        
+        Args:
+            top_openings (int): 보고할 오프닝 수 (대국 수가 많은 순, 같으면 수순 순이라 묶음 순서와 무관)
+            min_games (int): 보고할 오프닝의 최소 대국 수
+        
+        Returns:
+            dict: 대국 수, 평균 길이, 결과, 흑 우위, 금수 거부 빈도, 오프닝별 승률
+        """
+        decided = self.results["black"] + self.results["white"]
+        openings = sorted(((counts, opening) for opening, counts in self.openings.items()
+                           if counts[0] >= min_games), key=lambda item: (-item[0][0], item[1]))
+        return {
+            "games": self.games,
+            "moves": self.moves,
+            "average_length": self.moves / self.games if self.games else 0.0,
+            "results": dict(self.results),
+            # 승부가 난 대국에서 흑 승률과, 흑 승률에서 백 승률을 뺀 선수 우위
+            "black_win_rate": self.results["black"] / decided if decided else 0.0,
+            "first_move_advantage": (self.results["black"] - self.results["white"]) / decided if decided else 0.0,
+            "rejected_games": self.rejected_games,
+            "forbidden_rejections": dict(self.forbidden),
+            "forbidden_per_1000_moves": 1000.0 * sum(self.forbidden.values()) / self.moves if self.moves else 0.0,
+            "openings": [
+                {
+                    "moves": " ".join(f"{row},{col}" for row, col in opening),
+                    "games": games,
+                    "black_win_rate": black / games,
+                    "white_win_rate": white / games,
+                    "draw_rate": draws / games,
+                }
+                for (games, black, white, draws), opening in openings[:top_openings]
+            ],
+        }
+
+
+def iter_records(path: str) -> Iterator[GameRecord]:
+    """
+    보관 파일의 대국 기록을 한 판씩 돌려줍니다.
+    
+    game_record 바이너리 형식과 selfplay의 JSON Lines 형식을 파일 머리로 구분합니다.
+    
+    Args:
+        path (str): 보관 파일 경로
+    
+    Yields:
+        GameRecord: 대국 기록
+    """
+    with open(path, "rb") as file:
+        binary = file.read(len(MAGIC)) == MAGIC
+    if binary:
+        yield from read_records(path)
+        return
+    
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            data = json.loads(line)
+            # board_size가 null이면 무한 보드 (키가 없는 예전 기록만 15x15로 봄)
+            yield GameRecord(data.get("board_size", 15), data.get("black", ""), data.get("white", ""),
+                             _JSON_RESULTS.get(data["result"], GameResult.UNFINISHED),
+                             [tuple(move) for move in data["moves"]])
+
+
+def iter_chunks(paths: Iterable[str], chunk_size: int) -> Iterator[List[GameRecord]]:
+    """보관 파일들의 기록을 chunk_size판씩 묶어 돌려줍니다."""
+    chunk = []
+    for path in paths:
+        for record in iter_records(path):
+            chunk.append(record)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def analyze_chunk(records: List[GameRecord], opening_plies: int) -> Aggregate:
+    """
+    대국 묶음 하나의 부분 통계를 만듭니다 (워커 프로세스에서 실행).
+    
+    Args:
+        records (List[GameRecord]): 대국 기록 묶음
+        opening_plies (int): 오프닝으로 묶을 첫 수의 개수
+    
+    Returns:
+        Aggregate: 부분 통계
+    """
+    aggregate = Aggregate()
+    for record in records:
+        aggregate.add_game(record, opening_plies)
+    return aggregate
+
+
+def run_analytics(paths: Iterable[str], workers: Optional[int] = None, chunk_size: int = 1000,
+                  opening_plies: int = 3) -> Tuple[Aggregate, float]:
+    """
+    보관 파일들을 병렬로 분석합니다.
+    
+    Args:
+        paths (Iterable[str]): 보관 파일 경로들
+        workers (Optional[int]): 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 실행)
+        chunk_size (int): 워커에 한 번에 넘길 대국 수
+        opening_plies (int): 오프닝으로 묶을 첫 수의 개수
+    
+    Returns:
+        Tuple[Aggregate, float]: (합친 통계, 걸린 시간(초))
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    total = Aggregate()
+    chunks = iter_chunks(paths, chunk_size)
+    
+    if workers == 1:
+        for chunk in chunks:
+            total.merge(analyze_chunk(chunk, opening_plies))
+        return total, time.perf_counter() - start
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        exhausted = False
+        while not exhausted or pending:
+            # 동시에 처리 중인 묶음 수를 워커 수의 두 배로 제한
+            while not exhausted and len(pending) < workers * 2:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                pending.add(executor.submit(analyze_chunk, chunk, opening_plies))
+            
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                total.merge(future.result())
+    return total, time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="대국 기록 보관 파일의 통계를 병렬로 집계합니다.")
+    parser.add_argument("archives", nargs="+", help="game_record 바이너리 또는 selfplay JSONL 파일 경로")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="워커에 한 번에 넘길 대국 수")
+    parser.add_argument("--opening-plies", type=int, default=3, help="오프닝으로 묶을 첫 수의 개수")
+    parser.add_argument("--top", type=int, default=10, help="보고할 오프닝 수")
+    parser.add_argument("--min-games", type=int, default=1, help="보고할 오프닝의 최소 대국 수")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args(argv)
+    
+    total, elapsed = run_analytics(args.archives, args.workers, args.chunk_size, args.opening_plies)
+    report = total.summary(args.top, args.min_games)
+    report["seconds"] = round(elapsed, 3)
+    report["games_per_second"] = total.games / elapsed if elapsed > 0 else 0.0
+    
+    results = report["results"]
+    print(f"대국 {report['games']:,}판, 평균 {report['average_length']:.1f}수 "
+          f"(흑 {results['black']}승 / 백 {results['white']}승 / 무 {results['draw']} / 미완료 {results['unfinished']})")
+    print(f"흑 승률: {report['black_win_rate']:.1%}, 선수 우위: {report['first_move_advantage']:+.1%}")
+    forbidden = ", ".join(f"{kind} {count}" for kind, count in sorted(report["forbidden_rejections"].items())) or "없음"
+    print(f"금수 거부: {forbidden} (1000수당 {report['forbidden_per_1000_moves']:.2f}회, "
+          f"거부된 대국 {report['rejected_games']}판)")
+    for opening in report["openings"]:
+        print(f"  {opening['moves']:<24} {opening['games']:>8,}판  흑 {opening['black_win_rate']:.1%}  "
+              f"백 {opening['white_win_rate']:.1%}  무 {opening['draw_rate']:.1%}")
+    print(f"처리 속도: 초당 {report['games_per_second']:,.1f}판 ({report['seconds']}초)")
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as output:
+            json.dump(report, output, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,282 @@
+"""
+백그라운드 컴퓨터 플레이어
+AlphaBetaEngine을 별도의 워커 프로세스에서 실행해 탐색 중에도 tkinter 메인 루프가 멈추지 않게 합니다.
+GUI는 요청 큐에 국면 스냅숏을 넣고, 결과 큐는 root.after로 짧은 주기마다 기다리지 않고 확인합니다.
+탐색은 다른 코어에서 전속력으로 돌고 메인 스레드는 큐 확인만 하므로 입력 지연이 한 프레임을 넘지 않습니다.
+
+요청마다 세대 번호를 붙이고 최신 세대 번호를 공유 메모리 값 하나에 둡니다.
+cancel()(무르기, 새 게임)은 세대 번호만 올리며, 워커의 탐색은 16 노드마다 이 값을 확인해 바로 멈추고
+이전 세대의 결과는 GUI에 전달되지 않고 버려집니다.
+
+미리 생각하기(ponder):
+    수를 돌려준 뒤 워커는 상대의 예상 응수를 둔 국면을 시간 제한 없이 계속 탐색합니다.
+    사람이 예상 응수를 두면(적중) 다음 요청의 세대 번호를 적중 값에도 기록하며, 워커는 진행 중인 탐색을
+    멈추지 않고 그때부터 제한 시간만큼만 더 탐색해 결과를 돌려줍니다. 탐색 트리를 다시 만들 필요 없이
+    미리 생각한 시간만큼의 깊이와 치환표를 그대로 이어 씁니다 (미리 생각한 탐색이 먼저 끝났으면 바로 돌려줌).
+    다른 수를 두면(실패) 세대 번호가 바뀌므로 미리 생각하던 탐색은 다음 시간 확인 때 바로 멈춥니다.
+
+사용법:
+    engine = BackgroundEngine(time_limit_ms=1000, ponder=True)
+    engine.start_search(game)
+    ...
+    result = engine.poll()  # 결과가 아직 없으면 None
+"""
+
+import multiprocessing
+import queue
+import time
+from typing import Dict, Optional, Tuple
+
+from board import Board
+from engine import AlphaBetaEngine, SearchResult, get_opponent_color
+from game import Game
+from player import StoneColor
+
+
+# 미리 생각하기 탐색의 제한 시간 (밀리초, 사실상 무제한이며 세대 번호가 바뀔 때 멈춤)
+PONDER_TIME_LIMIT_MS = 24 * 60 * 60 * 1000
+
+
+class BackgroundEngine:
+    """워커 프로세스에서 탐색하고 결과를 큐로 돌려주는 컴퓨터 플레이어"""
+    
+    def __init__(self, time_limit_ms: int = 1000, max_depth: int = 8, max_branching: int = 12,
+                 tt_size_bits: int = 18, ponder: bool = False):
+        """
+        백그라운드 엔진 초기화 (워커 프로세스는 첫 탐색 요청 때 시작)
+        
+        Args:
+            time_limit_ms (int): 한 수의 탐색 제한 시간 (밀리초)
+            max_depth (int): 최대 탐색 깊이
+            max_branching (int): 노드마다 탐색할 최대 후보 수
+            tt_size_bits (int): 치환표 크기의 로그 값
+            ponder (bool): 상대 차례에 예상 응수를 미리 탐색할지 여부
+        """
+        self.time_limit_ms = time_limit_ms
+        self.ponder = ponder
+        self._engine_options = (max_depth, max_branching, tt_size_bits)
+        self._generation = 0
+        self._pending: Optional[int] = None  # 결과를 기다리는 요청의 세대 번호
+        self._process = None
+        self._requests = None
+        self._results = None
+        self._latest = None  # 워커와 공유하는 최신 세대 번호
+        self._hit = None  # 워커와 공유하는, 미리 생각하기가 적중한 요청의 세대 번호
+        
+        # 미리 생각하는 중인 상대의 예상 응수와 그 수가 놓인 뒤의 수 개수
+        self.ponder_move: Optional[Tuple[int, int]] = None
+        self._ponder_move_count = 0
+        self._search_move_count = 0
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+    
+    @property
+    def thinking(self) -> bool:
+        """탐색 결과를 기다리는 중인지 여부"""
+        return self._pending is not None
+    
+    @property
+    def pondering(self) -> bool:
+        """상대 차례에 예상 응수를 미리 탐색하는 중인지 여부"""
+        return self.ponder_move is not None
+    
+    def start(self):
+        """
+        워커 프로세스를 시작합니다 (이미 실행 중이면 아무것도 하지 않음).
+        
+        첫 탐색 전에 미리 부르면 프로세스를 띄우는 시간이 첫 수의 생각 시간에 더해지지 않습니다.
+        """
+        if self._process is not None and self._process.is_alive():
+            return
+        # fork는 부모의 tkinter(X 서버 연결) 상태까지 복제하므로 spawn으로 새 인터프리터를 띄움
+        context = multiprocessing.get_context("spawn")
+        self._requests = context.Queue()
+        self._results = context.Queue()
+        self._latest = context.Value("q", self._generation, lock=False)
+        self._hit = context.Value("q", 0, lock=False)
+        self._process = context.Process(target=_engine_main, name="omok-engine", daemon=True,
+                                        args=(self._requests, self._results, self._latest, self._hit)
+                                        + self._engine_options)
+        self._process.start()
+    
+    def start_search(self, game: Game) -> int:
+        """
+        게임의 현재 국면에서 현재 플레이어의 수를 찾는 탐색을 요청합니다.
+        
+        기다리던 이전 요청이 있으면 취소됩니다. 미리 생각하던 예상 응수가 실제로 놓였으면
+        미리 생각하던 탐색을 이어 쓰고, 아니면 그 탐색을 멈춥니다.
+        
+        Args:
+            game (Game): 진행 중인 게임 (Board를 사용하는 게임)
+        
+        Returns:
+            int: 요청의 세대 번호
+        """
+        self.start()
+        board = game.get_board()
+        stone_color = game.get_current_player().get_stone_color()
+        
+        if self.ponder_move is not None:
+            if board.get_move_count() == self._ponder_move_count and board.get_last_move() == self.ponder_move:
+                self.ponder_hits += 1
+                # 워커가 새 세대 번호를 보기 전에 적중 여부를 먼저 기록
+                self._hit.value = self._generation + 1
+            else:
+                self.ponder_misses += 1
+            self.ponder_move = None
+        
+        generation = self._next_generation()
+        self._requests.put((generation, board.size, board.frontier_distance, board.snapshot(),
+                            stone_color.value, self.time_limit_ms, self.ponder))
+        self._pending = generation
+        self._search_move_count = board.get_move_count()
+        return generation
+    
+    def cancel(self):
+        """기다리던 탐색이나 미리 생각하기를 취소합니다 (워커는 다음 시간 확인 때 탐색을 멈춤)."""
+        if self._pending is None and self.ponder_move is None:
+            return
+        self._next_generation()
+        self._pending = None
+        self.ponder_move = None
+    
+    def _next_generation(self) -> int:
+        """세대 번호를 올리고 워커와 공유하는 값에도 기록합니다."""
+        self._generation += 1
+        if self._latest is not None:
+            self._latest.value = self._generation
+        return self._generation
+    
+    def poll(self) -> Optional[SearchResult]:
+        """
+        기다리던 탐색의 결과를 기다리지 않고 확인합니다 (취소된 요청의 결과는 버림).
+        
+        Returns:
+            Optional[SearchResult]: 탐색 결과 또는 아직 끝나지 않았으면 None
+        
+        Raises:
+            RuntimeError: 결과를 기다리는 중에 워커 프로세스가 종료된 경우
+        """
+        while self._pending is not None:
+            try:
+                generation, result, ponder_move = self._results.get_nowait()
+            except queue.Empty:
+                if not self._process.is_alive():
+                    self._pending = None
+                    raise RuntimeError(f"엔진 프로세스가 종료되었습니다 (종료 코드 {self._process.exitcode})")
+                return None
+            if generation == self._pending:
+                self._pending = None
+                # 워커는 결과를 보낸 뒤 이 예상 응수가 놓인 국면을 미리 생각하기 시작함
+                self.ponder_move = ponder_move
+                self._ponder_move_count = self._search_move_count + 2
+                return result
+        return None
+    
+    def close(self):
+        """탐색을 취소하고 워커 프로세스를 종료합니다."""
+        self.cancel()
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            self._requests.put(None)
+            self._process.join(timeout=1.0)
+            if self._process.is_alive():
+                self._process.terminate()
+        self._process = None
+
+
+def _engine_main(requests, results, latest, hit, max_depth: int, max_branching: int, tt_size_bits: int):
+    """
+    워커 프로세스의 요청 처리 루프
+    
+    엔진과 치환표는 프로세스가 살아 있는 동안 유지되므로 이전 수의 탐색 결과가 다음 탐색에도 쓰입니다.
+    
+    Args:
+        requests: (세대, 보드 크기, 프런티어 거리, 스냅숏, 돌 색상 값, 제한 시간, 미리 생각하기 여부)
+            요청 큐 (None이면 종료)
+        results: (세대, SearchResult, 예상 응수) 결과 큐
+        latest: 최신 세대 번호 공유 값
+        hit: 미리 생각하기가 적중한 요청의 세대 번호 공유 값
+        max_depth (int): 최대 탐색 깊이
+        max_branching (int): 노드마다 탐색할 최대 후보 수
+        tt_size_bits (int): 치환표 크기의 로그 값
+    """
+    engine = AlphaBetaEngine(max_depth, max_branching, tt_size_bits)
+    boards: Dict[Tuple[int, int], Board] = {}
+    answered = 0  # 미리 생각하던 탐색으로 이미 답한 요청의 세대 번호
+    pondered: Optional[Tuple[int, SearchResult]] = None  # 적중 전에 끝난 미리 생각하기의 (국면 해시, 결과)
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        generation, size, frontier_distance, snapshot, color_value, time_limit_ms, ponder = request
+        if latest.value != generation or generation == answered:
+            continue  # 꺼내기 전에 이미 취소되었거나 미리 생각하던 탐색으로 답한 요청
+        
+        board = boards.get((size, frontier_distance))
+        if board is None:
+            board = boards[(size, frontier_distance)] = Board(size, frontier_distance)
+        board.restore(snapshot)
+        stone_color = StoneColor(color_value)
+        
+        if pondered is not None and pondered[0] == board.zobrist_hash:
+            result = pondered[1]  # 사람이 생각하는 동안 이미 끝까지 탐색한 국면
+        else:
+            result = engine.search(board, stone_color, time_limit_ms, lambda: latest.value != generation)
+        pondered = None
+        
+        while result is not None and latest.value == generation:
+            move = result.move
+            ponder_move = engine.predict_reply(board, stone_color, move) if ponder and move else None
+            results.put((generation, result, ponder_move))
+            if ponder_move is None:
+                break
+            
+            # 내 수와 상대의 예상 응수를 둔 국면을 세대 번호가 바뀔 때까지 탐색
+            board.place_stone(move[0], move[1], stone_color)
+            board.place_stone(ponder_move[0], ponder_move[1], get_opponent_color(stone_color))
+            result, hit_generation = _ponder(engine, board, stone_color, time_limit_ms, latest, hit, generation)
+            if hit_generation is not None:
+                # 적중: 이어서 탐색한 결과로 답하고 다음 예상 응수를 다시 미리 생각함
+                generation = answered = hit_generation
+            elif result is not None:
+                # 적중 전에 끝까지 탐색함: 적중 요청이 오면 바로 답함
+                pondered = (board.zobrist_hash, result)
+                result = None
+
+
+def _ponder(engine: AlphaBetaEngine, board: Board, stone_color: StoneColor, time_limit_ms: int,
+            latest, hit, generation: int) -> Tuple[Optional[SearchResult], Optional[int]]:
+    """
+    상대 차례에 예상 응수를 둔 국면을 미리 탐색합니다.
+    
+    세대 번호가 바뀌면 적중 값을 확인해, 적중이면 그때부터 time_limit_ms만큼 더 탐색하고
+    아니면 바로 멈춥니다.
+    
+    Returns:
+        Tuple[Optional[SearchResult], Optional[int]]: 적중하면 (탐색 결과, 적중한 요청의 세대 번호),
+            적중 전에 끝까지 탐색했으면 (탐색 결과, None), 실패나 취소로 멈췄으면 (None, None)
+    """
+    state = {"generation": generation, "deadline": None, "stopped": False}
+    
+    def should_stop() -> bool:
+        current = latest.value
+        if state["deadline"] is None:
+            if current == generation:
+                return False
+            if hit.value != current:
+                state["stopped"] = True  # 실패 또는 취소
+                return True
+            state["generation"] = current
+            state["deadline"] = time.perf_counter() + time_limit_ms / 1000.0
+        return current != state["generation"] or time.perf_counter() > state["deadline"]
+    
+    result = engine.search(board, stone_color, PONDER_TIME_LIMIT_MS, should_stop)
+    if state["stopped"]:
+        return None, None
+    if state["deadline"] is None:
+        return result, None
+    if latest.value != state["generation"]:
+        return None, None  # 적중 뒤 다시 취소됨
+    return result, state["generation"]
\ No newline at end of file
@@ -0,0 +1,358 @@
+"""
+NumPy 일괄 평가기
+여러 보드를 (N, size, size) int8 배열로 쌓아 한 번에 평가합니다.
+보드마다 파이썬 루프를 돌지 않고 슬라이딩 윈도우 연산으로 패턴 수, 점수, 칸별 위협도와
+모든 빈칸의 렌주 금수(삼삼, 사사, 장목)를 계산합니다.
+
+배열 값: 0 빈칸, 1 흑돌, 2 백돌
+"""
+
+from typing import Iterable, Iterator, List
+
+import numpy as np
+
+import renju
+from board import Board, DIRECTIONS, LineShape, WINDOW_RADIUS
+from engine import SHAPE_SCORES
+from player import StoneColor
+
+
+EMPTY = 0
+BLACK = 1
+WHITE = 2
+_BLOCKED = 3  # 보드 밖 패딩 값
+
+# 패턴 이름 (BatchEvaluation.counts의 마지막 축 순서)
+PATTERN_NAMES = ("five", "open_four", "four", "open_three")
+
+# 패턴별 점수 (엔진의 줄 모양 점수와 같은 값)
+PATTERN_WEIGHTS = np.array([
+    SHAPE_SCORES[LineShape.FIVE],
+    SHAPE_SCORES[LineShape.OPEN_FOUR],
+    SHAPE_SCORES[LineShape.FOUR],
+    SHAPE_SCORES[LineShape.OPEN_THREE],
+], dtype=np.int64)
+
+_STONE_VALUES = {None: EMPTY, StoneColor.BLACK: BLACK, StoneColor.WHITE: WHITE}
+
+_WINDOW_LENGTH = 2 * WINDOW_RADIUS + 1
+_SHAPE_SCORE_TABLE = np.array([SHAPE_SCORES[shape] for shape in range(LineShape.FIVE + 1)], dtype=np.int32)
+_shape_table = None
+_renju_table = None
+
+
+class BatchEvaluation:
+    """일괄 평가 결과를 나타내는 클래스"""
+    
+    def __init__(self, counts: np.ndarray, scores: np.ndarray, threat_maps: np.ndarray):
+        """
+        평가 결과 초기화
+        
+        Args:
+            counts (np.ndarray): (N, 2, 4) 색상별(흑, 백) 패턴 수, 마지막 축은 PATTERN_NAMES 순서
+            scores (np.ndarray): (N,) 흑 기준 점수 (양수면 흑 우세)
+            threat_maps (np.ndarray): (N, 2, size, size) 색상별로 빈칸에 두었을 때의 위협 점수
+        """
+        self.counts = counts
+        self.scores = scores
+        self.threat_maps = threat_maps
+
+
+class ForbiddenMaps:
+    """일괄 금수 판정 결과를 나타내는 클래스"""
+    
+    def __init__(self, double_three: np.ndarray, double_four: np.ndarray, overline: np.ndarray):
+        """
+        금수 판정 결과 초기화
+        
+        Args:
+            double_three (np.ndarray): (N, size, size) 삼삼 칸
+            double_four (np.ndarray): (N, size, size) 사사 칸
+            overline (np.ndarray): (N, size, size) 장목 칸
+        """
+        self.double_three = double_three
+        self.double_four = double_four
+        self.overline = overline
+    
+    @property
+    def forbidden(self) -> np.ndarray:
+        """종류와 관계없이 금수인 칸을 반환합니다."""
+        return self.double_three | self.double_four | self.overline
+
+
+def board_to_array(board: Board) -> np.ndarray:
+    """
+    Board.get_board_state() 결과를 (size, size) int8 배열로 변환합니다.
+    
+    Args:
+        board (Board): 변환할 보드
+    
+    Returns:
+        np.ndarray: 보드 배열
+    """
+    state = board.get_board_state()
+    return np.array([[_STONE_VALUES[cell] for cell in row] for row in state], dtype=np.int8)
+
+
+def stack_boards(boards: Iterable[Board]) -> np.ndarray:
+    """
+    여러 보드를 (N, size, size) int8 배열로 쌓습니다.
+    
+    Args:
+        boards (Iterable[Board]): 같은 크기의 보드들
+    
+    Returns:
+        np.ndarray: 쌓인 보드 배열
+    """
+    return np.stack([board_to_array(board) for board in boards])
+
+
+def evaluate_batch(states: np.ndarray) -> BatchEvaluation:
+    """
+    보드 묶음의 패턴 수, 점수, 칸별 위협도를 계산합니다.
+    
+    패턴 정의 (0: 빈칸, 1: 자기 돌):
+        five: 11111
+        open_four: 011110
+        four: 자기 돌 4개와 빈칸 1개로 된 5칸 구간 중 열린 사에 속하지 않는 것
+        open_three: 01110, 011010, 010110
+    
+    Args:
+        states (np.ndarray): (N, size, size) 보드 배열
+    
+    Returns:
+        BatchEvaluation: 평가 결과
+    """
+    states = np.asarray(states, dtype=np.int8)
+    if states.ndim == 2:
+        states = states[np.newaxis]
+    
+    counts = np.stack([_count_patterns(states, BLACK), _count_patterns(states, WHITE)], axis=1)
+    weighted = counts.astype(np.int64) @ PATTERN_WEIGHTS
+    scores = weighted[:, 0] - weighted[:, 1]
+    
+    threat_maps = np.stack([_threat_map(states, BLACK), _threat_map(states, WHITE)], axis=1)
+    return BatchEvaluation(counts, scores, threat_maps)
+
+
+def _window_slices(shape: tuple, dr: int, dc: int, length: int) -> List[tuple]:
+    """
+    한 방향의 모든 length칸 구간에 대해 칸 위치별 인덱스(슬라이스 튜플) 목록을 반환합니다.
+    
+    Args:
+        shape (tuple): 패딩된 보드 배열의 (N, H, W) 모양
+        dr (int): 행 방향
+        dc (int): 열 방향 (-1, 0, 1)
+        length (int): 구간 길이
+    
+    Returns:
+        List[tuple]: k번째 원소로 배열을 자르면 각 구간의 k번째 칸 값 (모두 같은 모양)
+    """
+    _, height, width = shape
+    span = length - 1
+    rows = height - span * dr
+    cols = width - span * abs(dc)
+    col_start = span if dc < 0 else 0
+    return [
+        (slice(None), slice(k * dr, k * dr + rows), slice(col_start + k * dc, col_start + k * dc + cols))
+        for k in range(length)
+    ]
+
+
+def _match(cells: List[np.ndarray], pattern: str, color: int) -> np.ndarray:
+    """구간 칸 배열들이 패턴("0": 빈칸, "1": 자기 돌)과 일치하는지 반환합니다."""
+    matched = None
+    for cell, symbol in zip(cells, pattern):
+        condition = cell == (color if symbol == "1" else EMPTY)
+        matched = condition if matched is None else matched & condition
+    return matched
+
+
+def _cover(shape: tuple, slices: List[tuple], matched: np.ndarray) -> np.ndarray:
+    """matched인 구간에 속한 칸을 True로 표시한 (N, H, W) 배열을 반환합니다."""
+    covered = np.zeros(shape, dtype=bool)
+    for index in slices:
+        covered[index] |= matched
+    return covered
+
+
+def _overlaps(covered: np.ndarray, slices: List[tuple], owned: list) -> np.ndarray:
+    """구간마다 자기 돌 자리(owned의 k번째가 참인 칸) 중 covered에 속한 칸이 있는지 반환합니다."""
+    result = np.zeros(covered[slices[0]].shape, dtype=bool)
+    for index, own in zip(slices, owned):
+        if own is not False:
+            result |= covered[index] & own
+    return result
+
+
+def _count_patterns(states: np.ndarray, color: int) -> np.ndarray:
+    """
+    (N, 4) 패턴 수를 계산합니다.
+    
+    한 줄의 돌은 가장 강한 패턴 하나로만 셉니다. 5목에 걸친 4+1 구간(XXXXX 옆의 .XXXX)은 사가 아니고,
+    돌이 이미 5목이나 사에 속한 열린 삼(X.XXX.X 가운데의 .XXX.)도 세지 않습니다.
+    """
+    padded = np.pad(states, ((0, 0), (1, 1), (1, 1)), constant_values=_BLOCKED)
+    counts = np.zeros((states.shape[0], len(PATTERN_NAMES)), dtype=np.int32)
+    three_patterns = (("01110", 5), ("011010", 6), ("010110", 6))
+    
+    for dr, dc in DIRECTIONS:
+        slices = {length: _window_slices(padded.shape, dr, dc, length) for length in (5, 6)}
+        cells = {length: [padded[index] for index in slices[length]] for length in (5, 6)}
+        
+        own_cells = [cell == color for cell in cells[5]]
+        own = sum(cell.astype(np.int8) for cell in own_cells)
+        empty = sum((cell == EMPTY).astype(np.int8) for cell in cells[5])
+        five_windows = own == 5
+        five_cover = _cover(padded.shape, slices[5], five_windows)
+        four_windows = (own == 4) & (empty == 1) & ~_overlaps(five_cover, slices[5], own_cells)
+        open_fours = _match(cells[6], "011110", color).sum(axis=(1, 2))
+        
+        taken = five_cover | _cover(padded.shape, slices[5], four_windows)
+        open_threes = 0
+        for pattern, length in three_patterns:
+            matched = _match(cells[length], pattern, color)
+            matched &= ~_overlaps(taken, slices[length], [symbol == "1" for symbol in pattern])
+            open_threes += matched.sum(axis=(1, 2))
+        
+        counts[:, 0] += five_windows.sum(axis=(1, 2))
+        counts[:, 1] += open_fours
+        # 열린 사(.XXXX.)는 4+1 구간 두 개에 포함되므로 빼줌
+        counts[:, 2] += four_windows.sum(axis=(1, 2)) - 2 * open_fours
+        counts[:, 3] += open_threes
+    return counts
+
+
+def _threat_map(states: np.ndarray, color: int) -> np.ndarray:
+    """
+    (N, size, size) 칸별 위협 점수를 계산합니다.
+    
+    빈칸마다 color 돌을 놓았다고 보고 Board.get_line_shapes와 같은 규칙으로
+    네 방향 줄 모양을 분류한 뒤 모양 점수를 더합니다. 돌이 있는 칸은 0입니다.
+    """
+    table = _get_shape_table()
+    total = np.zeros(states.shape, dtype=np.int32)
+    for code in _window_codes(states, color):
+        total += _SHAPE_SCORE_TABLE[table[code]]
+    
+    total[states != EMPTY] = 0
+    return total
+
+
+def _window_codes(states: np.ndarray, color: int) -> Iterator[np.ndarray]:
+    """
+    방향마다 칸별 11칸 창 코드를 (N, size, size) 배열로 돌려줍니다.
+    
+    가운데 칸은 color 돌로 두고, 자기 돌 1, 빈칸 0, 상대 돌과 보드 밖 2인 3진수로 인코딩합니다
+    (Board의 줄 인덱스와 같은 코드).
+    """
+    digits = np.where(states == color, 1, np.where(states == EMPTY, 0, 2)).astype(np.int32)
+    padded = np.pad(digits, ((0, 0), (WINDOW_RADIUS, WINDOW_RADIUS), (WINDOW_RADIUS, WINDOW_RADIUS)),
+                    constant_values=2)
+    size = states.shape[1]
+    
+    for dr, dc in DIRECTIONS:
+        code = np.empty(states.shape, dtype=np.int32)
+        # 가운데 칸은 자기 돌로 두고 나머지 칸의 숫자를 더함
+        code[:] = 3 ** WINDOW_RADIUS
+        for k in range(-WINDOW_RADIUS, WINDOW_RADIUS + 1):
+            if k == 0:
+                continue
+            row = WINDOW_RADIUS + k * dr
+            col = WINDOW_RADIUS + k * dc
+            code += padded[:, row:row + size, col:col + size] * 3 ** (k + WINDOW_RADIUS)
+        yield code
+
+
+def forbidden_maps(states: np.ndarray, color: int = BLACK) -> ForbiddenMaps:
+    """
+    보드 묶음의 모든 빈칸에 대해 렌주 금수를 한 번에 판정합니다.
+    
+    Board.check_forbidden과 같은 규칙입니다. 금수는 흑에게만 있고, 5목이 되는 칸은 금수가 아니며,
+    한 칸의 금수 종류는 장목, 사사, 삼삼 순으로 하나만 표시합니다.
+    
+    Args:
+        states (np.ndarray): (N, size, size) 또는 (size, size) 보드 배열
+        color (int): 판정할 돌 색상 (BLACK 또는 WHITE, WHITE면 모두 False)
+    
+    Returns:
+        ForbiddenMaps: 금수 종류별 (N, size, size) bool 배열
+    """
+    states = np.asarray(states, dtype=np.int8)
+    if states.ndim == 2:
+        states = states[np.newaxis]
+    
+    if color != BLACK:
+        empty_map = np.zeros(states.shape, dtype=bool)
+        return ForbiddenMaps(empty_map, empty_map.copy(), empty_map.copy())
+    
+    table = _get_renju_table()
+    fives = np.zeros(states.shape, dtype=bool)
+    overlines = np.zeros(states.shape, dtype=bool)
+    # 표 값(uint8)을 그대로 더하므로 누적기도 uint8 (네 방향 합은 사 8, 삼 4를 넘지 않음)
+    fours = np.zeros(states.shape, dtype=np.uint8)
+    threes = np.zeros(states.shape, dtype=np.uint8)
+    for code in _window_codes(states, color):
+        entries = table[code]
+        fives |= (entries & renju.FIVE) != 0
+        overlines |= (entries & renju.OVERLINE) != 0
+        fours += entries & renju.FOUR_MASK
+        threes += (entries & renju.OPEN_THREE) != 0
+    
+    candidates = (states == EMPTY) & ~fives
+    overline = candidates & overlines
+    double_four = candidates & ~overlines & (fours >= 2)
+    double_three = candidates & ~overlines & (fours < 2) & (threes >= 2)
+    return ForbiddenMaps(double_three, double_four, overline)
+
+
+def _get_renju_table() -> np.ndarray:
+    """renju 분류표를 uint8 배열로 반환합니다 (처음 호출할 때 한 번만 변환)."""
+    global _renju_table
+    if _renju_table is None:
+        _renju_table = np.frombuffer(renju.get_table(), dtype=np.uint8)
+    return _renju_table
+
+
+def _get_shape_table() -> np.ndarray:
+    """
+    모든 3진수 창 코드의 줄 모양 표를 벡터 연산으로 만들어 반환합니다.
+    
+    board._classify_window와 같은 규칙이며, 처음 호출할 때 한 번만 만듭니다.
+    """
+    global _shape_table
+    if _shape_table is not None:
+        return _shape_table
+    
+    codes = np.arange(3 ** _WINDOW_LENGTH, dtype=np.int32)
+    digits = (codes[:, np.newaxis] // 3 ** np.arange(_WINDOW_LENGTH, dtype=np.int32)) % 3
+    
+    # 가운데에서 양쪽으로 연속된 자기 돌 수
+    low = np.zeros(codes.shape, dtype=np.int32)
+    alive = np.ones(codes.shape, dtype=bool)
+    for i in range(1, WINDOW_RADIUS + 1):
+        alive &= digits[:, WINDOW_RADIUS - i] == 1
+        low += alive
+    high = np.zeros(codes.shape, dtype=np.int32)
+    alive = np.ones(codes.shape, dtype=bool)
+    for i in range(1, WINDOW_RADIUS + 1):
+        alive &= digits[:, WINDOW_RADIUS + i] == 1
+        high += alive
+    count = low + high + 1
+    
+    # 양쪽 끝 칸이 창 안에 있고 비어 있으면 열린 끝
+    rows = np.arange(codes.shape[0])
+    low_end = WINDOW_RADIUS - low - 1
+    high_end = WINDOW_RADIUS + high + 1
+    low_open = (low_end >= 0) & (digits[rows, np.clip(low_end, 0, _WINDOW_LENGTH - 1)] == 0)
+    high_open = (high_end < _WINDOW_LENGTH) & (digits[rows, np.clip(high_end, 0, _WINDOW_LENGTH - 1)] == 0)
+    open_ends = low_open.astype(np.int32) + high_open
+    
+    table = np.full(codes.shape, LineShape.NONE, dtype=np.int8)
+    for stones, closed_shape in ((2, LineShape.TWO), (3, LineShape.THREE), (4, LineShape.FOUR)):
+        table[(count == stones) & (open_ends == 1)] = closed_shape
+        table[(count == stones) & (open_ends == 2)] = closed_shape + 1
+    table[count >= 5] = LineShape.FIVE
+    
+    _shape_table = table
+    return table
\ No newline at end of file
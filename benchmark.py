@@ -0,0 +1,306 @@
+"""
+성능 벤치마크
+고정 시드로 만든 빈 보드부터 빽빽한 보드까지의 국면에서 핵심 경로의 호출 시간을 잽니다.
+결과는 JSON으로 저장하고, 저장된 기준값과 비교해 임계값 이상 느려진 항목을 표시합니다.
+
+사용법:
+    python benchmark.py --output bench.json
+    python benchmark.py --baseline bench_baseline.json --threshold 0.15
+    python benchmark.py --save-baseline bench_baseline.json
+    python benchmark.py --memory 10000 100000
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+from game import Game
+from player import StoneColor
+
+
+# 국면별 돌 수 (빈 보드 -> 빽빽한 보드)
+STONE_COUNTS = (0, 10, 40, 80, 140, 200)
+BENCHMARK_SEED = 1234
+
+# 메모리 측정에서 게임마다 둘 수
+MEMORY_MOVES_PER_GAME = 20
+
+
+def build_position(stone_count: int, seed: int = BENCHMARK_SEED) -> Game:
+    """
+    5목 없이 stone_count개의 돌이 놓인 국면을 만듭니다.
+    
+    Game.make_move로 번갈아 두므로 차례와 이동 기록이 실제 대국과 같습니다.
+    
+    Args:
+        stone_count (int): 놓을 돌 수
+        seed (int): 난수 시드
+    
+    Returns:
+        Game: 국면이 준비된 게임
+    """
+    rng = random.Random(seed + stone_count)
+    game = Game("흑", "백")
+    board = game.get_board()
+    cells = [(row, col) for row in range(board.size) for col in range(board.size)]
+    rng.shuffle(cells)
+    
+    for row, col in cells:
+        if len(board.move_history) >= stone_count:
+            break
+        stone_color = game.get_current_player().get_stone_color()
+        if board.check_win(row, col, stone_color):
+            continue
+        game.make_move(row, col)
+    return game
+
+
+def measure(function: Callable[[], int], repeat: int = 5) -> Tuple[float, int]:
+    """
+    함수를 여러 번 실행해 가장 빠른 회차의 호출당 시간을 반환합니다.
+    
+    Args:
+        function (Callable[[], int]): 실행 후 호출 횟수를 반환하는 함수
+        repeat (int): 반복 회차 수
+    
+    Returns:
+        Tuple[float, int]: (호출당 나노초, 회차당 호출 횟수)
+    """
+    best = None
+    calls = 0
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        calls = function()
+        elapsed = time.perf_counter_ns() - start
+        per_call = elapsed / max(calls, 1)
+        if best is None or per_call < best:
+            best = per_call
+    return best, calls
+
+
+def run_benchmarks(repeat: int = 5) -> Dict[str, dict]:
+    """
+    모든 벤치마크를 실행합니다.
+    
+    Args:
+        repeat (int): 항목별 반복 회차 수
+    
+    Returns:
+        Dict[str, dict]: "항목/돌수" -> {"ns_per_call", "calls"}
+    """
+    results = {}
+    
+    def record(name: str, function: Callable[[], int]):
+        ns_per_call, calls = measure(function, repeat)
+        results[name] = {"ns_per_call": round(ns_per_call, 1), "calls": calls}
+    
+    for stone_count in STONE_COUNTS:
+        game = build_position(stone_count)
+        board = game.get_board()
+        occupied = [(row, col, color) for row, col, color in board.move_history]
+        empty = board.get_available_moves()
+        colors = (StoneColor.BLACK, StoneColor.WHITE)
+        
+        def bench_check_win():
+            calls = 0
+            for row, col, color in occupied:
+                board.check_win(row, col, color)
+                calls += 1
+            for row, col in empty:
+                for color in colors:
+                    board.check_win(row, col, color)
+                    calls += 1
+            return calls
+        
+        def bench_check_double_three():
+            for row, col in empty:
+                for color in colors:
+                    board.check_double_three(row, col, color)
+            return len(empty) * 2
+        
+        def bench_check_forbidden():
+            # 회차마다 금수 캐시를 비워 렌주 표 조회 비용을 잼
+            board.clear_forbidden_cache()
+            for row, col in empty:
+                board.check_forbidden(row, col, StoneColor.BLACK)
+            return len(empty)
+        
+        def bench_check_forbidden_cached():
+            # 캐시를 채운 뒤의 조회 (마우스 이동 시 금수 확인과 같은 경우, 캐시는 기록 직전에 채움)
+            for row, col in empty:
+                board.check_forbidden(row, col, StoneColor.BLACK)
+            return len(empty)
+        
+        def bench_get_available_moves():
+            for _ in range(50):
+                board.get_available_moves()
+            return 50
+        
+        def bench_undo_last_move():
+            # 마지막 수를 무르고 다시 두는 한 쌍을 한 번의 호출로 셈
+            if not board.move_history:
+                return 0
+            for _ in range(500):
+                row, col, color = board.undo_last_move()
+                board.place_stone(row, col, color)
+            return 500
+        
+        stone_color = game.get_current_player().get_stone_color()
+        quiet_moves = [(row, col) for row, col in empty
+                       if not board.check_win(row, col, stone_color)
+                       and not board.check_forbidden(row, col, stone_color)]
+        
+        def bench_make_move():
+            # 수를 두고 무르는 한 쌍을 한 번의 호출로 셈 (승리 수와 금수는 제외)
+            for row, col in quiet_moves:
+                game.make_move(row, col)
+                game.undo_move()
+            return len(quiet_moves)
+        
+        suffix = f"/stones_{stone_count}"
+        record("check_win" + suffix, bench_check_win)
+        record("check_double_three" + suffix, bench_check_double_three)
+        record("check_forbidden" + suffix, bench_check_forbidden)
+        board.get_forbidden_points()
+        record("check_forbidden_cached" + suffix, bench_check_forbidden_cached)
+        record("get_available_moves" + suffix, bench_get_available_moves)
+        if occupied:
+            record("undo_last_move" + suffix, bench_undo_last_move)
+        if quiet_moves and not game.is_game_over():
+            record("make_move" + suffix, bench_make_move)
+    
+    def bench_random_game():
+        # 고정 시드의 무작위 대국 한 판 전체
+        rng = random.Random(BENCHMARK_SEED)
+        game = Game("흑", "백")
+        board = game.get_board()
+        cells = board.get_available_moves()
+        rng.shuffle(cells)
+        for row, col in cells:
+            if game.is_game_over():
+                break
+            game.make_move(row, col)
+        return 1
+    
+    record("random_game", bench_random_game)
+    return results
+
+
+def measure_memory(game_count: int, moves_per_game: int = MEMORY_MOVES_PER_GAME) -> float:
+    """
+    진행 중인 게임 game_count개를 동시에 띄웠을 때 게임 하나당 메모리를 잽니다.
+    
+    게임마다 고정 시드의 중앙 부근 수를 moves_per_game개까지 둔 뒤 tracemalloc으로 늘어난 할당량을 셉니다.
+    보드 크기별 공유 표는 측정 전에 미리 만들어 두므로 게임별로 늘어나는 양만 잡힙니다.
+    
+    Args:
+        game_count (int): 동시에 살아 있는 게임 수
+        moves_per_game (int): 게임마다 둘 수
+    
+    Returns:
+        float: 게임 하나당 바이트 수
+    """
+    rng = random.Random(BENCHMARK_SEED)
+    openings = []
+    for _ in range(64):
+        cells = [(row, col) for row in range(4, 11) for col in range(4, 11)]
+        rng.shuffle(cells)
+        openings.append(cells[:moves_per_game])
+    Game("흑", "백").make_move(7, 7)  # 공유 표와 캐시를 미리 만듦
+    
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        games = []
+        for number in range(game_count):
+            game = Game("흑", "백")
+            for row, col in openings[number % len(openings)]:
+                if game.is_game_over():
+                    break
+                game.make_move(row, col)
+            games.append(game)
+        used = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return used / game_count
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[Tuple[str, float]]:
+    """
+    기준값보다 threshold 비율 이상 느려진 항목을 찾습니다.
+    
+    Args:
+        results (Dict[str, dict]): 현재 결과
+        baseline (Dict[str, dict]): 기준 결과
+        threshold (float): 허용 비율 (0.1이면 10%)
+    
+    Returns:
+        List[Tuple[str, float]]: (항목, 현재/기준 비율) 목록
+    """
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if not reference or not reference["ns_per_call"]:
+            continue
+        ratio = current["ns_per_call"] / reference["ns_per_call"]
+        if ratio > 1.0 + threshold:
+            regressions.append((name, ratio))
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 진입점 (느려진 항목이 있으면 1을 반환)"""
+    parser = argparse.ArgumentParser(description="오목 핵심 경로 벤치마크")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 기준 JSON 파일 경로")
+    parser.add_argument("--save-baseline", help="결과를 기준 파일로 저장할 경로")
+    parser.add_argument("--threshold", type=float, default=0.10, help="느려짐 허용 비율 (기본값: 0.10)")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 회차 수")
+    parser.add_argument("--memory", type=int, nargs="+", metavar="GAMES",
+                        help="시간 대신 동시 게임 수별 게임당 메모리를 잼 (예: 10000 100000)")
+    args = parser.parse_args(argv)
+    
+    if args.memory:
+        for game_count in args.memory:
+            print(f"동시 게임 {game_count:>9,}개: 게임당 {measure_memory(game_count):>9,.0f} 바이트")
+        return 0
+    
+    results = run_benchmarks(args.repeat)
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "seed": BENCHMARK_SEED,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    
+    for name, value in results.items():
+        print(f"{name:<36} {value['ns_per_call']:>14,.1f} ns/호출")
+    
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as output:
+                json.dump(report, output, ensure_ascii=False, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n기준값 대비 {args.threshold:.0%} 이상 느려진 항목:")
+            for name, ratio in regressions:
+                print(f"  {name}: {ratio:.2f}배")
+            return 1
+        print(f"\n기준값 대비 {args.threshold:.0%} 이상 느려진 항목이 없습니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -3,24 +3,275 @@
 오목 게임의 보드 상태를 관리하고 승리 조건을 확인합니다.
 """
 
-from typing import Optional, Tuple, List
+import random
+import struct
+from array import array
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, List
 from player import StoneColor
+from renju import OPEN_THREE, forbidden_type, get_table
+
+
+# 비트보드 색상 인덱스 (흑: 0, 백: 1)와 그 역변환
+_COLOR_INDEX = {StoneColor.BLACK: 0, StoneColor.WHITE: 1}
+_STONE_COLORS = (StoneColor.BLACK, StoneColor.WHITE)
+
+# 바이트 값별로 켜진 비트 위치 (비트마스크를 칸 목록으로 풀 때 사용)
+_BIT_POSITIONS = tuple(tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256))
+
+# 방향 목록: 가로, 세로, 대각선 (우하향), 대각선 (좌하향)
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))
+
+# 줄 인덱스 설정
+# 각 줄은 3진수로 인코딩됩니다 (0: 빈칸, 1: 자기 돌, 2: 상대 돌 또는 보드 밖).
+# 줄 양끝에 WINDOW_RADIUS 칸씩 "보드 밖" 패딩을 두어 창을 자를 때 경계 검사가 필요 없습니다.
+WINDOW_RADIUS = 5
+WINDOW_SPAN = 3 ** (2 * WINDOW_RADIUS + 1)
+_CENTER = 3 ** WINDOW_RADIUS
+
+# 금수 판정 캐시에 없는 칸을 나타내는 표시값
+_UNKNOWN = object()
+
+# 조브리스트 키 생성 시드 (고정값이어야 저장된 해시가 실행마다 같음)
+_ZOBRIST_SEED = 20250728
+
+# 스냅숏 머리말: 보드 크기, 프런티어 거리, 이동 수, 조브리스트 해시
+_SNAPSHOT_HEADER = struct.Struct("<HHIQ")
+
+
+class LineShape:
+    """한 방향 줄 모양을 정의하는 열거형 (값이 클수록 강한 모양)"""
+    NONE = 0
+    TWO = 1
+    OPEN_TWO = 2
+    THREE = 3
+    OPEN_THREE = 4
+    FOUR = 5
+    OPEN_FOUR = 6
+    FIVE = 7
+
+
+# 창 코드 -> 줄 모양 캐시 (처음 조회될 때 한 번만 계산)
+_SHAPE_CACHE = {}
+
+
+def _classify_window(window: int) -> int:
+    """
+    창 코드의 가운데 돌을 지나는 연속된 돌의 모양을 분류합니다.
+    
+    Args:
+        window (int): 가운데 칸이 자기 돌인 3진수 창 코드
+    
+    Returns:
+        int: LineShape 값
+    """
+    digits = [(window // 3 ** i) % 3 for i in range(2 * WINDOW_RADIUS + 1)]
+    
+    # 가운데에서 양쪽으로 연속된 자기 돌 세기
+    low = WINDOW_RADIUS
+    while low > 0 and digits[low - 1] == 1:
+        low -= 1
+    high = WINDOW_RADIUS
+    while high < 2 * WINDOW_RADIUS and digits[high + 1] == 1:
+        high += 1
+    
+    count = high - low + 1
+    if count >= 5:
+        shape = LineShape.FIVE
+    elif count <= 1:
+        shape = LineShape.NONE
+    else:
+        # 양쪽 끝 칸이 비어 있는지 확인 (열린 모양)
+        open_ends = (low > 0 and digits[low - 1] == 0) + \
+                    (high < 2 * WINDOW_RADIUS and digits[high + 1] == 0)
+        if open_ends == 0:
+            shape = LineShape.NONE
+        else:
+            shape = {2: LineShape.TWO, 3: LineShape.THREE, 4: LineShape.FOUR}[count]
+            if open_ends == 2:
+                shape += 1
+    
+    _SHAPE_CACHE[window] = shape
+    return shape
+
+
+class _BoardGeometry:
+    """
+    보드 크기별로 한 번만 계산하는 비트보드 및 줄 인덱스 기하 정보
+    
+    각 행 끝에 항상 비어 있는 패딩 열을 하나 두어(행 폭 = size + 1)
+    가로/대각선 시프트가 다음 행으로 넘어가지 않도록 합니다.
+    """
+    
+    def __init__(self, size: int):
+        """
+        기하 정보 계산
+        
+        Args:
+            size (int): 보드 크기
+        """
+        self.width = width = size + 1
+        
+        # 조브리스트 키: 칸별 (흑, 백) 64비트 난수와 차례 키
+        self.side_key, cell_keys = zobrist_table(size)
+        self.zobrist_keys = [None] * (size * width)
+        
+        # 줄 목록: 가로 size개, 세로 size개, 대각선 2 * size - 1개씩
+        line_lengths = [size] * (2 * size)
+        line_lengths += [size - abs(d - (size - 1)) for d in range(2 * size - 1)]
+        line_lengths += [size - abs(s - (size - 1)) for s in range(2 * size - 1)]
+        
+        # 빈 줄의 초기 코드 (양끝 패딩만 "보드 밖"으로 채움)
+        self.empty_lines = []
+        for length in line_lengths:
+            code = 0
+            for i in list(range(WINDOW_RADIUS)) + list(range(length + WINDOW_RADIUS, length + 2 * WINDOW_RADIUS)):
+                code += 2 * 3 ** i
+            self.empty_lines.append(code)
+        
+        # 비트 인덱스별 정보 (패딩 열은 None)
+        self.win_windows = [None] * (size * width)
+        self.cell_lines = [None] * (size * width)
+        self.window_cells = [None] * (size * width)
+        self.cells = [None] * (size * width)  # 비트 인덱스 -> (행, 열)
+        
+        # 줄 코드가 64비트 정수에 들어가면 array('q')로 압축해 저장 (가장 긴 줄의 자릿수 = size + 2 * WINDOW_RADIUS)
+        self.line_typecode = "q" if 3 ** (size + 2 * WINDOW_RADIUS) < 2 ** 63 else None
+        # 이동 기록 한 칸의 부호 (비트 인덱스 * 2 + 색상)가 16비트에 들어가면 array('H')
+        self.move_typecode = "H" if size * width * 2 <= 0xFFFF else "L"
+        # 스냅숏에서 비트마스크 하나와 줄 코드 하나가 차지하는 바이트 수 (3진수 한 자리는 2비트 이내)
+        self.mask_bytes = (size * width + 7) // 8
+        # 패딩 열을 뺀 보드 안 칸 전체의 비트마스크 (프런티어 팽창이 다음 행으로 넘어가지 않게 자름)
+        self.board_mask = sum(((1 << size) - 1) << (row * width) for row in range(size))
+        self.line_bytes = 8 if self.line_typecode else ((size + 2 * WINDOW_RADIUS) * 2 + 7) // 8
+        for row in range(size):
+            for col in range(size):
+                index = row * width + col
+                self.cells[index] = (row, col)
+                self.zobrist_keys[index] = cell_keys[row * size + col]
+                
+                # 이 칸을 포함하는 보드 안 5칸 구간들의 비트마스크 (네 방향 모두)
+                windows = []
+                for dr, dc in DIRECTIONS:
+                    for k in range(5):
+                        r, c = row - k * dr, col - k * dc
+                        end_r, end_c = r + 4 * dr, c + 4 * dc
+                        if 0 <= r < size and 0 <= c < size and 0 <= end_r < size and 0 <= end_c < size:
+                            windows.append(sum(1 << ((r + j * dr) * width + c + j * dc) for j in range(5)))
+                self.win_windows[index] = tuple(windows)
+                
+                # 이 칸을 지나는 네 줄의 (줄 번호, 칸 가중치, 창 나눗수)
+                diagonal = col - row + size - 1
+                anti_diagonal = row + col
+                placements = (
+                    (row, col),
+                    (size + col, row),
+                    (2 * size + diagonal, min(row, col)),
+                    (4 * size - 1 + anti_diagonal, row - max(0, anti_diagonal - (size - 1))),
+                )
+                self.cell_lines[index] = tuple(
+                    (line, 3 ** (position + WINDOW_RADIUS), 3 ** position)
+                    for line, position in placements
+                )
+                
+                # 이 칸에 돌을 놓거나 무르면 창이 바뀌는 칸들 (네 방향 WINDOW_RADIUS 이내, 자기 자신 포함)
+                cells = {index}
+                for dr, dc in DIRECTIONS:
+                    for k in range(-WINDOW_RADIUS, WINDOW_RADIUS + 1):
+                        r, c = row + k * dr, col + k * dc
+                        if 0 <= r < size and 0 <= c < size:
+                            cells.add(r * width + c)
+                self.window_cells[index] = tuple(cells)
+        
+        # 비트마스크의 바이트 번호와 바이트 값 -> 그 바이트에서 켜진 칸들의 (행, 열) 튜플
+        self.byte_cells = tuple(
+            tuple(tuple(self.cells[base * 8 + bit] for bit in _BIT_POSITIONS[value] if base * 8 + bit < size * width) for value in range(256))
+            for base in range((size * width + 7) // 8)
+        )
+
+
+@lru_cache(maxsize=None)
+def zobrist_table(size: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """
+    보드 크기별 조브리스트 키 표를 반환합니다.
+    
+    같은 크기면 Board와 SparseBoard가 같은 표를 쓰므로 같은 배치의 해시가 같습니다.
+    
+    Args:
+        size (int): 보드 크기
+    
+    Returns:
+        Tuple[int, List[Tuple[int, int]]]: (차례 키, 칸 번호 row * size + col별 (흑, 백) 키)
+    """
+    rng = random.Random(_ZOBRIST_SEED + size)
+    side_key = rng.getrandbits(64)
+    return side_key, [(rng.getrandbits(64), rng.getrandbits(64)) for _ in range(size * size)]
+
+
+@lru_cache(maxsize=None)
+def _board_geometry(size: int) -> _BoardGeometry:
+    """보드 크기별 기하 정보를 반환합니다."""
+    return _BoardGeometry(size)
+
+
+class MoveHistory:
+    """
+    Board의 이동 기록을 (행, 열, 돌 색상) 튜플의 시퀀스로 보여주는 읽기 전용 뷰
+    
+    기록은 보드 안에 칸마다 정수 하나(비트 인덱스 * 2 + 색상)인 array로 저장되며,
+    이 뷰는 복사 없이 필요한 항목만 튜플로 풀어 줍니다.
+    """
+    
+    __slots__ = ("_moves", "_width")
+    
+    def __init__(self, moves: array, width: int):
+        self._moves = moves
+        self._width = width
+    
+    def __len__(self) -> int:
+        return len(self._moves)
+    
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self._decode(code) for code in self._moves[position]]
+        return self._decode(self._moves[position])
+    
+    def __iter__(self):
+        for code in self._moves:
+            yield self._decode(code)
+    
+    def __eq__(self, other) -> bool:
+        return list(self) == list(other)
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+    
+    def _decode(self, code: int) -> Tuple[int, int, StoneColor]:
+        row, col = divmod(code >> 1, self._width)
+        return row, col, _STONE_COLORS[code & 1]
 
 
 class Board:
     """오목 게임의 보드를 나타내는 클래스"""
     
-    def __init__(self, size: int = 15):
+    # 인스턴스 딕셔너리 없이 압축된 상태만 보관 (대국 수만 개를 동시에 띄울 때의 메모리 절약)
+    __slots__ = ("size", "frontier_distance", "_geometry", "_width",
+                 "_bitboards", "_occupied", "_line_codes", "_hash", "_empty_count",
+                 "_frontier", "_forbidden_cache", "_moves")
+    
+    def __init__(self, size: int = 15, frontier_distance: int = 2):
         """
         보드 초기화
         
         Args:
             size (int): 보드 크기 (기본값: 15x15)
+            frontier_distance (int): 후보 수(프런티어)로 볼 돌과의 최대 거리 (기본값: 2)
         """
         self.size = size
-        self.board = [[None for _ in range(size)] for _ in range(size)]
-        self.last_move = None
-        self.move_history = []  # 무르기를 위한 이동 기록
+        self.frontier_distance = frontier_distance
+        self._geometry = _board_geometry(size)
+        self._width = self._geometry.width
+        self.reset()
     
     def is_valid_position(self, row: int, col: int) -> bool:
         """
@@ -29,7 +280,7 @@ class Board:
         Args:
             row (int): 행 인덱스
             col (int): 열 인덱스
-            
+        
         Returns:
             bool: 유효한 위치인지 여부
         """
@@ -42,13 +293,13 @@ class Board:
         Args:
             row (int): 행 인덱스
             col (int): 열 인덱스
-            
+        
         Returns:
             bool: 비어있는지 여부
         """
         if not self.is_valid_position(row, col):
             return False
-        return self.board[row][col] is None
+        return not (self._occupied >> (row * self._width + col)) & 1
     
     def place_stone(self, row: int, col: int, stone_color: StoneColor) -> bool:
         """
@@ -58,16 +309,34 @@ class Board:
             row (int): 행 인덱스
             col (int): 열 인덱스
             stone_color (StoneColor): 돌 색상
-            
+        
         Returns:
             bool: 배치 성공 여부
         """
         if not self.is_empty(row, col):
             return False
         
-        self.board[row][col] = stone_color
-        self.last_move = (row, col)
-        self.move_history.append((row, col, stone_color))  # 이동 기록 추가
+        index = row * self._width + col
+        color_index = _COLOR_INDEX[stone_color]
+        bit = 1 << index
+        self._bitboards[color_index] |= bit
+        self._occupied |= bit
+        self._hash ^= self._geometry.zobrist_keys[index][color_index]
+        
+        # 이 칸을 지나는 네 줄만 갱신
+        own_lines = self._line_codes[color_index]
+        other_lines = self._line_codes[1 - color_index]
+        for line, weight, _ in self._geometry.cell_lines[index]:
+            own_lines[line] += weight
+            other_lines[line] += 2 * weight
+        if self._forbidden_cache:
+            self._invalidate_forbidden(index)
+        
+        # 빈칸 수 갱신, 프런티어는 다음 후보 조회 때 다시 계산
+        self._empty_count -= 1
+        self._frontier = None
+        
+        self._moves.append(index << 1 | color_index)  # 이동 기록 추가
         return True
     
     def get_stone(self, row: int, col: int) -> Optional[StoneColor]:
@@ -77,73 +346,110 @@ class Board:
         Args:
             row (int): 행 인덱스
             col (int): 열 인덱스
-            
+        
         Returns:
             Optional[StoneColor]: 돌 색상 또는 None
         """
         if not self.is_valid_position(row, col):
             return None
-        return self.board[row][col]
+        return self._stone_at(row * self._width + col)
+    
+    def _stone_at(self, index: int) -> Optional[StoneColor]:
+        """비트 인덱스 위치의 돌을 반환합니다."""
+        if not (self._occupied >> index) & 1:
+            return None
+        if (self._bitboards[0] >> index) & 1:
+            return StoneColor.BLACK
+        return StoneColor.WHITE
     
     def get_last_move(self) -> Optional[Tuple[int, int]]:
         """마지막으로 놓은 돌의 위치를 반환합니다."""
         return self.last_move
     
+    @property
+    def last_move(self) -> Optional[Tuple[int, int]]:
+        """마지막으로 놓은 돌의 위치 (행, 열) 또는 None"""
+        if not self._moves:
+            return None
+        return self._geometry.cells[self._moves[-1] >> 1]
+    
+    @property
+    def move_history(self) -> MoveHistory:
+        """(행, 열, 돌 색상) 튜플 시퀀스로 본 이동 기록 (읽기 전용 뷰)"""
+        return MoveHistory(self._moves, self._width)
+    
+    def get_move_count(self) -> int:
+        """보드에 놓인 돌의 수를 반환합니다."""
+        return len(self._moves)
+    
+    @property
+    def zobrist_hash(self) -> int:
+        """
+        돌 배치의 64비트 조브리스트 해시를 반환합니다.
+        
+        돌을 놓거나 무를 때 XOR 한 번으로 갱신되므로 조회 비용이 없습니다.
+        차례 정보는 포함하지 않습니다 (Game.position_hash 참고).
+        """
+        return self._hash
+    
+    @property
+    def side_to_move_key(self) -> int:
+        """백 차례일 때 해시에 XOR 하는 키를 반환합니다."""
+        return self._geometry.side_key
+    
+    def zobrist_key(self, row: int, col: int, stone_color: StoneColor) -> int:
+        """
+        해당 위치에 놓인 돌의 조브리스트 키를 반환합니다.
+        
+        대칭 변환한 국면의 해시처럼 보드에 두지 않은 배치의 해시를 계산할 때 사용합니다.
+        """
+        return self._geometry.zobrist_keys[row * self._width + col][_COLOR_INDEX[stone_color]]
+    
     def check_win(self, row: int, col: int, stone_color: StoneColor) -> bool:
         """
         승리 조건을 확인합니다.
         
+        (row, col)에 stone_color 돌이 있다고 보고, 미리 계산한 그 칸을 지나는
+        5칸 구간 비트마스크가 모두 채워졌는지 AND 한 번씩으로 확인합니다.
+        
         Args:
             row (int): 행 인덱스
             col (int): 열 인덱스
             stone_color (StoneColor): 확인할 돌 색상
-            
+        
         Returns:
             bool: 승리 여부
         """
-        directions = [
-            (0, 1),   # 가로
-            (1, 0),   # 세로
-            (1, 1),   # 대각선 (우하향)
-            (1, -1)   # 대각선 (좌하향)
-        ]
+        index = row * self._width + col
+        stones = self._bitboards[_COLOR_INDEX[stone_color]] | (1 << index)
         
-        for dr, dc in directions:
-            if self._check_direction(row, col, dr, dc, stone_color):
+        for window in self._geometry.win_windows[index]:
+            if stones & window == window:
                 return True
         return False
     
-    def _check_direction(self, row: int, col: int, dr: int, dc: int, stone_color: StoneColor) -> bool:
+    def find_five(self, row: int, col: int, stone_color: StoneColor) -> Optional[Tuple[int, int]]:
         """
-        특정 방향으로 5목이 완성되었는지 확인합니다.
+        (row, col)을 지나는 5칸 구간 중 stone_color 돌 넷과 빈칸 하나로 된 곳의 빈칸을 찾습니다.
+        
+        check_win과 같은 구간 마스크를 쓰므로 그 칸에 두면 check_win이 참이 됩니다.
         
         Args:
-            row (int): 시작 행 인덱스
-            col (int): 시작 열 인덱스
-            dr (int): 행 방향
-            dc (int): 열 방향
+            row (int): 행 인덱스
+            col (int): 열 인덱스
             stone_color (StoneColor): 확인할 돌 색상
-            
+        
         Returns:
-            bool: 5목 완성 여부
+            Optional[Tuple[int, int]]: 5목을 완성하는 빈칸 또는 None
         """
-        count = 1  # 현재 위치 포함
-        
-        # 정방향 확인
-        r, c = row + dr, col + dc
-        while self.is_valid_position(r, c) and self.board[r][c] == stone_color:
-            count += 1
-            r += dr
-            c += dc
-        
-        # 역방향 확인
-        r, c = row - dr, col - dc
-        while self.is_valid_position(r, c) and self.board[r][c] == stone_color:
-            count += 1
-            r -= dr
-            c -= dc
-        
-        return count >= 5
+        stones = self._bitboards[_COLOR_INDEX[stone_color]]
+        occupied = self._occupied
+        for window in self._geometry.win_windows[row * self._width + col]:
+            gap = window & ~stones
+            # 구간에서 빠진 칸이 정확히 하나이고 비어 있으면 그 칸
+            if gap and not gap & (gap - 1) and not gap & occupied:
+                return self._geometry.cells[gap.bit_length() - 1]
+        return None
     
     def is_full(self) -> bool:
         """
@@ -152,121 +458,308 @@ class Board:
         Returns:
             bool: 보드가 가득 찬 여부
         """
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.board[row][col] is None:
-                    return False
-        return True
+        return self._empty_count == 0
     
     def get_available_moves(self) -> List[Tuple[int, int]]:
         """
         가능한 모든 이동을 반환합니다.
         
+        빈칸 비트마스크(보드 마스크에서 돌이 놓인 칸을 뺀 것)를 바이트 단위로 풀어 쓰므로 칸마다 시프트하지 않습니다.
+        
         Returns:
-            List[Tuple[int, int]]: 가능한 이동 목록
+            List[Tuple[int, int]]: 가능한 이동 목록 (칸 순서)
         """
+        geometry = self._geometry
+        empty = geometry.board_mask ^ self._occupied
         moves = []
-        for row in range(self.size):
-            for col in range(self.size):
-                if self.is_empty(row, col):
-                    moves.append((row, col))
+        for cells, value in zip(geometry.byte_cells, empty.to_bytes(geometry.mask_bytes, "little")):
+            if value:
+                moves += cells[value]
         return moves
     
+    def get_candidate_moves(self) -> List[Tuple[int, int]]:
+        """
+        돌에서 frontier_distance 이내에 있는 빈칸을 후보 수로 반환합니다.
+        
+        돌이 놓인 칸의 비트마스크를 가로와 세로로 frontier_distance번씩 시프트해 넓힌 프런티어를
+        바이트 단위로 풀어 쓰므로 보드를 훑지 않습니다. 프런티어는 수가 바뀐 뒤 처음 조회할 때만 계산합니다.
+        
+        Returns:
+            List[Tuple[int, int]]: 후보 수 목록 (빈 보드면 중앙 한 칸, 나머지는 칸 순서)
+        """
+        if not self._moves:
+            center = self.size // 2
+            return [(center, center)]
+        
+        frontier = self._frontier
+        if frontier is None:
+            frontier = self._frontier = self._compute_frontier()
+        moves = []
+        for cells, value in zip(self._geometry.byte_cells, frontier.to_bytes((frontier.bit_length() + 7) // 8, "little")):
+            if value:
+                moves += cells[value]
+        return moves
+    
+    def _compute_frontier(self) -> int:
+        """돌에서 체비쇼프 거리 frontier_distance 이내인 빈칸의 비트마스크를 계산합니다."""
+        board_mask = self._geometry.board_mask
+        width = self._width
+        occupied = self._occupied
+        area = occupied
+        # 패딩 열이 하나뿐이므로 한 칸씩 넓힐 때마다 보드 밖으로 나간 비트를 잘라냄
+        for _ in range(self.frontier_distance):
+            area = (area | (area << 1) | (area >> 1)) & board_mask
+        for _ in range(self.frontier_distance):
+            area = (area | (area << width) | (area >> width)) & board_mask
+        return area & ~occupied
+    
+    def get_line_shapes(self, row: int, col: int, stone_color: StoneColor) -> Tuple[int, int, int, int]:
+        """
+        해당 위치에 돌이 있다고 볼 때 네 방향의 줄 모양을 반환합니다.
+        
+        줄 인덱스에서 창을 잘라 캐시된 분류 결과를 조회하므로 보드를 다시 훑지 않습니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 확인할 돌 색상
+        
+        Returns:
+            Tuple[int, int, int, int]: DIRECTIONS 순서의 LineShape 값
+        """
+        lines = self._line_codes[_COLOR_INDEX[stone_color]]
+        shapes = []
+        for line, _, divisor in self._geometry.cell_lines[row * self._width + col]:
+            window = (lines[line] // divisor) % WINDOW_SPAN
+            # 가운데 칸을 자기 돌로 맞춤 (빈칸이면 더하고, 상대 돌이면 바꿈)
+            window += _CENTER * (1 - (window // _CENTER) % 3)
+            shape = _SHAPE_CACHE.get(window)
+            if shape is None:
+                shape = _classify_window(window)
+            shapes.append(shape)
+        return tuple(shapes)
+    
     def check_double_three(self, row: int, col: int, stone_color: StoneColor) -> bool:
         """
         해당 위치에 돌을 놓으면 쌍삼이 되는지 확인합니다.
         쌍삼: 두 개의 열린 삼을 동시에 만드는 수
         
+        열린 삼은 한 수를 더 두어 열린 사(양쪽 어디에 두어도 5목)가 되는 삼으로,
+        X.XX처럼 한 칸 띈 삼도 포함합니다. 5목이나 다른 금수와의 우선순위는 따지지 않으므로
+        흑의 착수 가능 여부는 check_forbidden으로 확인합니다.
+        
         Args:
             row (int): 행 인덱스
             col (int): 열 인덱스
             stone_color (StoneColor): 확인할 돌 색상
-            
+        
         Returns:
             bool: 쌍삼 여부
         """
-        # 임시로 돌을 놓아서 확인
         if not self.is_empty(row, col):
             return False
         
-        self.board[row][col] = stone_color
+        entries = self._renju_entries(row * self._width + col, _COLOR_INDEX[stone_color])
+        return sum(1 for entry in entries if entry & OPEN_THREE) >= 2
+    
+    def check_forbidden(self, row: int, col: int, stone_color: StoneColor) -> Optional[str]:
+        """
+        해당 위치가 렌주 규칙의 금수인지 확인합니다.
         
-        # 열린 삼 개수 확인
-        three_count = 0
-        directions = [
-            (0, 1),   # 가로
-            (1, 0),   # 세로
-            (1, 1),   # 대각선 (우하향)
-            (1, -1)   # 대각선 (좌하향)
-        ]
+        금수는 흑에게만 있으며 삼삼, 사사, 장목(6목 이상)입니다.
+        5목이 되는 수는 다른 금수 모양을 함께 만들어도 둘 수 있습니다.
+        방향마다 줄 인덱스에서 창을 잘라 미리 계산된 렌주 표를 한 번 조회합니다.
         
-        for dr, dc in directions:
-            if self._check_three(row, col, dr, dc, stone_color):
-                three_count += 1
-                if three_count >= 2:  # 쌍삼 이상
-                    # 돌 제거
-                    self.board[row][col] = None
-                    return True
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 확인할 돌 색상
         
-        # 돌 제거
-        self.board[row][col] = None
-        return False
+        Returns:
+            Optional[str]: ForbiddenType 값 또는 금수가 아니면 None
+        """
+        if stone_color != StoneColor.BLACK or not self.is_empty(row, col):
+            return None
+        
+        index = row * self._width + col
+        cache = self._forbidden_cache
+        if cache is None:
+            cache = self._forbidden_cache = {}
+        forbidden = cache.get(index, _UNKNOWN)
+        if forbidden is _UNKNOWN:
+            forbidden = forbidden_type(self._renju_entries(index, 0))
+            cache[index] = forbidden
+        return forbidden
     
-    def _check_three(self, row: int, col: int, dr: int, dc: int, stone_color: StoneColor) -> bool:
+    def get_forbidden_points(self) -> Dict[Tuple[int, int], str]:
         """
-        특정 방향으로 열린 삼이 되는지 확인합니다.
-        열린 삼: 양쪽 끝이 모두 열려있는 3개의 연속된 돌
+        흑의 모든 금수 위치를 반환합니다.
+        
+        판정 결과는 칸별로 캐시되며, 돌을 놓거나 무를 때 창이 바뀌는 칸
+        (그 돌을 지나는 네 줄에서 WINDOW_RADIUS 이내)만 무효화됩니다.
+        따라서 한 수 뒤의 재계산은 보드 전체가 아니라 수십 칸에 그칩니다.
         
-        Args:
-            row (int): 시작 행 인덱스
-            col (int): 시작 열 인덱스
-            dr (int): 행 방향
-            dc (int): 열 방향
-            stone_color (StoneColor): 확인할 돌 색상
-            
         Returns:
-            bool: 열린 삼 여부
-        """
-        # 현재 위치를 제외한 양쪽의 돌 개수 확인
-        count_forward = 0
-        count_backward = 0
-        
-        # 정방향 확인
-        r, c = row + dr, col + dc
-        while self.is_valid_position(r, c) and self.board[r][c] == stone_color:
-            count_forward += 1
-            r += dr
-            c += dc
-        
-        # 역방향 확인
-        r, c = row - dr, col - dc
-        while self.is_valid_position(r, c) and self.board[r][c] == stone_color:
-            count_backward += 1
-            r -= dr
-            c -= dc
-        
-        # 열린 삼 조건: 양쪽에 각각 1개씩 돌이 있고, 양쪽 끝이 모두 열려있어야 함
-        total_count = count_forward + count_backward
-        if total_count == 2:  # 양쪽에 1개씩 (총 3개)
-            # 양쪽 끝에 빈 공간이 있는지 확인 (열린 삼)
-            forward_empty = self.is_valid_position(row + (count_forward + 1) * dr, 
-                                                 col + (count_forward + 1) * dc) and \
-                           self.is_empty(row + (count_forward + 1) * dr, 
-                                       col + (count_forward + 1) * dc)
-            backward_empty = self.is_valid_position(row - (count_backward + 1) * dr, 
-                                                  col - (count_backward + 1) * dc) and \
-                            self.is_empty(row - (count_backward + 1) * dr, 
-                                        col - (count_backward + 1) * dc)
-            
-            return forward_empty and backward_empty
+            Dict[Tuple[int, int], str]: (행, 열) -> ForbiddenType 값
+        """
+        width = self._width
+        occupied = self._occupied
+        points = {}
+        for row in range(self.size):
+            base = row * width
+            for col in range(self.size):
+                if not (occupied >> (base + col)) & 1:
+                    forbidden = self.check_forbidden(row, col, StoneColor.BLACK)
+                    if forbidden:
+                        points[(row, col)] = forbidden
+        return points
+    
+    def clear_forbidden_cache(self):
+        """
+        금수 판정 캐시를 모두 비웁니다.
         
-        return False
+        돌을 놓거나 무를 때는 바뀐 칸만 자동으로 무효화되므로 정확성을 위해 부를 필요는 없으며,
+        캐시 없이 판정하는 비용을 잴 때 씁니다.
+        """
+        self._forbidden_cache = None
+    
+    def _invalidate_forbidden(self, index: int):
+        """index 칸의 변화로 창이 바뀐 칸들의 금수 판정 캐시를 지웁니다."""
+        cache = self._forbidden_cache
+        for cell in self._geometry.window_cells[index]:
+            cache.pop(cell, None)
+    
+    def _renju_entries(self, index: int, color_index: int) -> List[int]:
+        """빈칸 index에 돌을 놓았다고 볼 때 네 방향의 렌주 표 값을 반환합니다."""
+        table = get_table()
+        lines = self._line_codes[color_index]
+        # 빈칸이므로 가운데 자리 숫자 0에 자기 돌(1)을 더함
+        return [table[(lines[line] // divisor) % WINDOW_SPAN + _CENTER]
+                for line, _, divisor in self._geometry.cell_lines[index]]
     
     def reset(self):
         """보드를 초기화합니다."""
-        self.board = [[None for _ in range(self.size)] for _ in range(self.size)]
-        self.last_move = None
-        self.move_history = []
+        self._bitboards = [0, 0]  # 색상별 비트마스크 (흑, 백)
+        self._occupied = 0  # 돌이 놓인 칸의 비트마스크
+        # 색상별 시점의 줄 코드 (흑 시점, 백 시점)
+        typecode = self._geometry.line_typecode
+        empty_lines = self._geometry.empty_lines
+        if typecode:
+            self._line_codes = [array(typecode, empty_lines), array(typecode, empty_lines)]
+        else:
+            self._line_codes = [empty_lines[:], empty_lines[:]]
+        self._hash = 0  # 조브리스트 해시
+        self._empty_count = self.size * self.size  # 빈칸 수
+        # 돌에서 frontier_distance 이내인 빈칸의 비트마스크 (None이면 다음 후보 조회 때 계산)
+        self._frontier = 0
+        # 칸별 흑 금수 판정 캐시 (비트 인덱스 -> ForbiddenType 값 또는 None, 처음 판정할 때 만듦)
+        self._forbidden_cache = None
+        # 무르기를 위한 이동 기록 (비트 인덱스 * 2 + 색상 인덱스)
+        self._moves = array(self._geometry.move_typecode)
+    
+    def clone(self) -> "Board":
+        """
+        이동 기록, 해시, 금수 캐시까지 같은 독립된 보드를 만듭니다.
+        
+        기하 정보는 공유하고 압축된 상태만 복사하므로 수를 다시 두는 것보다 훨씬 빠릅니다.
+        
+        Returns:
+            Board: 복사된 보드
+        """
+        board = Board.__new__(Board)
+        board.size = self.size
+        board.frontier_distance = self.frontier_distance
+        board._geometry = self._geometry
+        board._width = self._width
+        board._bitboards = self._bitboards[:]
+        board._occupied = self._occupied
+        board._line_codes = [lines[:] for lines in self._line_codes]
+        board._hash = self._hash
+        board._empty_count = self._empty_count
+        board._frontier = self._frontier
+        board._forbidden_cache = dict(self._forbidden_cache) if self._forbidden_cache else None
+        board._moves = self._moves[:]
+        return board
+    
+    def snapshot(self) -> bytes:
+        """
+        현재 상태를 바이트열 하나로 저장합니다.
+        
+        비트보드, 줄 코드, 이동 기록을 한 번의 join으로 이어 붙이며 (프런티어는 복원 후 다시 계산),
+        피클 없이 프로세스 사이로 보낼 수 있습니다. 형식은 같은 버전의 restore만 읽는다고 가정합니다.
+        
+        Returns:
+            bytes: restore에 넘길 불투명한 스냅숏
+        """
+        mask_bytes = self._geometry.mask_bytes
+        parts = [
+            _SNAPSHOT_HEADER.pack(self.size, self.frontier_distance, len(self._moves), self._hash),
+            self._bitboards[0].to_bytes(mask_bytes, "little"),
+            self._bitboards[1].to_bytes(mask_bytes, "little"),
+        ]
+        if self._geometry.line_typecode:
+            parts += self._line_codes
+        else:
+            line_bytes = self._geometry.line_bytes
+            parts += [code.to_bytes(line_bytes, "little") for lines in self._line_codes for code in lines]
+        parts.append(self._moves)
+        return b"".join(parts)
+    
+    def restore(self, snapshot: bytes):
+        """
+        snapshot으로 저장한 상태로 되돌립니다.
+        
+        같은 스냅숏을 여러 번 복원할 수 있으며, 금수 캐시는 비웁니다.
+        
+        Args:
+            snapshot (bytes): 같은 크기와 프런티어 거리의 보드에서 만든 스냅숏
+        
+        Raises:
+            ValueError: 보드 설정이 다르거나 스냅숏 길이가 맞지 않는 경우
+        """
+        size, distance, move_count, zobrist_hash = _SNAPSHOT_HEADER.unpack_from(snapshot)
+        if size != self.size or distance != self.frontier_distance:
+            raise ValueError(f"스냅숏 보드 설정이 다릅니다: 크기 {size}, 프런티어 거리 {distance}")
+        
+        geometry = self._geometry
+        mask_bytes = geometry.mask_bytes
+        line_count = len(geometry.empty_lines)
+        line_size = geometry.line_bytes
+        moves = array(geometry.move_typecode)
+        expected = (_SNAPSHOT_HEADER.size + 2 * mask_bytes + 2 * line_count * line_size
+                    + move_count * moves.itemsize)
+        if len(snapshot) != expected:
+            raise ValueError(f"스냅숏 길이가 맞지 않습니다: {len(snapshot)} (예상 {expected})")
+        
+        view = memoryview(snapshot)
+        offset = _SNAPSHOT_HEADER.size
+        masks = []
+        for _ in range(2):
+            masks.append(int.from_bytes(view[offset:offset + mask_bytes], "little"))
+            offset += mask_bytes
+        black, white = masks
+        
+        line_codes = []
+        for _ in range(2):
+            end = offset + line_count * line_size
+            if geometry.line_typecode:
+                lines = array(geometry.line_typecode)
+                lines.frombytes(view[offset:end])
+            else:
+                lines = [int.from_bytes(view[start:start + line_size], "little")
+                         for start in range(offset, end, line_size)]
+            line_codes.append(lines)
+            offset = end
+        
+        self._bitboards = [black, white]
+        self._occupied = black | white
+        self._line_codes = line_codes
+        self._hash = zobrist_hash
+        self._empty_count = self.size * self.size - move_count
+        self._frontier = None
+        self._forbidden_cache = None
+        moves.frombytes(view[offset:])
+        self._moves = moves
     
     def undo_last_move(self) -> Optional[Tuple[int, int, StoneColor]]:
         """
@@ -275,30 +768,42 @@ class Board:
         Returns:
             Optional[Tuple[int, int, StoneColor]]: 되돌린 이동 정보 (행, 열, 돌색상) 또는 None
         """
-        if not self.move_history:
+        if not self._moves:
             return None
         
-        last_move_info = self.move_history.pop()
-        row, col, stone_color = last_move_info
-        self.board[row][col] = None
+        code = self._moves.pop()
+        index = code >> 1
+        color_index = code & 1
+        row, col = self._geometry.cells[index]
+        bit = 1 << index
+        self._bitboards[color_index] &= ~bit
+        self._occupied &= ~bit
+        self._hash ^= self._geometry.zobrist_keys[index][color_index]
         
-        # last_move 업데이트
-        if self.move_history:
-            self.last_move = (self.move_history[-1][0], self.move_history[-1][1])
-        else:
-            self.last_move = None
+        own_lines = self._line_codes[color_index]
+        other_lines = self._line_codes[1 - color_index]
+        for line, weight, _ in self._geometry.cell_lines[index]:
+            own_lines[line] -= weight
+            other_lines[line] -= 2 * weight
+        if self._forbidden_cache:
+            self._invalidate_forbidden(index)
+        
+        # 빈칸 수 복원, 프런티어는 다음 후보 조회 때 다시 계산
+        self._empty_count += 1
+        self._frontier = None
         
-        return last_move_info
-        self.move_history = []  # 무르기를 위한 이동 기록
+        return row, col, _STONE_COLORS[color_index]
     
     def get_board_state(self) -> List[List[Optional[StoneColor]]]:
         """현재 보드 상태를 반환합니다."""
-        return [row[:] for row in self.board]
+        width = self._width
+        return [[self._stone_at(row * width + col) for col in range(self.size)]
+                for row in range(self.size)]
     
     def __str__(self) -> str:
         """보드 상태를 문자열로 반환합니다."""
         result = []
-        for row in self.board:
+        for row in self.get_board_state():
             row_str = []
             for cell in row:
                 if cell is None:
@@ -0,0 +1,158 @@
+"""
+오목판 캔버스 렌더러
+캔버스 항목을 태그로 층을 나눠 관리합니다.
+격자선과 화점은 한 번만 그리는 고정 층(grid)에 두고, 돌은 칸별로 항목 번호를 기록해 두는 돌 층(stone)에,
+강조 표시와 금수 표시는 가장 위의 덧그림 층(overlay)에 둡니다.
+
+무르기는 돌 하나의 항목만, 새 게임은 돌 층과 덧그림 층만 지우므로 보드 크기와 관계없이 O(1)이며
+격자를 다시 그리지 않습니다.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from player import StoneColor
+from stone_sprites import StoneSprites
+
+
+class CanvasLayer:
+    """캔버스 층 태그를 정의하는 열거형 (아래에서 위 순서)"""
+    GRID = "grid"
+    STONE = "stone"
+    OVERLAY = "overlay"
+    HOVER = "hover"  # 마우스 호버 표시 (새 게임에서도 지우지 않고 숨기기만 함)
+
+
+class BoardRenderer:
+    """tkinter 캔버스에 오목판과 돌을 그리는 클래스"""
+    
+    def __init__(self, canvas, board_size: int, cell_size: int, stone_radius: int):
+        """
+        렌더러 초기화
+        
+        Args:
+            canvas (tk.Canvas): 그릴 캔버스
+            board_size (int): 보드 크기
+            cell_size (int): 칸 간격 (픽셀)
+            stone_radius (int): 돌 반지름 (픽셀)
+        """
+        self.canvas = canvas
+        self.board_size = board_size
+        self.cell_size = cell_size
+        self.stone_radius = stone_radius
+        self.sprites = StoneSprites(canvas)
+        self._stone_items: Dict[Tuple[int, int], Tuple[int, ...]] = {}  # (행, 열) -> 돌의 캔버스 항목 번호들
+        self._static_drawn = False
+    
+    def to_canvas(self, row: int, col: int) -> Tuple[int, int]:
+        """보드 좌표를 캔버스 좌표로 변환합니다."""
+        return (col + 1) * self.cell_size, (row + 1) * self.cell_size
+    
+    def to_cell(self, x: float, y: float) -> Optional[Tuple[int, int]]:
+        """
+        캔버스 좌표에서 가장 가까운 교차점을 반환합니다.
+        
+        Returns:
+            Optional[Tuple[int, int]]: (행, 열) 또는 보드 밖이면 None
+        """
+        col = round((x - self.cell_size) / self.cell_size)
+        row = round((y - self.cell_size) / self.cell_size)
+        if 0 <= row < self.board_size and 0 <= col < self.board_size:
+            return row, col
+        return None
+    
+    def draw_static(self):
+        """격자선, 화점, 입체 효과를 고정 층에 그립니다 (처음 한 번만 그림)."""
+        if self._static_drawn:
+            return
+        self._static_drawn = True
+        
+        canvas = self.canvas
+        cell = self.cell_size
+        width = int(canvas.cget("width"))
+        height = int(canvas.cget("height"))
+        tags = (CanvasLayer.GRID,)
+        
+        # 오목판 가장자리 그림자
+        canvas.create_rectangle(5, 5, width - 5, height - 5, outline="#654321", width=3, tags=tags)
+        
+        for i in range(self.board_size + 1):
+            x = (i + 1) * cell
+            # 격자선 (세로, 가로)과 미묘한 그림자 효과
+            canvas.create_line(x, cell, x, height - cell, fill="#000000", width=2, tags=tags)
+            canvas.create_line(cell, x, width - cell, x, fill="#000000", width=2, tags=tags)
+            canvas.create_line(x + 1, cell, x + 1, height - cell, fill="#8b4513", width=1, tags=tags)
+            canvas.create_line(cell, x + 1, width - cell, x + 1, fill="#8b4513", width=1, tags=tags)
+        
+        # 화점
+        star_points = [3, 7, 11]
+        for i in star_points:
+            for j in star_points:
+                x, y = (i + 1) * cell, (j + 1) * cell
+                canvas.create_oval(x - 4, y - 4, x + 4, y + 4, fill="#000000", outline="#000000", tags=tags)
+        canvas.tag_lower(CanvasLayer.GRID)
+    
+    def draw_stone(self, row: int, col: int, stone_color: StoneColor):
+        """
+        돌 층에 돌을 그리고 칸별 항목 번호를 기록합니다 (이미 그려진 칸이면 다시 그림).
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 돌 색상
+        """
+        self.remove_stone(row, col)
+        canvas = self.canvas
+        x, y = self.to_canvas(row, col)
+        tags = (CanvasLayer.STONE,)
+        
+        # 미리 그려 둔 돌 이미지가 있으면 이미지 항목 하나로 놓음
+        sprite = self.sprites.get(self.stone_radius, stone_color)
+        if sprite is not None:
+            items = (canvas.create_image(x, y, image=sprite, tags=tags),)
+        else:
+            items = self._draw_stone_ovals(x, y, stone_color, tags)
+        self._stone_items[(row, col)] = items
+        canvas.tag_raise(CanvasLayer.OVERLAY)
+        canvas.tag_raise(CanvasLayer.HOVER)
+    
+    def _draw_stone_ovals(self, x: int, y: int, stone_color: StoneColor, tags: tuple) -> Tuple[int, ...]:
+        """Pillow가 없을 때 그림자, 몸체, 하이라이트 타원 세 개로 돌을 그립니다."""
+        if stone_color == StoneColor.BLACK:
+            fill_color, outline_color, shadow_color, highlight_color = "#000000", "#1a1a1a", "#1a1a1a", "#333333"
+        else:
+            fill_color, outline_color, shadow_color, highlight_color = "#ffffff", "#f0f0f0", "#f0f0f0", "#ffffff"
+        
+        radius = self.stone_radius
+        highlight_radius = radius // 3
+        canvas = self.canvas
+        return (
+            canvas.create_oval(x - radius + 2, y - radius + 2, x + radius + 2, y + radius + 2,
+                               fill=shadow_color, outline=shadow_color, tags=tags),
+            canvas.create_oval(x - radius, y - radius, x + radius, y + radius,
+                               fill=fill_color, outline=outline_color, width=2, tags=tags),
+            canvas.create_oval(x - highlight_radius, y - highlight_radius, x + highlight_radius, y + highlight_radius,
+                               fill=highlight_color, outline="", stipple="gray50", tags=tags),
+        )
+    
+    def remove_stone(self, row: int, col: int) -> bool:
+        """
+        한 칸의 돌 항목만 지웁니다.
+        
+        Returns:
+            bool: 지운 돌이 있었는지 여부
+        """
+        items = self._stone_items.pop((row, col), None)
+        if items is None:
+            return False
+        self.canvas.delete(*items)
+        return True
+    
+    def clear_stones(self):
+        """돌 층과 덧그림 층을 지웁니다 (고정 층은 그대로 둠)."""
+        self.canvas.delete(CanvasLayer.STONE)
+        self.canvas.delete(CanvasLayer.OVERLAY)
+        self._stone_items.clear()
+    
+    def has_stone(self, row: int, col: int) -> bool:
+        """해당 칸에 그려진 돌이 있는지 확인합니다."""
+        return (row, col) in self._stone_items
\ No newline at end of file
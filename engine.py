@@ -0,0 +1,390 @@
+"""
+컴퓨터 플레이어 엔진
+반복 심화(iterative deepening)와 치환표(transposition table)를 사용하는
+네가맥스 알파-베타 탐색으로 주어진 시간 안에 최선의 수를 찾습니다.
+"""
+
+import time
+from typing import Callable, Optional, Tuple, List
+
+from board import Board, LineShape
+from game import Game
+from opening_book import OpeningBook
+from player import StoneColor
+
+
+# 줄 모양별 점수 (수 정렬과 평가에 사용)
+SHAPE_SCORES = {
+    LineShape.NONE: 0,
+    LineShape.TWO: 10,
+    LineShape.OPEN_TWO: 60,
+    LineShape.THREE: 120,
+    LineShape.OPEN_THREE: 1000,
+    LineShape.FOUR: 1200,
+    LineShape.OPEN_FOUR: 20000,
+    LineShape.FIVE: 1000000,
+}
+
+# 승리 점수 (수순이 짧을수록 큰 값)
+WIN_SCORE = 10000000
+_WIN_THRESHOLD = WIN_SCORE - 1000
+
+# 치환표 항목 종류
+_EXACT = 0
+_LOWER = 1
+_UPPER = 2
+
+
+def get_opponent_color(stone_color: StoneColor) -> StoneColor:
+    """상대 돌 색상을 반환합니다."""
+    return StoneColor.WHITE if stone_color == StoneColor.BLACK else StoneColor.BLACK
+
+
+class SearchResult:
+    """탐색 결과를 나타내는 클래스"""
+    
+    def __init__(self, move: Optional[Tuple[int, int]], score: int, depth: int,
+                 nodes: int, elapsed: float):
+        """
+        탐색 결과 초기화
+        
+        Args:
+            move (Optional[Tuple[int, int]]): 최선의 수 (행, 열)
+            score (int): 최선의 수의 평가 점수
+            depth (int): 완료된 탐색 깊이
+            nodes (int): 방문한 노드 수
+            elapsed (float): 탐색 시간 (초)
+        """
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.elapsed = elapsed
+    
+    @property
+    def nodes_per_second(self) -> float:
+        """초당 탐색 노드 수를 반환합니다."""
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def __str__(self) -> str:
+        """탐색 결과를 문자열로 반환합니다."""
+        return (f"수: {self.move}, 점수: {self.score}, 깊이: {self.depth}, "
+                f"노드: {self.nodes}, NPS: {self.nodes_per_second:.0f}")
+
+
+class _SearchTimeout(Exception):
+    """탐색 시간 초과를 알리는 내부 예외"""
+
+
+class TranspositionTable:
+    """고정 크기 치환표 (해시 하위 비트로 슬롯을 고르고, 깊이 우선으로 교체)"""
+    
+    def __init__(self, size_bits: int = 18):
+        """
+        치환표 초기화
+        
+        Args:
+            size_bits (int): 슬롯 수의 로그 값 (슬롯 수 = 2 ** size_bits)
+        """
+        self.mask = (1 << size_bits) - 1
+        self.slots: List[Optional[tuple]] = [None] * (1 << size_bits)
+        self.generation = 0
+    
+    def probe(self, key: int) -> Optional[tuple]:
+        """
+        항목을 조회합니다.
+        
+        Returns:
+            Optional[tuple]: (키, 깊이, 종류, 점수, 최선의 수, 세대) 또는 None
+        """
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            return entry
+        return None
+    
+    def store(self, key: int, depth: int, flag: int, score: int, move: Optional[Tuple[int, int]]):
+        """항목을 저장합니다. 이전 탐색의 항목이나 더 얕은 항목만 덮어씁니다."""
+        slot = key & self.mask
+        entry = self.slots[slot]
+        if entry is None or entry[0] == key or entry[5] != self.generation or depth >= entry[1]:
+            self.slots[slot] = (key, depth, flag, score, move, self.generation)
+    
+    def new_search(self):
+        """새 탐색을 시작합니다 (이전 항목은 교체 우선순위가 낮아집니다)."""
+        self.generation += 1
+    
+    def clear(self):
+        """치환표를 비웁니다."""
+        self.slots = [None] * (self.mask + 1)
+        self.generation = 0
+
+
+class AlphaBetaEngine:
+    """네가맥스 알파-베타 탐색 엔진"""
+    
+    def __init__(self, max_depth: int = 8, max_branching: int = 12, tt_size_bits: int = 18,
+                 opening_book: Optional[OpeningBook] = None):
+        """
+        엔진 초기화
+        
+        Args:
+            max_depth (int): 최대 탐색 깊이
+            max_branching (int): 노드마다 탐색할 최대 후보 수 (위협 순으로 정렬 후 자름)
+            tt_size_bits (int): 치환표 크기의 로그 값
+            opening_book (Optional[OpeningBook]): 탐색 전에 조회할 정석 북
+        """
+        self.max_depth = max_depth
+        self.max_branching = max_branching
+        self.tt = TranspositionTable(tt_size_bits)
+        self.opening_book = opening_book
+        self.last_result: Optional[SearchResult] = None
+        
+        self._nodes = 0
+        self._deadline = 0.0
+        self._should_stop: Optional[Callable[[], bool]] = None
+    
+    def choose_move(self, game: Game, time_limit_ms: int = 1000) -> Optional[Tuple[int, int]]:
+        """
+        게임의 현재 플레이어를 위한 수를 고릅니다.
+        
+        Args:
+            game (Game): 진행 중인 게임
+            time_limit_ms (int): 탐색 제한 시간 (밀리초)
+        
+        Returns:
+            Optional[Tuple[int, int]]: 최선의 수 (행, 열) 또는 둘 곳이 없으면 None
+        """
+        stone_color = game.get_current_player().get_stone_color()
+        return self.search(game.get_board(), stone_color, time_limit_ms).move
+    
+    def search(self, board: Board, stone_color: StoneColor, time_limit_ms: int = 1000,
+               should_stop: Optional[Callable[[], bool]] = None) -> SearchResult:
+        """
+        반복 심화로 최선의 수를 찾습니다.
+        
+        탐색 중에는 보드에 돌을 놓고 무르므로, 끝나면 보드는 원래 상태로 돌아옵니다.
+        
+        Args:
+            board (Board): 탐색할 보드
+            stone_color (StoneColor): 둘 차례인 돌 색상
+            time_limit_ms (int): 탐색 제한 시간 (밀리초)
+            should_stop (Optional[Callable[[], bool]]): 시간 확인과 함께 호출해 True면 탐색을 멈추는 함수
+                (다른 스레드나 프로세스에서 탐색을 취소할 때 사용, 멈추면 그때까지 완료된 깊이의 결과를 반환)
+        
+        Returns:
+            SearchResult: 탐색 결과
+        """
+        start = time.perf_counter()
+        self._deadline = start + time_limit_ms / 1000.0
+        self._nodes = 0
+        self._should_stop = should_stop
+        self.tt.new_search()
+        
+        result = SearchResult(None, 0, 0, 0, 0.0)
+        if self.opening_book is not None:
+            book_move = self.opening_book.best_move(board, stone_color)
+            if book_move is not None:
+                result.move = book_move
+                result.elapsed = time.perf_counter() - start
+                self.last_result = result
+                return result
+        
+        moves = self._ordered_moves(board, stone_color)
+        if moves:
+            # 시간이 없어도 둘 수는 있도록 정렬 1순위 수를 기본값으로 사용
+            result.move = moves[0][1]
+            if not board.move_history:
+                result.elapsed = time.perf_counter() - start
+                self.last_result = result
+                return result
+        
+        for depth in range(1, self.max_depth + 1):
+            try:
+                score, move = self._search_root(board, stone_color, depth)
+            except _SearchTimeout:
+                break
+            if move is not None:
+                result.move = move
+                result.score = score
+                result.depth = depth
+            # 승패가 확정되면 더 깊이 볼 필요가 없음
+            if abs(score) >= _WIN_THRESHOLD:
+                break
+        
+        result.nodes = self._nodes
+        result.elapsed = time.perf_counter() - start
+        self.last_result = result
+        return result
+    
+    def predict_reply(self, board: Board, stone_color: StoneColor,
+                      move: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """
+        수를 둔 뒤 상대의 예상 응수를 찾습니다 (상대가 생각하는 동안 미리 탐색할 국면을 고를 때 사용).
+        
+        방금 끝난 탐색이 치환표에 남긴 최선의 수(주요 변화의 두 번째 수)를 쓰고,
+        없으면 수 정렬 1순위 수를 씁니다. 보드는 원래 상태로 돌아옵니다.
+        
+        Args:
+            board (Board): 수를 두기 전의 보드
+            stone_color (StoneColor): 수를 두는 돌 색상
+            move (Tuple[int, int]): 둘 수 (행, 열)
+        
+        Returns:
+            Optional[Tuple[int, int]]: 상대의 예상 응수 또는 그 수로 게임이 끝나면 None
+        """
+        board.place_stone(move[0], move[1], stone_color)
+        try:
+            if board.check_win(move[0], move[1], stone_color) or board.is_full():
+                return None
+            opponent_color = get_opponent_color(stone_color)
+            key = board.zobrist_hash
+            if opponent_color == StoneColor.WHITE:
+                key ^= board.side_to_move_key
+            entry = self.tt.probe(key)
+            if entry is not None and entry[4] is not None:
+                return entry[4]
+            moves = self._ordered_moves(board, opponent_color)
+            return moves[0][1] if moves else None
+        finally:
+            board.undo_last_move()
+    
+    def _search_root(self, board: Board, stone_color: StoneColor, depth: int) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """루트 노드를 탐색하고 (점수, 최선의 수)를 반환합니다."""
+        return self._negamax(board, stone_color, depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+    
+    def _negamax(self, board: Board, stone_color: StoneColor, depth: int,
+                 alpha: int, beta: int, ply: int) -> Tuple[int, Optional[Tuple[int, int]]]:
+        """
+        네가맥스 알파-베타 탐색
+        
+        Returns:
+            Tuple[int, Optional[Tuple[int, int]]]: (둘 차례 기준 점수, 최선의 수)
+        """
+        self._nodes += 1
+        # 노드 하나가 수백 마이크로초이므로 16 노드마다 확인해도 비용은 무시할 만하고 멈추는 지연은 수 밀리초
+        if self._nodes & 15 == 0 and (time.perf_counter() > self._deadline or
+                                      (self._should_stop is not None and self._should_stop())):
+            raise _SearchTimeout()
+        
+        key = board.zobrist_hash
+        if stone_color == StoneColor.WHITE:
+            key ^= board.side_to_move_key
+        
+        # 치환표 조회
+        tt_move = None
+        entry = self.tt.probe(key)
+        if entry is not None:
+            _, entry_depth, flag, entry_score, tt_move, _ = entry
+            if entry_depth >= depth and ply > 0:
+                entry_score = _score_from_tt(entry_score, ply)
+                if flag == _EXACT:
+                    return entry_score, tt_move
+                if flag == _LOWER and entry_score >= beta:
+                    return entry_score, tt_move
+                if flag == _UPPER and entry_score <= alpha:
+                    return entry_score, tt_move
+        
+        moves = self._ordered_moves(board, stone_color)
+        if not moves:
+            return 0, None  # 둘 곳이 없으면 무승부
+        
+        # 바로 5목을 만들 수 있으면 승리
+        best_score, best_move = moves[0][0], moves[0][1]
+        if moves[0][2]:
+            return WIN_SCORE - ply, best_move
+        
+        if depth == 0:
+            return self._evaluate(moves), best_move
+        
+        # 치환표의 최선의 수를 가장 먼저 탐색
+        candidates = [move for _, move, _ in moves[:self.max_branching]]
+        if tt_move in candidates:
+            candidates.remove(tt_move)
+            candidates.insert(0, tt_move)
+        
+        original_alpha = alpha
+        opponent_color = get_opponent_color(stone_color)
+        best_score = -WIN_SCORE - 1
+        for move in candidates:
+            board.place_stone(move[0], move[1], stone_color)
+            try:
+                score = -self._negamax(board, opponent_color, depth - 1, -beta, -alpha, ply + 1)[0]
+            finally:
+                board.undo_last_move()
+            
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+        
+        if best_score <= original_alpha:
+            flag = _UPPER
+        elif best_score >= beta:
+            flag = _LOWER
+        else:
+            flag = _EXACT
+        self.tt.store(key, depth, flag, _score_to_tt(best_score, ply), best_move)
+        return best_score, best_move
+    
+    def _ordered_moves(self, board: Board, stone_color: StoneColor) -> List[Tuple[int, Tuple[int, int], bool]]:
+        """
+        후보 수를 위협이 큰 순서로 정렬해 반환합니다.
+        
+        자기 모양(공격)과 같은 칸의 상대 모양(수비)을 함께 점수화하므로
+        5목, 상대 5목 막기, 열린 사, 상대 열린 사 막기 순으로 앞에 옵니다.
+        
+        Returns:
+            List[Tuple[int, Tuple[int, int], bool]]: (점수, 수, 5목 여부) 목록
+        """
+        opponent_color = get_opponent_color(stone_color)
+        scored = []
+        for row, col in board.get_candidate_moves():
+            if board.check_forbidden(row, col, stone_color):
+                continue  # 흑의 금수는 둘 수 없음
+            own_shapes = board.get_line_shapes(row, col, stone_color)
+            
+            attack = 0
+            for shape in own_shapes:
+                attack += SHAPE_SCORES[shape]
+            defense = 0
+            for shape in board.get_line_shapes(row, col, opponent_color):
+                defense += SHAPE_SCORES[shape]
+            
+            wins = LineShape.FIVE in own_shapes
+            scored.append((attack + defense * 4 // 5, (row, col), wins))
+        
+        scored.sort(key=lambda item: (item[2], item[0]), reverse=True)
+        return scored
+    
+    def _evaluate(self, moves: List[Tuple[int, Tuple[int, int], bool]]) -> int:
+        """
+        정적 평가 (둘 차례 기준)
+        
+        둘 차례인 쪽이 가장 좋은 후보 몇 개를 둘 수 있다는 점을 반영해
+        상위 후보 점수의 합으로 평가합니다.
+        """
+        score = 0
+        for move_score, _, _ in moves[:3]:
+            score += move_score
+        return score
+
+
+def _score_to_tt(score: int, ply: int) -> int:
+    """승리 점수를 현재 노드 기준으로 바꿔 치환표에 저장합니다."""
+    if score >= _WIN_THRESHOLD:
+        return score + ply
+    if score <= -_WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_tt(score: int, ply: int) -> int:
+    """치환표의 승리 점수를 루트 기준으로 되돌립니다."""
+    if score >= _WIN_THRESHOLD:
+        return score - ply
+    if score <= -_WIN_THRESHOLD:
+        return score + ply
+    return score
\ No newline at end of file
@@ -3,7 +3,10 @@
 오목 게임의 전체적인 상태를 관리하고 게임 로직을 처리합니다.
 """
 
-from typing import Optional, Callable, Tuple
+import time
+from functools import partial
+from typing import Dict, Optional, Callable, Tuple
+import instrumentation
 from player import Player, StoneColor
 from board import Board
 
@@ -15,29 +18,81 @@ class GameState:
     DRAW = "draw"
 
 
+class _TimedBoard:
+    """
+    Game의 로직이 부르는 보드 메서드마다 시간을 재서 단계 이름으로 기록하는 대리 객체
+    
+    시간을 재는 메서드는 만들 때 한 번만 인스턴스 속성으로 묶어 두므로 조회마다 함수를 만들지 않으며,
+    Game은 보드와 계측기가 바뀌지 않는 한 같은 대리 객체를 다시 씁니다.
+    단계: bounds, empty, forbidden, place_stone, check_win, is_full
+    """
+    
+    # 보드 메서드 이름 -> 단계 이름
+    PHASES = {
+        "is_valid_position": "bounds",
+        "is_empty": "empty",
+        "check_forbidden": "forbidden",
+        "place_stone": "place_stone",
+        "check_win": "check_win",
+        "is_full": "is_full",
+    }
+    
+    __slots__ = ("board", "profiler") + tuple(PHASES)
+    
+    def __init__(self, board: Board, profiler):
+        self.board = board
+        self.profiler = profiler
+        for name, phase in self.PHASES.items():
+            setattr(self, name, self._timed(getattr(board, name), phase, profiler.record))
+    
+    @staticmethod
+    def _timed(method: Callable, phase: str, record: Callable) -> Callable:
+        """method를 부를 때마다 소요 시간을 phase 단계로 기록하는 함수를 반환합니다."""
+        def timed(*args):
+            start = time.perf_counter_ns()
+            try:
+                return method(*args)
+            finally:
+                record(phase, time.perf_counter_ns() - start)
+        return timed
+    
+    def __getattr__(self, name: str):
+        # 시간을 재지 않는 메서드와 속성은 보드로 넘김
+        return getattr(self.board, name)
+
+
 class Game:
     """오목 게임의 메인 클래스"""
     
-    def __init__(self, player1_name: str = "플레이어 1", player2_name: str = "플레이어 2"):
+    __slots__ = ("board", "player1", "player2", "current_player", "game_state", "winner",
+                 "move_count", "last_forbidden", "on_state_change", "on_win", "on_draw", "_timed_board")
+    
+    def __init__(self, player1_name: str = "플레이어 1", player2_name: str = "플레이어 2",
+                 board: Optional[Board] = None):
         """
         게임 초기화
         
         Args:
             player1_name (str): 첫 번째 플레이어 이름 (흑돌)
             player2_name (str): 두 번째 플레이어 이름 (백돌)
+            board (Optional[Board]): 사용할 보드 (None이면 15x15 Board, SparseBoard 등 같은 인터페이스의 보드도 가능)
         """
-        self.board = Board()
+        self.board = board if board is not None else Board()
         self.player1 = Player(player1_name, StoneColor.BLACK)
         self.player2 = Player(player2_name, StoneColor.WHITE)
         self.current_player = self.player1
         self.game_state = GameState.PLAYING
         self.winner = None
         self.move_count = 0
+        self.last_forbidden: Optional[str] = None  # 마지막으로 거부된 금수 종류
         
         # 콜백 함수들
         self.on_state_change: Optional[Callable] = None
         self.on_win: Optional[Callable] = None
         self.on_draw: Optional[Callable] = None
+        
+        # 계측이 켜져 있을 때 다시 쓰는 시간 재는 보드 대리 객체 (처음 계측할 때 만듦)
+        self._timed_board: Optional[_TimedBoard] = None
     
     def get_current_player(self) -> Player:
         """현재 플레이어를 반환합니다."""
@@ -59,6 +114,28 @@ class Game:
         """총 이동 횟수를 반환합니다."""
         return self.move_count
     
+    @property
+    def position_hash(self) -> int:
+        """
+        차례까지 포함한 현재 국면의 64비트 조브리스트 해시를 반환합니다.
+        
+        보드 해시에 백 차례일 때만 차례 키를 XOR 합니다.
+        """
+        if self.current_player is self.player2:
+            return self.board.zobrist_hash ^ self.board.side_to_move_key
+        return self.board.zobrist_hash
+    
+    def get_forbidden_points(self) -> Dict[Tuple[int, int], str]:
+        """
+        현재 플레이어가 둘 수 없는 금수 위치를 반환합니다.
+        
+        Returns:
+            Dict[Tuple[int, int], str]: (행, 열) -> ForbiddenType 값 (백 차례면 빈 딕셔너리)
+        """
+        if self.current_player.get_stone_color() != StoneColor.BLACK:
+            return {}
+        return self.board.get_forbidden_points()
+    
     def make_move(self, row: int, col: int) -> bool:
         """
         돌을 놓습니다.
@@ -66,65 +143,111 @@ class Game:
         Args:
             row (int): 행 인덱스
             col (int): 열 인덱스
-            
+        
+        Returns:
+            bool: 이동 성공 여부
+        """
+        # 이전 수의 금수 종류가 이번 거부 사유로 보이지 않도록 먼저 지움
+        self.last_forbidden = None
+        
+        # 계측이 켜져 있으면 같은 로직을 보드 호출과 콜백마다 시간을 재며 실행
+        profiler = instrumentation.profiler
+        if profiler is None:
+            return self._play(row, col, self.board, self._notify)
+        
+        timed_board = self._timed_board
+        if timed_board is None or timed_board.board is not self.board or timed_board.profiler is not profiler:
+            timed_board = self._timed_board = _TimedBoard(self.board, profiler)
+        start = time.perf_counter_ns()
+        try:
+            return self._play(row, col, timed_board,
+                              partial(self._notify_profiled, profiler))
+        finally:
+            profiler.record("make_move", time.perf_counter_ns() - start)
+    
+    def _play(self, row: int, col: int, board, notify: Callable) -> bool:
+        """
+        make_move의 게임 로직입니다. 계측 여부에 따라 보드와 콜백을 부르는 방식만 바뀝니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            board: self.board 또는 단계별 시간을 재는 _TimedBoard
+            notify (Callable): (콜백, *인자)를 받아 콜백이 있으면 호출하는 함수
+        
         Returns:
             bool: 이동 성공 여부
         """
         # 게임이 이미 종료되었거나 유효하지 않은 위치인 경우
-        if self.game_state != GameState.PLAYING or not self.board.is_valid_position(row, col):
+        if self.game_state != GameState.PLAYING or not board.is_valid_position(row, col):
             return False
         
         # 돌을 놓을 수 없는 위치인 경우
-        if not self.board.is_empty(row, col):
+        if not board.is_empty(row, col):
             return False
         
-        # 쌍삼 방지 확인
+        # 렌주 금수 확인 (흑의 삼삼, 사사, 장목)
         stone_color = self.current_player.get_stone_color()
-        if self.board.check_double_three(row, col, stone_color):
-            return False  # 쌍삼이므로 돌을 놓을 수 없음
+        forbidden = board.check_forbidden(row, col, stone_color)
+        if forbidden:
+            self.last_forbidden = forbidden
+            return False  # 금수이므로 돌을 놓을 수 없음
         
         # 돌을 놓습니다
-        if not self.board.place_stone(row, col, stone_color):
+        if not board.place_stone(row, col, stone_color):
             return False
         
         self.move_count += 1
         
         # 승리 조건 확인 (5번째 돌을 두고 오목이 완성되었는지)
-        if self.board.check_win(row, col, stone_color):
+        if board.check_win(row, col, stone_color):
             # 승리 처리 (GUI에서 팝업 표시)
-            self._handle_win()
+            self._handle_win(notify)
             return True
         
         # 무승부 확인
-        if self.board.is_full():
+        if board.is_full():
             # 무승부 처리 (GUI에서 팝업 표시)
-            self._handle_draw()
+            self._handle_draw(notify)
             return True
         
         # 다음 플레이어로 턴 변경
         self._switch_player()
         
         # 상태 변경 콜백 호출
-        if self.on_state_change:
-            self.on_state_change()
+        notify(self.on_state_change)
         
         return True
     
-    def _handle_win(self):
+    @staticmethod
+    def _notify(callback: Optional[Callable], *args):
+        """콜백이 있으면 호출합니다."""
+        if callback:
+            callback(*args)
+    
+    @staticmethod
+    def _notify_profiled(profiler, callback: Optional[Callable], *args):
+        """콜백이 있으면 호출하고 그 시간을 "callback:함수 이름" 단계로 기록합니다."""
+        if not callback:
+            return
+        start = time.perf_counter_ns()
+        try:
+            callback(*args)
+        finally:
+            profiler.record("callback:" + getattr(callback, "__name__", type(callback).__name__),
+                            time.perf_counter_ns() - start)
+    
+    def _handle_win(self, notify: Callable):
         """승리 처리"""
         self.game_state = GameState.WIN
         self.winner = self.current_player
         self.winner.add_score()
-        
-        if self.on_win:
-            self.on_win(self.winner)
+        notify(self.on_win, self.winner)
     
-    def _handle_draw(self):
+    def _handle_draw(self, notify: Callable):
         """무승부 처리"""
         self.game_state = GameState.DRAW
-        
-        if self.on_draw:
-            self.on_draw()
+        notify(self.on_draw)
     
     def _switch_player(self):
         """플레이어 턴을 변경합니다."""
@@ -137,6 +260,7 @@ class Game:
         self.game_state = GameState.PLAYING
         self.winner = None
         self.move_count = 0
+        self.last_forbidden = None
         
         if self.on_state_change:
             self.on_state_change()
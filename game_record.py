@@ -0,0 +1,264 @@
+"""
+대국 기록 바이너리 형식
+15x15 보드에서는 수 하나를 1바이트로 저장하는 간결한 기록 형식과,
+스트리밍 기록기, 메모리 맵으로 큰 보관 파일을 한 판씩 읽는 제너레이터를 제공합니다.
+
+파일 구조:
+    파일 헤더: b"OMOK" + 버전(1바이트)
+    기록 반복:
+        보드 크기 (1바이트)
+        결과 (1바이트, GameResult)
+        흑 이름 길이 (1바이트) + 흑 이름 (UTF-8)
+        백 이름 길이 (1바이트) + 백 이름 (UTF-8)
+        수 개수 (2바이트, 리틀 엔디언)
+        수 목록 (칸 번호 row * size + col, 칸이 256개 이하면 1바이트, 아니면 2바이트 리틀 엔디언)
+"""
+
+import mmap
+import os
+import struct
+from typing import Iterator, List, Optional, Tuple
+
+from board import Board
+from game import Game, GameState
+from player import StoneColor
+
+
+MAGIC = b"OMOK"
+VERSION = 1
+_FILE_HEADER = MAGIC + bytes([VERSION])
+_MOVE_COUNT = struct.Struct("<H")
+
+
+class GameResult:
+    """대국 결과를 정의하는 열거형"""
+    DRAW = 0
+    BLACK_WIN = 1
+    WHITE_WIN = 2
+    UNFINISHED = 3
+
+
+class GameRecord:
+    """대국 한 판의 기록을 나타내는 클래스"""
+    
+    def __init__(self, board_size: Optional[int], black_name: str, white_name: str,
+                 result: int, moves: List[Tuple[int, int]]):
+        """
+        대국 기록 초기화
+        
+        Args:
+            board_size (Optional[int]): 보드 크기 (None이면 무한 보드, 바이너리 형식으로는 쓸 수 없음)
+            black_name (str): 흑 플레이어 이름
+            white_name (str): 백 플레이어 이름
+            result (int): 대국 결과 (GameResult 값)
+            moves (List[Tuple[int, int]]): 수순 (행, 열), 흑부터 번갈아 둔 순서
+        """
+        self.board_size = board_size
+        self.black_name = black_name
+        self.white_name = white_name
+        self.result = result
+        self.moves = moves
+    
+    @classmethod
+    def from_game(cls, game: Game) -> "GameRecord":
+        """
+        게임의 현재 상태로 기록을 만듭니다.
+        
+        Args:
+            game (Game): 기록할 게임
+        
+        Returns:
+            GameRecord: 대국 기록
+        """
+        if game.get_game_state() == GameState.WIN:
+            if game.get_winner().get_stone_color() == StoneColor.BLACK:
+                result = GameResult.BLACK_WIN
+            else:
+                result = GameResult.WHITE_WIN
+        elif game.get_game_state() == GameState.DRAW:
+            result = GameResult.DRAW
+        else:
+            result = GameResult.UNFINISHED
+        
+        board = game.get_board()
+        moves = [(row, col) for row, col, _ in board.move_history]
+        return cls(board.size, game.get_player1().get_name(), game.get_player2().get_name(), result, moves)
+    
+    def replay(self, game: Optional[Game] = None) -> Game:
+        """
+        기록을 Game.make_move로 다시 둡니다.
+        
+        Args:
+            game (Optional[Game]): 다시 둘 게임 (None이면 기록의 보드 크기로 새로 만듦, 주어지면 초기화 후 사용)
+        
+        Returns:
+            Game: 기록이 재현된 게임
+        
+        Raises:
+            ValueError: 규칙상 둘 수 없는 수가 기록에 있는 경우
+        """
+        if game is None:
+            game = Game(self.black_name, self.white_name, Board(self.board_size))
+        else:
+            game.reset_game()
+        
+        for number, (row, col) in enumerate(self.moves, start=1):
+            if not game.make_move(row, col):
+                raise ValueError(f"{number}번째 수 ({row}, {col})를 둘 수 없습니다.")
+        return game
+    
+    def to_bytes(self) -> bytes:
+        """
+        기록을 바이너리로 인코딩합니다.
+        
+        Raises:
+            ValueError: 바이너리 형식으로 쓸 수 없는 기록 (무한 보드, 크기 1~255 밖, 보드 밖의 수, 65535수 초과)
+        """
+        size = self.board_size
+        if size is None:
+            raise ValueError("무한 보드의 대국은 바이너리 기록으로 쓸 수 없습니다.")
+        if not 1 <= size <= 255:
+            raise ValueError(f"바이너리 기록의 보드 크기는 1~255여야 합니다: {size}")
+        if len(self.moves) > 0xFFFF:
+            raise ValueError(f"바이너리 기록의 수는 65535개 이하여야 합니다: {len(self.moves)}")
+        for row, col in self.moves:
+            if not (0 <= row < size and 0 <= col < size):
+                raise ValueError(f"보드 밖의 수가 있습니다: ({row}, {col})")
+        
+        black = _encode_name(self.black_name)
+        white = _encode_name(self.white_name)
+        cells = [row * size + col for row, col in self.moves]
+        if size * size <= 256:
+            packed = bytes(cells)
+        else:
+            packed = struct.pack(f"<{len(cells)}H", *cells)
+        
+        return b"".join((
+            bytes((size, self.result, len(black))), black,
+            bytes((len(white),)), white,
+            _MOVE_COUNT.pack(len(cells)), packed,
+        ))
+    
+    def __repr__(self) -> str:
+        """대국 기록 객체의 표현을 반환합니다."""
+        return (f"GameRecord(board_size={self.board_size}, black_name='{self.black_name}', "
+                f"white_name='{self.white_name}', result={self.result}, moves={len(self.moves)})")
+
+
+class GameRecordWriter:
+    """대국 기록을 보관 파일에 이어 쓰는 스트리밍 기록기"""
+    
+    def __init__(self, path: str, append: bool = False):
+        """
+        기록기 초기화
+        
+        Args:
+            path (str): 보관 파일 경로
+            append (bool): 기존 파일 끝에 이어 쓸지 여부
+        """
+        exists = append and os.path.exists(path) and os.path.getsize(path) > 0
+        self.file = open(path, "ab" if append else "wb")
+        if not exists:
+            self.file.write(_FILE_HEADER)
+        self.count = 0
+    
+    def write(self, record: GameRecord):
+        """기록 한 판을 씁니다."""
+        self.file.write(record.to_bytes())
+        self.count += 1
+    
+    def write_game(self, game: Game):
+        """게임의 현재 상태를 기록 한 판으로 씁니다."""
+        self.write(GameRecord.from_game(game))
+    
+    def flush(self):
+        """버퍼를 파일에 씁니다."""
+        self.file.flush()
+    
+    def close(self):
+        """파일을 닫습니다."""
+        self.file.close()
+    
+    def __enter__(self) -> "GameRecordWriter":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def read_records(path: str) -> Iterator[GameRecord]:
+    """
+    보관 파일을 메모리 맵으로 열어 기록을 한 판씩 돌려줍니다.
+    
+    파일 전체를 읽어 들이지 않으므로 수 GB 크기의 보관 파일도 일정한 메모리로 순회합니다.
+    
+    Args:
+        path (str): 보관 파일 경로
+    
+    Yields:
+        GameRecord: 대국 기록
+    
+    Raises:
+        ValueError: 보관 파일 형식이 아니거나 기록이 파일 끝에서 잘린 경우
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if data[:len(_FILE_HEADER)] != _FILE_HEADER:
+                raise ValueError(f"대국 기록 파일이 아닙니다: {path}")
+            
+            offset = len(_FILE_HEADER)
+            end = len(data)
+            while offset < end:
+                record, offset = _decode_record(data, offset)
+                yield record
+
+
+def _encode_name(name: str) -> bytes:
+    """이름을 255바이트 이하의 UTF-8로 인코딩합니다 (글자 중간에서 자르지 않음)."""
+    return name.encode("utf-8")[:255].decode("utf-8", "ignore").encode("utf-8")
+
+
+def _decode_record(data, offset: int) -> Tuple[GameRecord, int]:
+    """
+    offset 위치의 기록 한 판을 디코딩합니다.
+    
+    Returns:
+        Tuple[GameRecord, int]: (기록, 다음 기록의 위치)
+    
+    Raises:
+        ValueError: 기록이 파일 끝에서 잘린 경우
+    """
+    end = len(data)
+    start = offset
+    
+    def need(length: int):
+        if offset + length > end:
+            raise ValueError(f"잘린 대국 기록입니다 (위치 {start}, {end - offset}바이트 남음, {length}바이트 필요)")
+    
+    need(3)
+    size, result, black_length = data[offset], data[offset + 1], data[offset + 2]
+    offset += 3
+    need(black_length + 1)
+    black_name = data[offset:offset + black_length].decode("utf-8")
+    offset += black_length
+    white_length = data[offset]
+    offset += 1
+    need(white_length + _MOVE_COUNT.size)
+    white_name = data[offset:offset + white_length].decode("utf-8")
+    offset += white_length
+    (move_count,) = _MOVE_COUNT.unpack_from(data, offset)
+    offset += _MOVE_COUNT.size
+    
+    if size * size <= 256:
+        need(move_count)
+        cells = data[offset:offset + move_count]
+        offset += move_count
+    else:
+        need(2 * move_count)
+        cells = struct.unpack_from(f"<{move_count}H", data, offset)
+        offset += 2 * move_count
+    
+    moves = [divmod(cell, size) for cell in cells]
+    return GameRecord(size, black_name, white_name, result, moves), offset
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+마우스 호버 처리
+<Motion> 이벤트를 after_idle로 모아 한 번만 처리하고, 가리키는 교차점이 바뀌었을 때만 다시 계산합니다.
+칸별 금수 여부는 다음 수가 놓일 때까지 캐시하며, 금수 표시(반투명 원과 X)는 처음 한 번 만든
+캔버스 항목 묶음을 옮기고 숨기기만 하므로 오래 두어도 캔버스 항목 수가 늘지 않습니다.
+"""
+
+from typing import Callable, Dict, Optional, Tuple
+
+from board_renderer import BoardRenderer, CanvasLayer
+
+
+class HoverIndicator:
+    """캔버스 위 마우스 위치의 금수 표시를 관리하는 클래스"""
+    
+    def __init__(self, root, renderer: BoardRenderer, get_game: Callable):
+        """
+        호버 처리 초기화
+        
+        Args:
+            root (tk.Tk): after_idle을 예약할 루트 윈도우
+            renderer (BoardRenderer): 좌표 변환과 캔버스를 제공하는 렌더러
+            get_game (Callable): 현재 Game을 반환하는 함수 (게임이 없으면 None)
+        """
+        self.root = root
+        self.renderer = renderer
+        self.canvas = renderer.canvas
+        self.get_game = get_game
+        self._pointer: Optional[Tuple[int, int]] = None  # 마지막 마우스 캔버스 좌표
+        self._scheduled = False
+        self._cell: Optional[Tuple[int, int]] = None  # 표시 중인 교차점
+        self._position: Optional[int] = None  # 캐시를 만든 국면의 해시
+        self._forbidden: Dict[Tuple[int, int], Optional[str]] = {}  # (행, 열) -> 금수 종류 또는 None
+        self._items = self._create_items()
+    
+    def _create_items(self) -> Tuple[int, int, int]:
+        """숨긴 상태의 금수 표시 항목 묶음(반투명 빨간 원, X 선 두 개)을 한 번만 만듭니다."""
+        tags = (CanvasLayer.HOVER,)
+        canvas = self.canvas
+        return (
+            canvas.create_oval(0, 0, 0, 0, fill="#ff0000", outline="#cc0000", width=2,
+                               stipple="gray25", state="hidden", tags=tags),
+            canvas.create_line(0, 0, 0, 0, fill="#ffffff", width=3, state="hidden", tags=tags),
+            canvas.create_line(0, 0, 0, 0, fill="#ffffff", width=3, state="hidden", tags=tags),
+        )
+    
+    def on_motion(self, event):
+        """마우스 좌표만 기록하고, 처리는 대기 중인 이벤트가 없을 때 한 번만 예약합니다."""
+        self._pointer = (event.x, event.y)
+        if not self._scheduled:
+            self._scheduled = True
+            self.root.after_idle(self._process)
+    
+    def on_leave(self, event=None):
+        """마우스가 캔버스를 벗어나면 표시를 숨깁니다."""
+        self._pointer = None
+        self._cell = None
+        self.hide()
+    
+    def refresh(self):
+        """
+        수가 놓이거나 무르기/새 게임 후 현재 마우스 위치의 표시를 다시 계산합니다.
+        
+        국면 해시가 바뀌었으므로 칸별 캐시는 다음 처리에서 비워집니다.
+        """
+        self._cell = None
+        if self._pointer is not None and not self._scheduled:
+            self._scheduled = True
+            self.root.after_idle(self._process)
+    
+    def _process(self):
+        """모인 움직임 중 마지막 위치 하나만 처리합니다."""
+        self._scheduled = False
+        game = self.get_game()
+        if game is None or game.is_game_over() or self._pointer is None:
+            self._cell = None
+            self.hide()
+            return
+        
+        cell = self.renderer.to_cell(*self._pointer)
+        position = game.position_hash
+        if cell == self._cell and position == self._position:
+            return  # 같은 교차점, 같은 국면이면 다시 계산하지 않음
+        self._cell = cell
+        if position != self._position:
+            self._position = position
+            self._forbidden.clear()
+        
+        if cell is None:
+            self.hide()
+            return
+        forbidden = self._forbidden.get(cell, False)
+        if forbidden is False:
+            stone_color = game.get_current_player().get_stone_color()
+            # 렌주 금수 (흑의 삼삼, 사사, 장목)
+            forbidden = self._forbidden[cell] = game.get_board().check_forbidden(cell[0], cell[1], stone_color)
+        if forbidden:
+            self.show(*cell)
+        else:
+            self.hide()
+    
+    def show(self, row: int, col: int):
+        """금수 표시 묶음을 해당 교차점으로 옮겨 보여줍니다."""
+        x, y = self.renderer.to_canvas(row, col)
+        radius = self.renderer.stone_radius
+        x_size = radius // 2
+        oval, line1, line2 = self._items
+        canvas = self.canvas
+        canvas.coords(oval, x - radius, y - radius, x + radius, y + radius)
+        canvas.coords(line1, x - x_size, y - x_size, x + x_size, y + x_size)
+        canvas.coords(line2, x - x_size, y + x_size, x + x_size, y - x_size)
+        canvas.itemconfigure(CanvasLayer.HOVER, state="normal")
+        canvas.tag_raise(CanvasLayer.HOVER)
+    
+    def hide(self):
+        """금수 표시 묶음을 숨깁니다 (항목은 지우지 않음)."""
+        self.canvas.itemconfigure(CanvasLayer.HOVER, state="hidden")
\ No newline at end of file
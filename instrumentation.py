@@ -0,0 +1,190 @@
+"""
+단계별 계측
+Game.make_move의 단계(범위 확인, 빈칸 확인, 금수 판정, 돌 놓기, 승리 판정, 가득 참 확인, 콜백)마다
+호출 수와 지연 시간 히스토그램을 모으고, 프로그램 종료 시 JSON 또는 텍스트 표로 출력합니다.
+
+계측은 선택 사항이며 꺼져 있을 때 make_move는 profiler가 None인지 한 번만 확인합니다.
+
+사용법:
+    OMOK_PROFILE=1 python main_2d.py                 # 종료 시 텍스트 표를 표준 오류로 출력
+    OMOK_PROFILE=profile.json python main_2d.py      # 종료 시 JSON 파일로 저장 (.json이 아니면 텍스트 파일)
+    python -m selfplay --games 100 --profile profile.json
+"""
+
+import atexit
+import json
+import os
+import sys
+from typing import Dict, Optional
+
+
+# 히스토그램 구간 수 (구간 i는 2^(i-1)~2^i 마이크로초, 마지막 구간은 그 이상 전부)
+BUCKET_COUNT = 24
+
+
+class PhaseStats:
+    """한 단계의 호출 수, 누적 시간, 지연 시간 히스토그램"""
+    
+    __slots__ = ("calls", "total_ns", "max_ns", "buckets")
+    
+    def __init__(self):
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = [0] * BUCKET_COUNT
+    
+    def percentile_us(self, fraction: float) -> float:
+        """히스토그램 구간의 상한으로 근사한 백분위 지연 시간(마이크로초)을 반환합니다."""
+        if not self.calls:
+            return 0.0
+        target = fraction * self.calls
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= target:
+                return min(float(1 << index), self.max_ns / 1000.0)
+        return self.max_ns / 1000.0
+
+
+class PhaseProfiler:
+    """단계 이름별 통계를 모으는 계측기"""
+    
+    def __init__(self):
+        self.phases: Dict[str, PhaseStats] = {}
+    
+    def record(self, phase: str, elapsed_ns: int):
+        """
+        단계 한 번의 소요 시간을 기록합니다.
+        
+        Args:
+            phase (str): 단계 이름
+            elapsed_ns (int): 소요 시간 (나노초)
+        """
+        stats = self.phases.get(phase)
+        if stats is None:
+            stats = self.phases[phase] = PhaseStats()
+        stats.calls += 1
+        stats.total_ns += elapsed_ns
+        if elapsed_ns > stats.max_ns:
+            stats.max_ns = elapsed_ns
+        stats.buckets[min((elapsed_ns // 1000).bit_length(), BUCKET_COUNT - 1)] += 1
+    
+    def merge(self, data: dict):
+        """
+        to_dict로 만든 다른 계측기의 통계를 더합니다 (워커 프로세스의 결과를 합칠 때 사용).
+        
+        Args:
+            data (dict): to_dict 결과
+        """
+        for phase, values in data["phases"].items():
+            stats = self.phases.get(phase)
+            if stats is None:
+                stats = self.phases[phase] = PhaseStats()
+            stats.calls += values["calls"]
+            stats.total_ns += values["total_ns"]
+            stats.max_ns = max(stats.max_ns, values["max_ns"])
+            for index, count in enumerate(values["buckets"]):
+                stats.buckets[index] += count
+    
+    def reset(self):
+        """모은 통계를 지웁니다."""
+        self.phases.clear()
+    
+    def to_dict(self) -> dict:
+        """
+        통계를 JSON으로 저장할 수 있는 딕셔너리로 반환합니다.
+        
+        Returns:
+            dict: 단계별 호출 수, 누적/최대 시간, 히스토그램, 근사 백분위
+        """
+        return {
+            "bucket_upper_bounds_us": [1 << index for index in range(BUCKET_COUNT - 1)] + [None],
+            "phases": {
+                phase: {
+                    "calls": stats.calls,
+                    "total_ns": stats.total_ns,
+                    "mean_us": stats.total_ns / stats.calls / 1000.0 if stats.calls else 0.0,
+                    "p50_us": stats.percentile_us(0.5),
+                    "p99_us": stats.percentile_us(0.99),
+                    "max_ns": stats.max_ns,
+                    "buckets": stats.buckets[:],
+                }
+                for phase, stats in self.phases.items()
+            },
+        }
+    
+    def format_table(self) -> str:
+        """
+        통계를 누적 시간이 큰 순서의 텍스트 표로 반환합니다.
+        
+        비중은 make_move 전체 시간에 대한 비율입니다 (make_move 기록이 없으면 단계 합계 기준).
+        """
+        overall = self.phases.get("make_move")
+        total_ns = overall.total_ns if overall else sum(stats.total_ns for stats in self.phases.values())
+        lines = [f"{'단계':<28} {'호출':>10} {'누적 ms':>10} {'평균 us':>9} {'p50 us':>8} "
+                 f"{'p99 us':>8} {'최대 us':>10} {'비중':>7}"]
+        for phase, stats in sorted(self.phases.items(), key=lambda item: -item[1].total_ns):
+            share = stats.total_ns / total_ns if total_ns else 0.0
+            lines.append(f"{phase:<28} {stats.calls:>10,} {stats.total_ns / 1e6:>10.2f} "
+                         f"{stats.total_ns / stats.calls / 1000.0:>9.2f} {stats.percentile_us(0.5):>8.1f} "
+                         f"{stats.percentile_us(0.99):>8.1f} {stats.max_ns / 1000.0:>10.1f} {share:>7.1%}")
+        return "\n".join(lines)
+    
+    def dump(self, output: Optional[str] = None):
+        """
+        통계를 출력합니다.
+        
+        Args:
+            output (Optional[str]): .json으로 끝나면 JSON 파일, 다른 경로면 텍스트 파일,
+                None이나 "1"/"text"면 표준 오류에 텍스트 표
+        """
+        if output and output.endswith(".json"):
+            with open(output, "w", encoding="utf-8") as file:
+                json.dump(self.to_dict(), file, ensure_ascii=False, indent=2)
+        elif output and output not in ("1", "text"):
+            with open(output, "w", encoding="utf-8") as file:
+                file.write(self.format_table() + "\n")
+        else:
+            print(self.format_table(), file=sys.stderr)
+
+
+# 켜져 있는 계측기 (None이면 계측하지 않음, Game.make_move가 매번 확인)
+profiler: Optional[PhaseProfiler] = None
+_output: Optional[str] = None
+_registered = False
+
+
+def enable(output: Optional[str] = None) -> PhaseProfiler:
+    """
+    계측을 켜고 프로그램 종료 시 출력하도록 등록합니다.
+    
+    Args:
+        output (Optional[str]): 종료 시 출력 위치 (PhaseProfiler.dump 참고)
+    
+    Returns:
+        PhaseProfiler: 켜진 계측기
+    """
+    global profiler, _output, _registered
+    if profiler is None:
+        profiler = PhaseProfiler()
+    _output = output
+    if not _registered:
+        atexit.register(_dump_at_exit)
+        _registered = True
+    return profiler
+
+
+def disable():
+    """계측을 끕니다 (모은 통계는 종료 시 출력하지 않음)."""
+    global profiler
+    profiler = None
+
+
+def _dump_at_exit():
+    """종료 시 모은 통계가 있으면 출력합니다."""
+    if profiler is not None and profiler.phases:
+        profiler.dump(_output)
+
+
+if os.environ.get("OMOK_PROFILE"):
+    enable(os.environ["OMOK_PROFILE"])
\ No newline at end of file
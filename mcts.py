@@ -0,0 +1,401 @@
+"""
+몬테카를로 트리 탐색(MCTS) 엔진
+프로세스 풀의 워커마다 독립적인 트리를 키운 뒤 루트 자식의 방문 수를 합치는
+루트 병렬화로 모든 코어를 사용합니다.
+"""
+
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from math import log, sqrt
+from typing import Optional, Tuple, List, Dict
+
+from board import Board, LineShape
+from engine import get_opponent_color
+from game import Game
+from opening_book import OpeningBook
+from player import StoneColor
+from sparse_board import SparseBoard
+
+
+# 무한 보드 롤아웃의 최대 수 (15x15 보드를 채우는 수와 같음)
+INFINITE_ROLLOUT_MOVES = 225
+
+
+class RolloutPolicy:
+    """롤아웃 정책을 정의하는 열거형"""
+    RANDOM = "random"     # 후보 수(돌 주변 빈칸) 중 무작위
+    PATTERN = "pattern"   # 5목 완성/막기를 우선하고 최근 수 주변에서 무작위
+
+
+class MCTSResult:
+    """MCTS 탐색 결과를 나타내는 클래스"""
+    
+    def __init__(self, move: Optional[Tuple[int, int]], visits: Dict[Tuple[int, int], int],
+                 wins: Dict[Tuple[int, int], float], playouts: int, elapsed: float):
+        """
+        탐색 결과 초기화
+        
+        Args:
+            move (Optional[Tuple[int, int]]): 가장 많이 방문한 수 (행, 열)
+            visits (Dict[Tuple[int, int], int]): 루트 자식별 방문 수 (모든 워커 합계)
+            wins (Dict[Tuple[int, int], float]): 루트 자식별 승리 수 (무승부는 0.5)
+            playouts (int): 전체 플레이아웃 수
+            elapsed (float): 탐색 시간 (초)
+        """
+        self.move = move
+        self.visits = visits
+        self.wins = wins
+        self.playouts = playouts
+        self.elapsed = elapsed
+    
+    @property
+    def playouts_per_second(self) -> float:
+        """초당 플레이아웃 수를 반환합니다."""
+        return self.playouts / self.elapsed if self.elapsed > 0 else 0.0
+    
+    def __str__(self) -> str:
+        """탐색 결과를 문자열로 반환합니다."""
+        visits = self.visits.get(self.move, 0)
+        rate = self.wins.get(self.move, 0) / visits if visits else 0.0
+        return (f"수: {self.move}, 방문: {visits}, 승률: {rate:.2f}, "
+                f"플레이아웃: {self.playouts}, 초당 플레이아웃: {self.playouts_per_second:.0f}")
+
+
+class _Node:
+    """탐색 트리 노드"""
+    
+    def __init__(self, move: Optional[Tuple[int, int]], parent: Optional["_Node"], stone_color: StoneColor):
+        """
+        노드 초기화
+        
+        Args:
+            move: 이 노드로 오는 수
+            parent: 부모 노드
+            stone_color: 이 수를 둔 돌 색상
+        """
+        self.move = move
+        self.parent = parent
+        self.stone_color = stone_color
+        self.children: List["_Node"] = []
+        self.untried: List[Tuple[int, int]] = []
+        self.visits = 0
+        self.wins = 0.0
+        self.winner: Optional[StoneColor] = None
+        self.terminal = False
+    
+    def select_child(self, exploration: float) -> "_Node":
+        """UCT 값이 가장 큰 자식을 고릅니다."""
+        log_visits = log(self.visits)
+        best_child = None
+        best_value = -1.0
+        for child in self.children:
+            value = child.wins / child.visits + exploration * sqrt(log_visits / child.visits)
+            if value > best_value:
+                best_value = value
+                best_child = child
+        return best_child
+
+
+class MCTSEngine:
+    """루트 병렬 MCTS 엔진"""
+    
+    def __init__(self, workers: Optional[int] = None, exploration: float = 1.4,
+                 rollout: str = RolloutPolicy.PATTERN, opening_book: Optional[OpeningBook] = None,
+                 rng: Optional[random.Random] = None):
+        """
+        엔진 초기화
+        
+        Args:
+            workers (Optional[int]): 워커 프로세스 수 (None이면 CPU 코어 수, 1이면 현재 프로세스에서 탐색)
+            exploration (float): UCT 탐험 계수
+            rollout (str): 롤아웃 정책 (RolloutPolicy 값)
+            opening_book (Optional[OpeningBook]): 탐색 전에 조회할 정석 북
+            rng (Optional[random.Random]): 탐색마다 워커 시드를 뽑을 난수 생성기 (None이면 전역 random 모듈)
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.exploration = exploration
+        self.rollout = rollout
+        self.opening_book = opening_book
+        self.rng = rng
+        self.last_result: Optional[MCTSResult] = None
+        self._executor: Optional[ProcessPoolExecutor] = None
+    
+    def choose_move(self, game: Game, time_limit_ms: int = 1000) -> Optional[Tuple[int, int]]:
+        """
+        게임의 현재 플레이어를 위한 수를 고릅니다.
+        
+        Args:
+            game (Game): 진행 중인 게임
+            time_limit_ms (int): 탐색 제한 시간 (밀리초)
+        
+        Returns:
+            Optional[Tuple[int, int]]: 최선의 수 (행, 열) 또는 둘 곳이 없으면 None
+        """
+        stone_color = game.get_current_player().get_stone_color()
+        return self.search(game.get_board(), stone_color, time_limit_ms).move
+    
+    def search(self, board: Board, stone_color: StoneColor, time_limit_ms: int = 1000) -> MCTSResult:
+        """
+        제한 시간 동안 MCTS를 실행합니다.
+        
+        Args:
+            board (Board): 탐색할 보드 (변경되지 않음)
+            stone_color (StoneColor): 둘 차례인 돌 색상
+            time_limit_ms (int): 탐색 제한 시간 (밀리초)
+        
+        Returns:
+            MCTSResult: 워커 결과를 합친 탐색 결과
+        """
+        start = time.perf_counter()
+        if self.opening_book is not None:
+            book_move = self.opening_book.best_move(board, stone_color)
+            if book_move is not None:
+                self.last_result = MCTSResult(book_move, {}, {}, 0, time.perf_counter() - start)
+                return self.last_result
+        
+        snapshot = board.snapshot()
+        sparse = isinstance(board, SparseBoard)
+        seed = (self.rng if self.rng is not None else random).getrandbits(32)
+        
+        if self.workers == 1:
+            partials = [_run_worker(board.size, snapshot, stone_color.value, time_limit_ms,
+                                    seed, self.exploration, self.rollout, sparse, board.frontier_distance)]
+        else:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            futures = [
+                self._executor.submit(_run_worker, board.size, snapshot, stone_color.value,
+                                      time_limit_ms, seed + worker, self.exploration, self.rollout, sparse,
+                                      board.frontier_distance)
+                for worker in range(self.workers)
+            ]
+            partials = [future.result() for future in futures]
+        
+        # 워커별 루트 통계 합치기
+        visits: Dict[Tuple[int, int], int] = {}
+        wins: Dict[Tuple[int, int], float] = {}
+        playouts = 0
+        for worker_visits, worker_wins, worker_playouts in partials:
+            for move, count in worker_visits.items():
+                visits[move] = visits.get(move, 0) + count
+                wins[move] = wins.get(move, 0.0) + worker_wins[move]
+            playouts += worker_playouts
+        
+        move = max(visits, key=visits.get) if visits else None
+        self.last_result = MCTSResult(move, visits, wins, playouts, time.perf_counter() - start)
+        return self.last_result
+    
+    def close(self):
+        """워커 프로세스 풀을 종료합니다."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def __enter__(self) -> "MCTSEngine":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _run_worker(size: Optional[int], snapshot, color_value: str, time_limit_ms: int,
+                seed: int, exploration: float, rollout: str, sparse: bool = False,
+                frontier_distance: int = 2) -> Tuple[Dict[Tuple[int, int], int], Dict[Tuple[int, int], float], int]:
+    """
+    워커 프로세스에서 보드를 복원하고 독립적인 트리를 탐색합니다.
+    
+    수를 다시 두지 않고 탐색하던 보드의 snapshot()을 그대로 restore합니다.
+    sparse가 참이면 탐색하던 보드와 같은 SparseBoard(size)로 복원합니다.
+    
+    Returns:
+        Tuple: (루트 자식별 방문 수, 루트 자식별 승리 수, 플레이아웃 수)
+    """
+    board = SparseBoard(size, frontier_distance) if sparse else Board(size, frontier_distance)
+    board.restore(snapshot)
+    
+    deadline = time.perf_counter() + time_limit_ms / 1000.0
+    root, playouts = _search_tree(board, StoneColor(color_value), deadline,
+                                  random.Random(seed), exploration, rollout)
+    
+    visits = {child.move: child.visits for child in root.children}
+    wins = {child.move: child.wins for child in root.children}
+    return visits, wins, playouts
+
+
+def _search_tree(board: Board, stone_color: StoneColor, deadline: float, rng: random.Random,
+                 exploration: float, rollout: str) -> Tuple[_Node, int]:
+    """
+    마감 시간까지 선택-확장-시뮬레이션-역전파를 반복합니다.
+    
+    Returns:
+        Tuple[_Node, int]: (루트 노드, 플레이아웃 수)
+    """
+    root = _Node(None, None, get_opponent_color(stone_color))
+    root.untried = _legal_candidates(board, stone_color)
+    if not root.untried:
+        return root, 0
+    
+    playouts = 0
+    while True:
+        node = root
+        placed = 0
+        
+        # 선택: 모든 수를 시도한 노드에서는 UCT로 자식을 고름
+        while not node.terminal and not node.untried and node.children:
+            node = node.select_child(exploration)
+            board.place_stone(node.move[0], node.move[1], node.stone_color)
+            placed += 1
+        
+        # 확장: 시도하지 않은 수 하나를 자식으로 추가
+        if not node.terminal and node.untried:
+            row, col = node.untried.pop(rng.randrange(len(node.untried)))
+            color = get_opponent_color(node.stone_color)
+            board.place_stone(row, col, color)
+            placed += 1
+            
+            child = _Node((row, col), node, color)
+            if board.check_win(row, col, color):
+                child.terminal = True
+                child.winner = color
+            else:
+                child.untried = _legal_candidates(board, get_opponent_color(color))
+                child.terminal = not child.untried
+            node.children.append(child)
+            node = child
+        
+        # 시뮬레이션
+        if node.terminal:
+            winner = node.winner
+        else:
+            winner = _rollout(board, get_opponent_color(node.stone_color), rng, rollout)
+        
+        for _ in range(placed):
+            board.undo_last_move()
+        
+        # 역전파: 각 노드는 그 수를 둔 쪽 기준으로 승리를 셈
+        while node is not None:
+            node.visits += 1
+            if winner is None:
+                node.wins += 0.5
+            elif winner == node.stone_color:
+                node.wins += 1.0
+            node = node.parent
+        
+        playouts += 1
+        if time.perf_counter() >= deadline:
+            return root, playouts
+
+
+def _legal_candidates(board: Board, stone_color: StoneColor) -> List[Tuple[int, int]]:
+    """
+    금수를 제외한 후보 수를 반환합니다.
+    
+    5목을 만들 수 있으면 그 수만, 상대의 5목을 막아야 하면 막는 수만 남겨
+    트리가 뻔한 수에 방문을 낭비하지 않게 합니다.
+    """
+    opponent_color = get_opponent_color(stone_color)
+    moves = []
+    blocks = []
+    for row, col in board.get_candidate_moves():
+        if board.check_forbidden(row, col, stone_color):
+            continue
+        if LineShape.FIVE in board.get_line_shapes(row, col, stone_color):
+            return [(row, col)]
+        if LineShape.FIVE in board.get_line_shapes(row, col, opponent_color):
+            blocks.append((row, col))
+        moves.append((row, col))
+    return blocks or moves
+
+
+def _rollout(board: Board, stone_color: StoneColor, rng: random.Random, policy: str) -> Optional[StoneColor]:
+    """
+    게임이 끝날 때까지 빠르게 두어 승자를 반환합니다. 끝나면 보드를 되돌립니다.
+    
+    Args:
+        board (Board): 보드
+        stone_color (StoneColor): 먼저 둘 돌 색상
+        rng (random.Random): 난수 생성기
+        policy (str): 롤아웃 정책
+    
+    Returns:
+        Optional[StoneColor]: 승자 색상 또는 무승부면 None
+    """
+    # 무한 보드는 프런티어가 비지 않으므로 수 제한으로 끝냄 (무승부)
+    max_moves = INFINITE_ROLLOUT_MOVES if board.size is None else board.size * board.size
+    placed = 0
+    winner = None
+    color = stone_color
+    
+    while placed < max_moves:
+        move = None
+        if policy == RolloutPolicy.PATTERN and board.last_move is not None:
+            move = _pattern_move(board, color, rng)
+        if move is None:
+            move = _random_candidate(board, color, rng)
+            if move is None:
+                break
+        
+        row, col = move
+        board.place_stone(row, col, color)
+        placed += 1
+        if board.check_win(row, col, color):
+            winner = color
+            break
+        color = get_opponent_color(color)
+    
+    for _ in range(placed):
+        board.undo_last_move()
+    return winner
+
+
+def _random_candidate(board: Board, stone_color: StoneColor, rng: random.Random) -> Optional[Tuple[int, int]]:
+    """
+    후보 수(프런티어) 중 금수가 아닌 칸 하나를 무작위로 고릅니다.
+    
+    보드 전체의 빈칸 대신 돌 주변만 보므로 큰 희소 보드에서도 한 수의 비용이 돌 수에 비례합니다.
+    """
+    candidates = board.get_candidate_moves()
+    while candidates:
+        index = rng.randrange(len(candidates))
+        row, col = candidates[index]
+        if not board.check_forbidden(row, col, stone_color):
+            return row, col
+        # 금수 칸은 목록 끝 칸과 바꿔 빼고 다시 고름
+        candidates[index] = candidates[-1]
+        candidates.pop()
+    return None
+
+
+def _pattern_move(board: Board, stone_color: StoneColor, rng: random.Random) -> Optional[Tuple[int, int]]:
+    """
+    5목 완성, 상대 5목 막기 순으로 수를 찾고, 없으면 최근 수 주변 빈칸 중 하나를 무작위로 고릅니다.
+    
+    5목은 자기 직전 수, 막을 곳은 상대 최근 수를 지나는 네 줄에서만 find_five로 찾으며,
+    금수 판정은 실제로 고른 수에만 합니다.
+    """
+    history = board.move_history
+    opponent_color = get_opponent_color(stone_color)
+    if len(history) >= 2:
+        own_row, own_col, _ = history[-2]
+        move = board.find_five(own_row, own_col, stone_color)
+        if move is not None and not board.check_forbidden(move[0], move[1], stone_color):
+            return move
+    
+    last_row, last_col = board.last_move
+    block = board.find_five(last_row, last_col, opponent_color)
+    if block is not None:
+        # 막는 자리가 금수면 롤아웃의 무작위 수로 넘김
+        return None if board.check_forbidden(block[0], block[1], stone_color) else block
+    
+    if rng.random() >= 0.5:
+        return None
+    nearby = [(row, col)
+              for row in range(last_row - 2, last_row + 3)
+              for col in range(last_col - 2, last_col + 3)
+              if board.is_empty(row, col)]
+    if not nearby:
+        return None
+    row, col = rng.choice(nearby)
+    return None if board.check_forbidden(row, col, stone_color) else (row, col)
\ No newline at end of file
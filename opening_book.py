@@ -0,0 +1,303 @@
+"""
+정석(오프닝) 북
+국면을 보드의 8가지 대칭(회전 4 x 뒤집기 2) 중 해시가 가장 작은 것으로 정규화해
+한 국면을 한 번만 저장합니다. 북 파일은 키 순으로 정렬된 고정 길이 항목 배열이며,
+메모리 맵으로 열어 파이썬 힙에 올리지 않고 이진 탐색으로 조회합니다.
+
+사용법:
+    python -m opening_book --output book.ombk games.omok more_games.omok
+
+파일 구조:
+    헤더: b"OMBK" + 버전(1바이트) + 보드 크기(1바이트) + 항목 수(4바이트)
+    항목: 정규화 해시(8바이트) + 정규화된 수의 칸 번호(2바이트) + 대국 수, 승리 수, 무승부 수(각 4바이트)
+"""
+
+import argparse
+import mmap
+import os
+import struct
+import sys
+from typing import Iterable, List, Optional, Tuple
+
+from board import Board
+from game import Game
+from game_record import GameResult, read_records
+from player import StoneColor
+
+
+MAGIC = b"OMBK"
+VERSION = 1
+_HEADER = struct.Struct("<4sBBI")
+_ENTRY = struct.Struct("<QHIII")
+
+# _transforms 순서의 각 대칭 변환에 대한 역변환 번호 (회전 90도와 270도만 서로 역변환)
+_INVERSE = (0, 3, 2, 1, 4, 5, 6, 7)
+
+
+def _transforms(size: int):
+    """8가지 대칭 변환 함수 목록을 반환합니다."""
+    last = size - 1
+    return (
+        lambda row, col: (row, col),
+        lambda row, col: (col, last - row),
+        lambda row, col: (last - row, last - col),
+        lambda row, col: (last - col, row),
+        lambda row, col: (row, last - col),
+        lambda row, col: (last - row, col),
+        lambda row, col: (col, row),
+        lambda row, col: (last - col, last - row),
+    )
+
+
+def canonical_hash(board: Board) -> Tuple[int, Tuple[int, ...]]:
+    """
+    8가지 대칭 변환 중 해시가 가장 작은 것을 국면의 정규화 해시로 반환합니다.
+    
+    빈 보드나 가운데 돌 하나처럼 대칭인 국면은 여러 변환이 같은 최소 해시를 내므로 모두 돌려주며,
+    수는 canonical_move로 그중 가장 작은 변환 결과를 골라 정규화합니다.
+    
+    Args:
+        board (Board): 보드
+    
+    Returns:
+        Tuple[int, Tuple[int, ...]]: (정규화 해시, 최소 해시를 내는 대칭 변환 번호들, 오름차순)
+    """
+    best_hash = None
+    best_symmetries = []
+    for symmetry, transform in enumerate(_transforms(board.size)):
+        position_hash = 0
+        for row, col, stone_color in board.move_history:
+            t_row, t_col = transform(row, col)
+            position_hash ^= board.zobrist_key(t_row, t_col, stone_color)
+        if best_hash is None or position_hash < best_hash:
+            best_hash = position_hash
+            best_symmetries = [symmetry]
+        elif position_hash == best_hash:
+            best_symmetries.append(symmetry)
+    return best_hash, tuple(best_symmetries)
+
+
+def canonical_move(size: int, symmetries: Tuple[int, ...], row: int, col: int) -> Tuple[int, int]:
+    """
+    canonical_hash가 돌려준 대칭 변환들로 수를 정규화합니다.
+    
+    대칭인 국면에서 서로 같은 수(예: 가운데 돌 옆의 네 칸)는 모두 같은 정규화된 수가 됩니다.
+    
+    Args:
+        size (int): 보드 크기
+        symmetries (Tuple[int, ...]): canonical_hash의 대칭 변환 번호들
+        row (int): 행 인덱스
+        col (int): 열 인덱스
+    
+    Returns:
+        Tuple[int, int]: 변환한 수 중 가장 작은 (행, 열)
+    """
+    transforms = _transforms(size)
+    return min(transforms[symmetry](row, col) for symmetry in symmetries)
+
+
+class BookMove:
+    """북에 기록된 수 하나를 나타내는 클래스"""
+    
+    def __init__(self, move: Tuple[int, int], games: int, wins: int, draws: int):
+        """
+        북 수 초기화
+        
+        Args:
+            move (Tuple[int, int]): 현재 보드 기준의 수 (행, 열)
+            games (int): 이 수가 나온 대국 수
+            wins (int): 이 수를 둔 쪽이 이긴 대국 수
+            draws (int): 무승부 대국 수
+        """
+        self.move = move
+        self.games = games
+        self.wins = wins
+        self.draws = draws
+    
+    @property
+    def score(self) -> float:
+        """이 수를 둔 쪽의 평균 점수 (승 1, 무 0.5)를 반환합니다."""
+        return (self.wins + 0.5 * self.draws) / self.games if self.games else 0.0
+    
+    def __repr__(self) -> str:
+        """북 수 객체의 표현을 반환합니다."""
+        return f"BookMove(move={self.move}, games={self.games}, wins={self.wins}, draws={self.draws})"
+
+
+class OpeningBook:
+    """메모리 맵으로 여는 읽기 전용 정석 북"""
+    
+    def __init__(self, path: str):
+        """
+        북 파일 열기
+        
+        Args:
+            path (str): 북 파일 경로
+        
+        Raises:
+            ValueError: 북 파일 형식이 아닌 경우
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.board_size, self.entry_count = _HEADER.unpack_from(self._data, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"정석 북 파일이 아닙니다: {path}")
+    
+    def lookup(self, board: Board) -> List[BookMove]:
+        """
+        현재 국면의 북 수를 대국 수가 많은 순서로 반환합니다.
+        
+        Args:
+            board (Board): 조회할 보드
+        
+        Returns:
+            List[BookMove]: 현재 보드 기준으로 되돌린 수 목록 (없으면 빈 목록)
+        """
+        if board.size != self.board_size:
+            return []
+        
+        # 정규화된 수는 어느 최소 변환으로 되돌려도 현재 국면에서 같은 수이므로 첫 변환을 씀
+        key, symmetries = canonical_hash(board)
+        inverse = _transforms(board.size)[_INVERSE[symmetries[0]]]
+        moves = []
+        index = self._lower_bound(key)
+        while index < self.entry_count:
+            entry_key, cell, games, wins, draws = self._entry(index)
+            if entry_key != key:
+                break
+            row, col = inverse(*divmod(cell, self.board_size))
+            moves.append(BookMove((row, col), games, wins, draws))
+            index += 1
+        
+        moves.sort(key=lambda book_move: book_move.games, reverse=True)
+        return moves
+    
+    def best_move(self, board: Board, stone_color: StoneColor, min_games: int = 1) -> Optional[Tuple[int, int]]:
+        """
+        둘 수 있는 북 수 중 평균 점수가 가장 높은 수를 반환합니다.
+        
+        Args:
+            board (Board): 조회할 보드
+            stone_color (StoneColor): 둘 차례인 돌 색상
+            min_games (int): 후보로 볼 최소 대국 수
+        
+        Returns:
+            Optional[Tuple[int, int]]: 북 수 (행, 열) 또는 없으면 None
+        """
+        candidates = [book_move for book_move in self.lookup(board)
+                      if book_move.games >= min_games
+                      and board.is_empty(*book_move.move)
+                      and not board.check_forbidden(book_move.move[0], book_move.move[1], stone_color)]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda book_move: (book_move.score, book_move.games)).move
+    
+    def lookup_game(self, game: Game) -> Optional[Tuple[int, int]]:
+        """게임의 현재 플레이어를 위한 북 수를 반환합니다."""
+        return self.best_move(game.get_board(), game.get_current_player().get_stone_color())
+    
+    def _entry(self, index: int) -> Tuple[int, int, int, int, int]:
+        """index번째 항목을 읽습니다."""
+        return _ENTRY.unpack_from(self._data, _HEADER.size + index * _ENTRY.size)
+    
+    def _lower_bound(self, key: int) -> int:
+        """키가 key 이상인 첫 항목의 번호를 이진 탐색으로 찾습니다."""
+        low, high = 0, self.entry_count
+        base = _HEADER.size
+        while low < high:
+            middle = (low + high) // 2
+            (entry_key,) = struct.unpack_from("<Q", self._data, base + middle * _ENTRY.size)
+            if entry_key < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+    
+    def close(self):
+        """북 파일을 닫습니다."""
+        self._data.close()
+        self._file.close()
+    
+    def __len__(self) -> int:
+        return self.entry_count
+    
+    def __enter__(self) -> "OpeningBook":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def build_book(archive_paths: Iterable[str], output_path: str, max_ply: int = 12,
+               min_games: int = 1, board_size: int = 15) -> int:
+    """
+    대국 기록 보관 파일들로 북을 만듭니다.
+    
+    각 대국의 처음 max_ply수까지, 두기 전 국면의 정규화 해시와 canonical_move로 정규화한 수를
+    키로 대국 수와 결과를 모읍니다.
+    
+    Args:
+        archive_paths (Iterable[str]): game_record 형식 보관 파일 경로들
+        output_path (str): 만들 북 파일 경로
+        max_ply (int): 대국마다 북에 넣을 최대 수
+        min_games (int): 북에 남길 최소 대국 수
+        board_size (int): 북의 보드 크기 (다른 크기의 기록은 건너뜀)
+    
+    Returns:
+        int: 기록한 항목 수
+    """
+    stats = {}
+    board = Board(board_size)
+    
+    for path in archive_paths:
+        for record in read_records(path):
+            if record.board_size != board_size:
+                continue
+            board.reset()
+            stone_color = StoneColor.BLACK
+            for row, col in record.moves[:max_ply]:
+                key, symmetries = canonical_hash(board)
+                t_row, t_col = canonical_move(board_size, symmetries, row, col)
+                entry = stats.setdefault((key, t_row * board_size + t_col), [0, 0, 0])
+                entry[0] += 1
+                if record.result == GameResult.DRAW:
+                    entry[2] += 1
+                elif (record.result == GameResult.BLACK_WIN) == (stone_color == StoneColor.BLACK) \
+                        and record.result != GameResult.UNFINISHED:
+                    entry[1] += 1
+                
+                if not board.place_stone(row, col, stone_color):
+                    break
+                stone_color = StoneColor.WHITE if stone_color == StoneColor.BLACK else StoneColor.BLACK
+    
+    entries = sorted((key, cell, games, wins, draws)
+                     for (key, cell), (games, wins, draws) in stats.items() if games >= min_games)
+    
+    temporary_path = output_path + ".tmp"
+    with open(temporary_path, "wb") as output:
+        output.write(_HEADER.pack(MAGIC, VERSION, board_size, len(entries)))
+        for entry in entries:
+            output.write(_ENTRY.pack(*entry))
+    os.replace(temporary_path, output_path)
+    return len(entries)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="대국 기록 보관 파일로 정석 북을 만듭니다.")
+    parser.add_argument("archives", nargs="+", help="game_record 형식 보관 파일 경로")
+    parser.add_argument("--output", default="opening.ombk", help="북 파일 경로")
+    parser.add_argument("--max-ply", type=int, default=12, help="대국마다 북에 넣을 최대 수")
+    parser.add_argument("--min-games", type=int, default=1, help="북에 남길 최소 대국 수")
+    parser.add_argument("--board-size", type=int, default=15, help="보드 크기")
+    args = parser.parse_args(argv)
+    
+    count = build_book(args.archives, args.output, args.max_ply, args.min_games, args.board_size)
+    print(f"정석 북 생성 완료: {args.output} ({count}개 항목)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -15,6 +15,8 @@ class StoneColor(Enum):
 class Player:
     """오목 게임의 플레이어를 나타내는 클래스"""
     
+    __slots__ = ("name", "stone_color", "score")
+    
     def __init__(self, name: str, stone_color: StoneColor):
         """
         플레이어 초기화
@@ -0,0 +1,196 @@
+"""
+렌주 금수 규칙 표
+가운데 칸에 흑돌을 놓은 11칸 3진수 창(0: 빈칸, 1: 흑돌, 2: 백돌 또는 보드 밖)마다
+5목, 장목, 사의 수, 열린 삼 여부를 미리 계산해 둔 조회표를 제공합니다.
+표는 한 번 만든 뒤 디스크에 저장해 두므로 다음 실행부터는 파일을 읽기만 합니다.
+
+판정은 한 줄 안에서만 합니다. 열린 삼을 열린 사로 만드는 칸이 다시 금수인지는
+따지지 않으므로(재귀 판정 없음), 그런 드문 국면에서는 실제 렌주 규칙보다 엄격하게 판정합니다.
+
+저장 위치: OMOK_CACHE_DIR 환경 변수 또는 ~/.cache/omok
+"""
+
+import os
+from typing import Optional
+
+
+# 창 설정 (board.WINDOW_RADIUS와 같은 값이어야 함)
+RADIUS = 5
+_LENGTH = 2 * RADIUS + 1
+TABLE_SIZE = 3 ** _LENGTH
+
+# 표 값의 비트 구성
+FOUR_MASK = 0x03    # 이 줄의 사의 수 (0~2, 열린 사는 1)
+OPEN_THREE = 0x04   # 열린 삼 (한 수로 열린 사가 됨)
+OPEN_FOUR = 0x08    # 열린 사 (양쪽 어디에 두어도 5목)
+FIVE = 0x10         # 정확히 5목
+OVERLINE = 0x20     # 6목 이상 (장목)
+
+_CACHE_MAGIC = b"RJT1"
+_CACHE_NAME = "renju_table_v1.bin"
+
+_table: Optional[bytes] = None
+
+
+class ForbiddenType:
+    """흑의 금수 종류를 정의하는 열거형"""
+    DOUBLE_THREE = "double_three"   # 삼삼
+    DOUBLE_FOUR = "double_four"     # 사사
+    OVERLINE = "overline"           # 장목
+
+
+def _run(digits: list, index: int) -> tuple:
+    """index 칸을 지나는 연속된 흑돌 구간의 (시작, 끝) 칸 번호를 반환합니다."""
+    low = index
+    while low > 0 and digits[low - 1] == 1:
+        low -= 1
+    high = index
+    while high < _LENGTH - 1 and digits[high + 1] == 1:
+        high += 1
+    return low, high
+
+
+def _makes_five(digits: list, empty: int) -> bool:
+    """빈칸 empty에 흑돌을 두면 가운데 돌을 포함한 정확한 5목이 되는지 확인합니다."""
+    digits[empty] = 1
+    low, high = _run(digits, RADIUS)
+    digits[empty] = 0
+    return high - low == 4 and low <= empty <= high
+
+
+def _five_points(digits: list) -> list:
+    """두면 가운데 돌을 포함한 정확한 5목이 되는 빈칸 목록을 반환합니다."""
+    return [i for i in range(RADIUS - 4, RADIUS + 5)
+            if digits[i] == 0 and _makes_five(digits, i)]
+
+
+def _is_open_four(digits: list) -> bool:
+    """가운데 돌을 포함한 연속 4개의 양쪽 끝이 모두 5목 자리인지(열린 사) 확인합니다."""
+    low, high = _run(digits, RADIUS)
+    if high - low != 3 or low == 0 or high == _LENGTH - 1:
+        return False
+    return (digits[low - 1] == 0 and digits[high + 1] == 0
+            and _makes_five(digits, low - 1) and _makes_five(digits, high + 1))
+
+
+def classify(window: int) -> int:
+    """
+    가운데 칸이 흑돌인 창 코드 하나를 분류합니다.
+    
+    Args:
+        window (int): 3진수 창 코드
+    
+    Returns:
+        int: FOUR_MASK, OPEN_THREE, OPEN_FOUR, FIVE, OVERLINE 비트 조합
+    """
+    digits = [(window // 3 ** i) % 3 for i in range(_LENGTH)]
+    low, high = _run(digits, RADIUS)
+    length = high - low + 1
+    if length == 5:
+        return FIVE
+    if length > 5:
+        return OVERLINE
+    
+    if _is_open_four(digits):
+        return OPEN_FOUR | 1
+    fours = len(_five_points(digits))
+    if fours:
+        return min(fours, 2)
+    
+    # 한 수를 더 두어 열린 사가 되면 열린 삼
+    for i in range(RADIUS - 3, RADIUS + 4):
+        if digits[i] == 0:
+            digits[i] = 1
+            open_four = _is_open_four(digits)
+            digits[i] = 0
+            if open_four:
+                return OPEN_THREE
+    return 0
+
+
+def build_table() -> bytes:
+    """
+    가운데 칸이 흑돌인 모든 창의 분류표를 만듭니다.
+    
+    Returns:
+        bytes: 창 코드로 색인하는 TABLE_SIZE 바이트 표 (가운데가 흑돌이 아닌 코드는 0)
+    """
+    table = bytearray(TABLE_SIZE)
+    center = 3 ** RADIUS
+    for rest in range(3 ** (_LENGTH - 1)):
+        # 가운데 자리를 비운 10자리 숫자에 가운데 흑돌(1)을 끼워 넣음
+        window = (rest // center) * center * 3 + center + rest % center
+        table[window] = classify(window)
+    return bytes(table)
+
+
+def cache_path() -> str:
+    """표를 저장할 파일 경로를 반환합니다."""
+    directory = os.environ.get("OMOK_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "omok")
+    return os.path.join(directory, _CACHE_NAME)
+
+
+def get_table() -> bytes:
+    """
+    분류표를 반환합니다.
+    
+    프로세스에서 처음 호출할 때 디스크 캐시를 읽고, 없거나 손상되었으면 새로 만들어 저장합니다.
+    캐시를 쓸 수 없는 환경이면 메모리에만 둡니다.
+    """
+    global _table
+    if _table is not None:
+        return _table
+    
+    path = cache_path()
+    try:
+        with open(path, "rb") as cache_file:
+            data = cache_file.read()
+        if data[:len(_CACHE_MAGIC)] == _CACHE_MAGIC and len(data) == len(_CACHE_MAGIC) + TABLE_SIZE:
+            _table = data[len(_CACHE_MAGIC):]
+            return _table
+    except OSError:
+        pass
+    
+    _table = build_table()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+        with open(temporary_path, "wb") as cache_file:
+            cache_file.write(_CACHE_MAGIC + _table)
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+    return _table
+
+
+def forbidden_type(entries) -> Optional[str]:
+    """
+    흑돌을 놓은 칸의 네 방향 표 값으로 금수 종류를 판정합니다.
+    
+    5목이 하나라도 있으면 금수가 아닙니다 (승리가 우선).
+    
+    Args:
+        entries: 네 방향의 표 값
+    
+    Returns:
+        Optional[str]: ForbiddenType 값 또는 금수가 아니면 None
+    """
+    fours = 0
+    threes = 0
+    overline = False
+    for entry in entries:
+        if entry & FIVE:
+            return None
+        if entry & OVERLINE:
+            overline = True
+        fours += entry & FOUR_MASK
+        if entry & OPEN_THREE:
+            threes += 1
+    
+    if overline:
+        return ForbiddenType.OVERLINE
+    if fours >= 2:
+        return ForbiddenType.DOUBLE_FOUR
+    if threes >= 2:
+        return ForbiddenType.DOUBLE_THREE
+    return None
\ No newline at end of file
@@ -0,0 +1,280 @@
+"""
+GUI 없는 병렬 자가 대국 실행기
+game.Game으로 설정한 플레이어끼리 N판을 프로세스 풀에서 두고,
+끝난 대국 기록을 완료되는 순서대로 파일에 씁니다.
+
+사용법:
+    python -m selfplay --games 100 --black alphabeta:200 --white mcts:200 --output games.jsonl
+    python -m selfplay --games 100000 --format binary --output games.omok
+    python -m selfplay --games 10 --board-size 0 --black alphabeta:100 --white mcts:100
+    python -m selfplay --games 100 --black random --white random --profile profile.json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import Optional, Tuple, List
+
+import instrumentation
+from board import Board
+from game import Game, GameState
+from game_record import GameRecord, GameRecordWriter, GameResult
+from player import StoneColor
+from sparse_board import SparseBoard
+
+
+# 기록 결과 문자열 -> 바이너리 기록 결과
+_RECORD_RESULTS = {"black": GameResult.BLACK_WIN, "white": GameResult.WHITE_WIN, "draw": GameResult.DRAW,
+                   "unfinished": GameResult.UNFINISHED}
+
+
+class RandomPlayer:
+    """후보 수 중에서 무작위로 두는 플레이어"""
+    
+    def __init__(self, rng: Optional[random.Random] = None):
+        """
+        플레이어 초기화
+        
+        Args:
+            rng (Optional[random.Random]): 수를 고를 난수 생성기 (None이면 시드 없이 새로 만듦)
+        """
+        self.rng = rng if rng is not None else random.Random()
+    
+    def choose_move(self, game: Game, time_limit_ms: int = 0) -> Optional[Tuple[int, int]]:
+        """금수가 아닌 후보 수 중 하나를 무작위로 고릅니다."""
+        return _random_legal_move(game, self.rng)
+
+
+def create_player(spec: str, rng: Optional[random.Random] = None):
+    """
+    "종류[:제한시간ms]" 형식의 설정으로 플레이어를 만듭니다.
+    
+    Args:
+        spec (str): random, alphabeta:200, mcts:500 등
+        rng (Optional[random.Random]): random과 mcts 플레이어가 쓸 난수 생성기
+    
+    Returns:
+        Tuple[object, int]: (choose_move(game, time_limit_ms)를 가진 플레이어, 제한 시간)
+    """
+    kind, _, limit = spec.partition(":")
+    time_limit_ms = int(limit) if limit else 100
+    
+    if kind == "random":
+        return RandomPlayer(rng), time_limit_ms
+    if kind == "alphabeta":
+        from engine import AlphaBetaEngine
+        return AlphaBetaEngine(), time_limit_ms
+    if kind == "mcts":
+        from mcts import MCTSEngine
+        # 이미 워커 프로세스 안이므로 MCTS는 현재 프로세스에서만 탐색
+        return MCTSEngine(workers=1, rng=rng), time_limit_ms
+    raise ValueError(f"알 수 없는 플레이어 종류입니다: {spec}")
+
+
+def create_board(board_size: Optional[int] = 15, sparse: bool = False):
+    """
+    대국에 사용할 보드를 만듭니다.
+    
+    Args:
+        board_size (Optional[int]): 보드 크기 (None이면 무한 보드)
+        sparse (bool): 희소 보드를 사용할지 여부 (무한 보드는 항상 희소 보드)
+    
+    Returns:
+        Board 또는 SparseBoard: 새 보드
+    """
+    if sparse or board_size is None:
+        return SparseBoard(board_size)
+    return Board(board_size)
+
+
+def play_game(game_index: int, black_spec: str, white_spec: str, seed: int,
+              board_size: Optional[int] = 15, sparse: bool = False, profile: bool = False) -> dict:
+    """
+    대국 한 판을 두고 기록을 반환합니다.
+    
+    Args:
+        game_index (int): 대국 번호
+        black_spec (str): 흑 플레이어 설정
+        white_spec (str): 백 플레이어 설정
+        seed (int): 난수 시드
+        board_size (Optional[int]): 보드 크기 (None이면 무한 보드)
+        sparse (bool): 희소 보드를 사용할지 여부
+        profile (bool): make_move 단계별 계측 결과를 "profile" 키로 함께 반환할지 여부
+    
+    Returns:
+        dict: 대국 기록 (번호, 플레이어, 보드 크기, 결과, 수순, 소요 시간).
+            둘 수 있는 수가 없어 대국을 끝내지 못하면 결과는 "unfinished"이고 "error"에 사유를 담음
+    """
+    # 전역 random 상태를 건드리지 않도록 대국마다 난수 생성기를 따로 만들어 넘김
+    rng = random.Random(seed)
+    players = {
+        StoneColor.BLACK: create_player(black_spec, random.Random(seed)),
+        StoneColor.WHITE: create_player(white_spec, random.Random(seed + 1)),
+    }
+    
+    game = Game(black_spec, white_spec, create_board(board_size, sparse))
+    if profile:
+        # 워커 프로세스의 계측 결과는 대국마다 새로 모아 부모 프로세스로 돌려보냄
+        previous_profiler = instrumentation.profiler
+        instrumentation.profiler = instrumentation.PhaseProfiler()
+    start = time.perf_counter()
+    error = None
+    while not game.is_game_over():
+        stone_color = game.get_current_player().get_stone_color()
+        player, time_limit_ms = players[stone_color]
+        move = player.choose_move(game, time_limit_ms)
+        if move is None or not game.make_move(*move):
+            # 엔진이 둘 수 없는 수를 고르면 무작위 수로 대신함
+            move = _random_legal_move(game, rng)
+            if move is None or not game.make_move(*move):
+                # 무승부로 세면 결과 통계가 틀어지므로 끝나지 않은 대국으로 기록
+                error = f"{stone_color.value}이(가) 둘 수 있는 수가 없습니다 ({game.get_board().get_move_count()}수째)"
+                break
+    
+    if error is not None:
+        result = "unfinished"
+    elif game.get_game_state() == GameState.WIN:
+        result = game.get_winner().get_stone_color().value
+    else:
+        result = "draw"
+    
+    record = {
+        "game": game_index,
+        "black": black_spec,
+        "white": white_spec,
+        "board_size": board_size,
+        "result": result,
+        "moves": [[row, col] for row, col, _ in game.get_board().move_history],
+        "seconds": round(time.perf_counter() - start, 4),
+    }
+    if error is not None:
+        record["error"] = error
+    if profile:
+        record["profile"] = instrumentation.profiler.to_dict()
+        instrumentation.profiler = previous_profiler
+    return record
+
+
+def run_selfplay(games: int, black_spec: str, white_spec: str, output_path: str,
+                 workers: Optional[int] = None, seed: int = 0, swap_colors: bool = False,
+                 output_format: str = "jsonl", board_size: Optional[int] = 15, sparse: bool = False) -> dict:
+    """
+    자가 대국을 병렬로 실행하고 끝난 대국을 바로 파일에 씁니다.
+    
+    Args:
+        games (int): 대국 수
+        black_spec (str): 흑 플레이어 설정
+        white_spec (str): 백 플레이어 설정
+        output_path (str): 기록 파일 경로
+        workers (Optional[int]): 워커 프로세스 수 (None이면 CPU 코어 수)
+        seed (int): 기본 난수 시드
+        swap_colors (bool): 홀수 번째 대국에서 흑백을 바꿀지 여부
+        output_format (str): "jsonl" (JSON Lines) 또는 "binary" (game_record 형식)
+        board_size (Optional[int]): 보드 크기 (None이면 무한 보드, 바이너리 형식은 255 이하만 가능)
+        sparse (bool): 희소 보드를 사용할지 여부
+    
+    Returns:
+        dict: 대국 수, 수 수, 결과별 횟수, 초당 대국/수
+    """
+    workers = workers or os.cpu_count() or 1
+    profiler = instrumentation.profiler  # 켜져 있으면 워커의 계측 결과를 여기에 합침
+    start = time.perf_counter()
+    summary = {"games": 0, "moves": 0, "black": 0, "white": 0, "draw": 0, "unfinished": 0}
+    
+    if output_format == "binary":
+        if board_size is None or board_size > 255:
+            raise ValueError("바이너리 기록은 255 이하 크기의 보드만 지원합니다.")
+        output = GameRecordWriter(output_path)
+    else:
+        output = open(output_path, "w", encoding="utf-8")
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor, output:
+        pending = set()
+        next_game = 0
+        while next_game < games or pending:
+            # 동시에 진행 중인 대국 수를 워커 수의 두 배로 제한
+            while next_game < games and len(pending) < workers * 2:
+                black, white = black_spec, white_spec
+                if swap_colors and next_game % 2 == 1:
+                    black, white = white, black
+                pending.add(executor.submit(play_game, next_game, black, white, seed + 2 * next_game,
+                                            board_size, sparse, profiler is not None))
+                next_game += 1
+            
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                record = future.result()
+                if profiler is not None:
+                    profiler.merge(record.pop("profile"))
+                if "error" in record:
+                    print(f"대국 {record['game']} 미완료: {record['error']}", file=sys.stderr)
+                if output_format == "binary":
+                    output.write(GameRecord(board_size, record["black"], record["white"],
+                                            _RECORD_RESULTS[record["result"]],
+                                            [tuple(move) for move in record["moves"]]))
+                else:
+                    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                output.flush()
+                
+                summary["games"] += 1
+                summary["moves"] += len(record["moves"])
+                summary[record["result"]] += 1
+    
+    elapsed = time.perf_counter() - start
+    summary["seconds"] = round(elapsed, 3)
+    summary["games_per_second"] = summary["games"] / elapsed if elapsed > 0 else 0.0
+    summary["moves_per_second"] = summary["moves"] / elapsed if elapsed > 0 else 0.0
+    return summary
+
+
+def _random_legal_move(game: Game, rng: random.Random) -> Optional[Tuple[int, int]]:
+    """금수가 아닌 후보 수 중 하나를 무작위로 반환합니다."""
+    board = game.get_board()
+    stone_color = game.get_current_player().get_stone_color()
+    for moves in (board.get_candidate_moves(), board.get_available_moves()):
+        legal = [move for move in moves if not board.check_forbidden(move[0], move[1], stone_color)]
+        if legal:
+            return rng.choice(legal)
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="GUI 없이 자가 대국을 병렬로 실행합니다.")
+    parser.add_argument("--games", type=int, default=10, help="대국 수")
+    parser.add_argument("--black", default="alphabeta:100", help="흑 플레이어 (random, alphabeta[:ms], mcts[:ms])")
+    parser.add_argument("--white", default="alphabeta:100", help="백 플레이어 (random, alphabeta[:ms], mcts[:ms])")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본값: CPU 코어 수)")
+    parser.add_argument("--output", default="selfplay.jsonl", help="기록 파일 경로")
+    parser.add_argument("--format", choices=("jsonl", "binary"), default="jsonl",
+                        help="기록 형식 (jsonl 또는 game_record 바이너리)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--swap-colors", action="store_true", help="대국마다 흑백을 번갈아 바꿈")
+    parser.add_argument("--board-size", type=int, default=15, help="보드 크기 (0이면 무한 보드)")
+    parser.add_argument("--sparse", action="store_true", help="희소 보드(SparseBoard) 사용")
+    parser.add_argument("--profile", metavar="PATH",
+                        help="make_move 단계별 계측 결과를 종료 시 저장 (.json이면 JSON, text면 표준 오류)")
+    args = parser.parse_args(argv)
+    if args.profile:
+        instrumentation.enable(args.profile)
+    
+    board_size = args.board_size or None
+    if args.format == "binary" and (board_size is None or board_size > 255):
+        parser.error("바이너리 기록은 255 이하 크기의 보드만 지원합니다.")
+    
+    print(f"자가 대국 시작: {args.games}판, 흑 {args.black} / 백 {args.white}")
+    summary = run_selfplay(args.games, args.black, args.white, args.output,
+                           args.workers, args.seed, args.swap_colors, args.format,
+                           board_size, args.sparse)
+    print(f"완료: {summary['games']}판, {summary['moves']}수, {summary['seconds']}초 "
+          f"(흑 {summary['black']}승 / 백 {summary['white']}승 / 무 {summary['draw']} / 미완료 {summary['unfinished']})")
+    print(f"초당 대국: {summary['games_per_second']:.2f}, 초당 수: {summary['moves_per_second']:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
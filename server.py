@@ -0,0 +1,518 @@
+"""
+asyncio 대국 서버
+한 프로세스, 한 이벤트 루프에서 방 번호별 game.Game 대국을 여러 개 호스팅합니다.
+연결마다 스레드를 만들지 않으며, 수는 Game.make_move로 검증한 뒤
+같은 방의 두 플레이어와 관전자에게 변경분만 보냅니다.
+
+프로토콜: 한 줄에 JSON 객체 하나 (UTF-8, 줄바꿈으로 구분)
+    클라이언트 -> 서버
+        {"op": "join", "room": "r1", "name": "철수", "role": "player"}   role: player 또는 observer
+        {"op": "move", "row": 7, "col": 7}
+        {"op": "undo"}                                          마지막 수를 둔 플레이어만 무를 수 있음
+        {"op": "new_game"}
+        {"op": "leave"}
+        {"op": "ping", "id": 1}
+    서버 -> 클라이언트
+        {"type": "joined", "room": ..., "color": "black"|"white"|null, "moves": [...], "state": ..., "turn": ...}
+        {"type": "move", "room": ..., "row": ..., "col": ..., "color": ..., "state": ..., "turn": ..., "winner": ...}
+        {"type": "undo", "room": ..., "row": ..., "col": ..., "turn": ...}
+        {"type": "new_game", "room": ..., "turn": ...}
+        {"type": "presence", "room": ..., "players": {...}, "observers": n}
+        {"type": "pong", "id": ...}
+        {"type": "error", "message": ...}
+
+사용법:
+    python -m server --port 8765
+    python -m server --port 8765 --load-test 1000
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import random
+import sys
+import time
+from typing import Dict, List, Optional, Set
+
+from game import Game
+from player import StoneColor
+
+
+# 한 줄의 최대 길이 (바이트)
+MAX_LINE = 4096
+
+
+class Room:
+    """대국 하나와 그 참가자를 나타내는 클래스"""
+    
+    __slots__ = ("room_id", "game", "players", "observers")
+    
+    def __init__(self, room_id: str):
+        """
+        방 초기화
+        
+        Args:
+            room_id (str): 방 번호
+        """
+        self.room_id = room_id
+        self.game = Game("흑", "백")
+        self.players: Dict[StoneColor, "Connection"] = {}
+        self.observers: Set["Connection"] = set()
+    
+    def members(self) -> List["Connection"]:
+        """방의 모든 연결(플레이어와 관전자)을 반환합니다."""
+        return list(self.players.values()) + list(self.observers)
+    
+    def is_empty(self) -> bool:
+        """참가자가 없는지 확인합니다."""
+        return not self.players and not self.observers
+
+
+class Connection:
+    """클라이언트 연결 하나를 나타내는 클래스"""
+    
+    __slots__ = ("writer", "name", "room", "color")
+    
+    def __init__(self, writer: asyncio.StreamWriter):
+        """
+        연결 초기화
+        
+        Args:
+            writer (asyncio.StreamWriter): 응답을 쓸 스트림
+        """
+        self.writer = writer
+        self.name = ""
+        self.room: Optional[Room] = None
+        self.color: Optional[StoneColor] = None
+    
+    def send(self, message: dict):
+        """메시지를 한 줄의 JSON으로 보냅니다 (버퍼에 쓰기만 하고 기다리지 않음)."""
+        if not self.writer.is_closing():
+            self.writer.write(json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode() + b"\n")
+
+
+class GameServer:
+    """방 번호별로 Game을 호스팅하는 asyncio TCP 서버"""
+    
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765):
+        """
+        서버 초기화
+        
+        Args:
+            host (str): 바인드할 주소
+            port (int): 바인드할 포트 (0이면 임의 포트)
+        """
+        self.host = host
+        self.port = port
+        self.rooms: Dict[str, Room] = {}
+        # 요청 종류별 서버 내 처리 시간(초) 기록 (None이면 재지 않음, 부하 시험에서 켬)
+        self.latencies: Optional[Dict[str, List[float]]] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+    
+    async def start(self):
+        """서버를 시작합니다 (실제 포트는 self.port에 기록)."""
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port, limit=MAX_LINE)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def serve_forever(self):
+        """서버를 시작하고 종료될 때까지 실행합니다."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+    
+    async def close(self):
+        """서버를 종료합니다."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """연결 하나의 요청을 줄 단위로 처리합니다."""
+        connection = Connection(writer)
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    connection.send({"type": "error", "message": "요청이 너무 깁니다."})
+                    break
+                if not line:
+                    break
+                
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    connection.send({"type": "error", "message": "JSON 형식이 아닙니다."})
+                    continue
+                if not isinstance(request, dict):
+                    connection.send({"type": "error", "message": "JSON 객체가 아닙니다."})
+                    continue
+                
+                if self.latencies is None:
+                    self.handle_request(connection, request)
+                else:
+                    start = time.perf_counter()
+                    self.handle_request(connection, request)
+                    self.latencies.setdefault(str(request.get("op")), []).append(time.perf_counter() - start)
+                # 보낼 데이터가 쌓였을 때만 흐름 제어를 기다림
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._leave(connection)
+            writer.close()
+    
+    def handle_request(self, connection: Connection, request: dict):
+        """
+        요청 하나를 처리합니다.
+        
+        Args:
+            connection (Connection): 요청한 연결
+            request (dict): 요청 메시지
+        """
+        op = request.get("op")
+        if op == "move":
+            self._move(connection, request)
+        elif op == "ping":
+            connection.send({"type": "pong", "id": request.get("id")})
+        elif op == "join":
+            self._join(connection, request)
+        elif op == "undo":
+            self._undo(connection)
+        elif op == "new_game":
+            self._new_game(connection)
+        elif op == "leave":
+            self._leave(connection)
+        else:
+            connection.send({"type": "error", "message": f"알 수 없는 요청입니다: {op}"})
+    
+    def _join(self, connection: Connection, request: dict):
+        """방에 플레이어나 관전자로 들어갑니다."""
+        room_id = str(request.get("room", ""))
+        if not room_id:
+            connection.send({"type": "error", "message": "방 번호가 없습니다."})
+            return
+        
+        self._leave(connection)
+        room = self.rooms.get(room_id)
+        if room is None:
+            room = self.rooms[room_id] = Room(room_id)
+        connection.name = str(request.get("name", ""))[:32]
+        connection.room = room
+        
+        if request.get("role", "player") == "player":
+            for color in (StoneColor.BLACK, StoneColor.WHITE):
+                if color not in room.players:
+                    room.players[color] = connection
+                    connection.color = color
+                    break
+        if connection.color is None:
+            room.observers.add(connection)
+        
+        game = room.game
+        connection.send({
+            "type": "joined",
+            "room": room_id,
+            "color": connection.color.value if connection.color else None,
+            "moves": [[row, col] for row, col, _ in game.get_board().move_history],
+            "state": game.get_game_state(),
+            "turn": game.get_current_player().get_stone_color().value,
+        })
+        self._broadcast_presence(room)
+    
+    def _move(self, connection: Connection, request: dict):
+        """수를 검증해 두고 방 전체에 알립니다."""
+        room = connection.room
+        if room is None or connection.color is None:
+            connection.send({"type": "error", "message": "대국 중인 플레이어가 아닙니다."})
+            return
+        
+        game = room.game
+        if game.get_current_player().get_stone_color() != connection.color:
+            connection.send({"type": "error", "message": "차례가 아닙니다."})
+            return
+        
+        row, col = request.get("row"), request.get("col")
+        # bool은 int의 하위 클래스이므로 따로 거부
+        if any(not isinstance(value, int) or isinstance(value, bool) for value in (row, col)):
+            connection.send({"type": "error", "message": "좌표는 정수여야 합니다.", "row": row, "col": col})
+            return
+        if not game.make_move(row, col):
+            message = {"type": "error", "message": "둘 수 없는 곳입니다.", "row": row, "col": col}
+            # make_move가 이번 수를 금수로 거부한 경우에만 금수 종류를 붙임
+            if game.last_forbidden:
+                message["forbidden"] = game.last_forbidden
+            connection.send(message)
+            return
+        
+        winner = game.get_winner()
+        self._broadcast(room, {
+            "type": "move",
+            "room": room.room_id,
+            "row": row,
+            "col": col,
+            "color": connection.color.value,
+            "state": game.get_game_state(),
+            "turn": game.get_current_player().get_stone_color().value,
+            "winner": winner.get_stone_color().value if winner else None,
+        })
+    
+    def _undo(self, connection: Connection):
+        """마지막 수를 무르고 방 전체에 알립니다 (마지막 수를 둔 플레이어만 무를 수 있음)."""
+        room = connection.room
+        if room is None or connection.color is None:
+            connection.send({"type": "error", "message": "대국 중인 플레이어가 아닙니다."})
+            return
+        
+        game = room.game
+        history = game.get_board().move_history
+        if history and history[-1][2] != connection.color:
+            connection.send({"type": "error", "message": "상대의 수는 무를 수 없습니다."})
+            return
+        last_move = game.get_last_move()
+        if not game.undo_move():
+            connection.send({"type": "error", "message": "무를 수 없습니다."})
+            return
+        self._broadcast(room, {
+            "type": "undo",
+            "room": room.room_id,
+            "row": last_move[0],
+            "col": last_move[1],
+            "turn": game.get_current_player().get_stone_color().value,
+        })
+    
+    def _new_game(self, connection: Connection):
+        """방의 대국을 새로 시작하고 방 전체에 알립니다."""
+        room = connection.room
+        if room is None or connection.color is None:
+            connection.send({"type": "error", "message": "대국 중인 플레이어가 아닙니다."})
+            return
+        room.game.reset_game()
+        self._broadcast(room, {"type": "new_game", "room": room.room_id, "turn": StoneColor.BLACK.value})
+    
+    def _leave(self, connection: Connection):
+        """연결을 방에서 내보내고, 빈 방은 지웁니다."""
+        room = connection.room
+        if room is None:
+            return
+        if connection.color is not None and room.players.get(connection.color) is connection:
+            del room.players[connection.color]
+        room.observers.discard(connection)
+        connection.room = None
+        connection.color = None
+        
+        if room.is_empty():
+            self.rooms.pop(room.room_id, None)
+        else:
+            self._broadcast_presence(room)
+    
+    def _broadcast_presence(self, room: Room):
+        """방의 참가자 목록을 방 전체에 알립니다."""
+        self._broadcast(room, {
+            "type": "presence",
+            "room": room.room_id,
+            "players": {color.value: member.name for color, member in room.players.items()},
+            "observers": len(room.observers),
+        })
+    
+    def _broadcast(self, room: Room, message: dict):
+        """메시지를 한 번만 직렬화해 방의 모든 연결에 보냅니다."""
+        data = json.dumps(message, ensure_ascii=False, separators=(",", ":")).encode() + b"\n"
+        for member in room.members():
+            if not member.writer.is_closing():
+                member.writer.write(data)
+
+
+async def run_load_test(host: str, port: int, games: int, moves_per_game: int = 20,
+                        think_ms: float = 200.0, room_prefix: str = "load-", barrier=None) -> dict:
+    """
+    플레이어 두 명씩 games개의 방에 접속해 동시에 두고, 수 왕복 시간 분포를 잽니다.
+    
+    왕복 시간은 수를 보낸 뒤 자기 연결로 그 수의 move 알림을 받을 때까지의 시간입니다.
+    수 사이에 0~2 * think_ms 밀리초를 무작위로 쉬어 대국들의 수가 한꺼번에 몰리지 않게 합니다
+    (0이면 모든 대국이 쉬지 않고 둠).
+    
+    Args:
+        host (str): 서버 주소
+        port (int): 서버 포트
+        games (int): 동시 대국 수
+        moves_per_game (int): 대국마다 둘 수 (5목이 나오지 않도록 흩어서 둠)
+        think_ms (float): 수 사이의 평균 생각 시간 (밀리초)
+        room_prefix (str): 방 번호 앞에 붙일 문자열 (클라이언트 프로세스마다 다르게)
+        barrier: 여러 클라이언트 프로세스가 접속을 마친 뒤 함께 시작하기 위한 multiprocessing.Barrier
+    
+    Returns:
+        dict: 대국 수, 수 수, 소요 시간, 왕복 시간 p50/p99/최대 (밀리초), 왕복 시간 목록(latencies, 초)
+    """
+    latencies: List[float] = []
+    joined = 0
+    all_joined = asyncio.Event()
+    
+    async def read_until(reader: asyncio.StreamReader, message_type: str) -> dict:
+        while True:
+            message = json.loads(await reader.readline())
+            if message["type"] == message_type:
+                return message
+    
+    async def play(room_id: str):
+        streams = [await asyncio.open_connection(host, port, limit=MAX_LINE) for _ in range(2)]
+        for index, (reader, writer) in enumerate(streams):
+            writer.write(json.dumps({"op": "join", "room": room_id, "name": f"p{index}"}).encode() + b"\n")
+            await read_until(reader, "joined")
+        
+        # 모든 대국이 접속을 마친 뒤 함께 시작 (접속 폭주가 왕복 시간에 섞이지 않도록)
+        nonlocal joined
+        joined += 1
+        if joined == games:
+            if barrier is not None:
+                await asyncio.get_running_loop().run_in_executor(None, barrier.wait)
+            all_joined.set()
+        await all_joined.wait()
+        
+        # 두 칸씩 띄워 두므로 어느 색도 5목을 만들지 않음
+        cells = [(row, col) for row in range(0, 15, 2) for col in range(0, 15, 3)]
+        rng = random.Random(room_id)
+        for number, (row, col) in enumerate(cells[:moves_per_game]):
+            if think_ms:
+                await asyncio.sleep(rng.uniform(0, 2 * think_ms) / 1000.0)
+            reader, writer = streams[number % 2]
+            start = time.perf_counter()
+            writer.write(json.dumps({"op": "move", "row": row, "col": col}).encode() + b"\n")
+            await read_until(reader, "move")
+            latencies.append(time.perf_counter() - start)
+            # 상대 연결의 알림도 읽어 버퍼를 비움
+            await read_until(streams[1 - number % 2][0], "move")
+        
+        for _, writer in streams:
+            writer.close()
+    
+    start = time.perf_counter()
+    await asyncio.gather(*(play(f"{room_prefix}{index}") for index in range(games)))
+    elapsed = time.perf_counter() - start
+    
+    summary = {"games": games, "moves": len(latencies), "seconds": round(elapsed, 3)}
+    summary.update(_percentiles(latencies))
+    summary["latencies"] = latencies
+    return summary
+
+
+def _percentiles(latencies: List[float]) -> dict:
+    """초 단위 시간 목록의 p50/p99/최대를 밀리초로 반환합니다."""
+    latencies = sorted(latencies)
+    
+    def percentile(ratio: float) -> float:
+        return round(latencies[min(len(latencies) - 1, int(len(latencies) * ratio))] * 1000, 3) if latencies else 0.0
+    
+    return {
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "max_ms": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+    }
+
+
+def _load_client_main(host: str, port: int, games: int, think_ms: float, room_prefix: str, barrier, results):
+    """클라이언트 프로세스 진입점: 맡은 대국을 두고 왕복 시간 목록을 results 큐에 넣습니다."""
+    try:
+        summary = asyncio.run(run_load_test(host, port, games, think_ms=think_ms,
+                                            room_prefix=room_prefix, barrier=barrier))
+        results.put(summary["latencies"])
+    except BaseException as error:
+        barrier.abort()
+        results.put(error)
+
+
+async def run_server_load_test(server: GameServer, games: int, think_ms: float = 200.0,
+                               client_processes: int = 2) -> dict:
+    """
+    서버를 이 프로세스에서 띄우고, 부하를 만드는 클라이언트는 별도 프로세스들에서 실행합니다.
+    
+    클라이언트의 JSON 처리와 소켓 읽기가 서버 이벤트 루프의 시간을 빼앗지 않으므로,
+    서버 안에서 잰 수 처리 시간(서버 측 p50/p99)과 클라이언트가 잰 왕복 시간을 함께 보고합니다.
+    코어가 클라이언트 프로세스 수보다 적으면 왕복 시간에는 여전히 프로세스 간 경쟁이 섞입니다.
+    
+    Args:
+        server (GameServer): 시작하지 않은 서버
+        games (int): 동시 대국 수 (클라이언트 프로세스들에 나눔)
+        think_ms (float): 수 사이의 평균 생각 시간 (밀리초)
+        client_processes (int): 클라이언트 프로세스 수
+    
+    Returns:
+        dict: 대국 수, 수 수, 소요 시간, 왕복 시간 p50/p99/최대, 서버 측 수 처리 시간 server_p50_ms/server_p99_ms/server_max_ms
+    
+    Raises:
+        RuntimeError: 클라이언트 프로세스가 실패한 경우
+    """
+    context = multiprocessing.get_context("spawn")
+    client_processes = max(1, min(client_processes, games))
+    barrier = context.Barrier(client_processes)
+    results = context.Queue()
+    
+    server.latencies = {}
+    await server.start()
+    loop = asyncio.get_running_loop()
+    processes = []
+    try:
+        for index in range(client_processes):
+            share = games // client_processes + (1 if index < games % client_processes else 0)
+            process = context.Process(target=_load_client_main, daemon=True,
+                                      args=(server.host, server.port, share, think_ms, f"load-{index}-",
+                                            barrier, results))
+            process.start()
+            processes.append(process)
+        
+        start = time.perf_counter()
+        latencies: List[float] = []
+        for _ in processes:
+            result = await loop.run_in_executor(None, results.get)
+            if isinstance(result, BaseException):
+                raise RuntimeError(f"부하 시험 클라이언트가 실패했습니다: {result!r}")
+            latencies += result
+        elapsed = time.perf_counter() - start
+    finally:
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        await server.close()
+    
+    summary = {"games": games, "moves": len(latencies), "seconds": round(elapsed, 3)}
+    summary.update(_percentiles(latencies))
+    summary.update({f"server_{key}": value for key, value in _percentiles(server.latencies.get("move", [])).items()})
+    server.latencies = None
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="여러 대국을 동시에 호스팅하는 asyncio 오목 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드할 주소")
+    parser.add_argument("--port", type=int, default=8765, help="바인드할 포트")
+    parser.add_argument("--load-test", type=int, metavar="GAMES", help="서버를 띄우고 GAMES개 동시 대국으로 부하 시험")
+    parser.add_argument("--think-ms", type=float, default=200.0, help="부하 시험에서 수 사이의 평균 생각 시간 (밀리초)")
+    parser.add_argument("--client-processes", type=int, default=2, help="부하 시험 클라이언트를 실행할 프로세스 수")
+    args = parser.parse_args(argv)
+    
+    server = GameServer(args.host, args.port)
+    if args.load_test:
+        server.port = 0
+        summary = asyncio.run(run_server_load_test(server, args.load_test, args.think_ms, args.client_processes))
+        print(f"{summary['games']}판 동시 대국, {summary['moves']}수, {summary['seconds']}초\n"
+              f"  서버 처리: p50 {summary['server_p50_ms']}ms / p99 {summary['server_p99_ms']}ms / "
+              f"최대 {summary['server_max_ms']}ms\n"
+              f"  왕복: p50 {summary['p50_ms']}ms / p99 {summary['p99_ms']}ms / 최대 {summary['max_ms']}ms")
+        return 0
+    
+    print(f"오목 서버 시작: {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,485 @@
+"""
+희소 오목판 클래스
+돌이 놓인 좌표만 딕셔너리에 저장하므로 메모리와 한 수당 비용이 보드 넓이가 아니라 돌 수에 비례합니다.
+19x19, 100x100 같은 큰 보드와 경계가 없는 무한 보드의 5목을 지원하며,
+game.Game과 엔진이 사용하는 Board의 인터페이스를 그대로 구현합니다.
+"""
+
+from typing import Dict, Optional, Tuple, List
+
+from board import DIRECTIONS, WINDOW_RADIUS, _SHAPE_CACHE, _classify_window, zobrist_table
+from player import StoneColor
+from renju import OPEN_THREE, forbidden_type, get_table
+
+
+# 조브리스트 키 생성 시드 (좌표를 해싱해 키를 만들므로 보드 크기와 무관)
+_ZOBRIST_SEED = 0x9E3779B97F4A7C15
+_MASK64 = (1 << 64) - 1
+_COLOR_INDEX = {StoneColor.BLACK: 0, StoneColor.WHITE: 1}
+
+
+def _mix64(value: int) -> int:
+    """splitmix64 마무리 함수로 64비트 값을 섞습니다."""
+    value = (value ^ (value >> 30)) * 0xBF58476D1CE4E5B9 & _MASK64
+    value = (value ^ (value >> 27)) * 0x94D049BB133111EB & _MASK64
+    return value ^ (value >> 31)
+
+
+class SparseBoard:
+    """좌표 딕셔너리로 돌을 저장하는 희소 오목판"""
+    
+    def __init__(self, size: Optional[int] = 19, frontier_distance: int = 2):
+        """
+        보드 초기화
+        
+        Args:
+            size (Optional[int]): 보드 크기 (None이면 경계가 없는 무한 보드, 좌표는 음수도 가능)
+            frontier_distance (int): 후보 수(프런티어)로 볼 돌과의 최대 거리 (기본값: 2)
+        """
+        self.size = size
+        self.frontier_distance = frontier_distance
+        self._neighbor_offsets = tuple(
+            (dr, dc)
+            for dr in range(-frontier_distance, frontier_distance + 1)
+            for dc in range(-frontier_distance, frontier_distance + 1)
+            if (dr, dc) != (0, 0)
+        )
+        # 크기가 정해진 보드는 Board와 같은 키 표를 써서 정석 북 등이 같은 해시를 보게 함 (무한 보드는 좌표 해싱)
+        self._zobrist = zobrist_table(size) if size is not None else None
+        self.reset()
+    
+    def is_valid_position(self, row: int, col: int) -> bool:
+        """
+        위치가 유효한지 확인합니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+        
+        Returns:
+            bool: 유효한 위치인지 여부 (무한 보드는 항상 True)
+        """
+        return self.size is None or (0 <= row < self.size and 0 <= col < self.size)
+    
+    def is_empty(self, row: int, col: int) -> bool:
+        """
+        해당 위치가 비어있는지 확인합니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+        
+        Returns:
+            bool: 비어있는지 여부
+        """
+        return self.is_valid_position(row, col) and (row, col) not in self._stones
+    
+    def place_stone(self, row: int, col: int, stone_color: StoneColor) -> bool:
+        """
+        돌을 배치합니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 돌 색상
+        
+        Returns:
+            bool: 배치 성공 여부
+        """
+        if not self.is_empty(row, col):
+            return False
+        
+        self._stones[(row, col)] = stone_color
+        self._hash ^= self.zobrist_key(row, col, stone_color)
+        
+        # 프런티어 갱신 (주변 칸의 돌 수만 셈)
+        self._frontier.discard((row, col))
+        counts = self._neighbor_counts
+        for dr, dc in self._neighbor_offsets:
+            cell = (row + dr, col + dc)
+            count = counts.get(cell, 0) + 1
+            counts[cell] = count
+            if count == 1 and cell not in self._stones and self.is_valid_position(*cell):
+                self._frontier.add(cell)
+        
+        self.last_move = (row, col)
+        self.move_history.append((row, col, stone_color))  # 이동 기록 추가
+        return True
+    
+    def get_stone(self, row: int, col: int) -> Optional[StoneColor]:
+        """
+        해당 위치의 돌을 반환합니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+        
+        Returns:
+            Optional[StoneColor]: 돌 색상 또는 None
+        """
+        return self._stones.get((row, col))
+    
+    def get_last_move(self) -> Optional[Tuple[int, int]]:
+        """마지막으로 놓은 돌의 위치를 반환합니다."""
+        return self.last_move
+    
+    def get_move_count(self) -> int:
+        """보드에 놓인 돌의 수를 반환합니다."""
+        return len(self.move_history)
+    
+    @property
+    def zobrist_hash(self) -> int:
+        """돌 배치의 64비트 조브리스트 해시를 반환합니다 (차례 정보는 포함하지 않음)."""
+        return self._hash
+    
+    @property
+    def side_to_move_key(self) -> int:
+        """백 차례일 때 해시에 XOR 하는 키를 반환합니다."""
+        if self._zobrist is not None:
+            return self._zobrist[0]
+        return _mix64(_ZOBRIST_SEED)
+    
+    def zobrist_key(self, row: int, col: int, stone_color: StoneColor) -> int:
+        """
+        해당 위치에 놓인 돌의 조브리스트 키를 반환합니다.
+        
+        크기가 정해진 보드는 같은 크기의 Board와 같은 키 표를 쓰고,
+        무한 보드는 키 표 없이 좌표와 색상을 해싱해 만듭니다.
+        """
+        if self._zobrist is not None:
+            return self._zobrist[1][row * self.size + col][_COLOR_INDEX[stone_color]]
+        value = ((row & 0xFFFFFFFF) << 32 | (col & 0xFFFFFFFF)) * 2 + _COLOR_INDEX[stone_color]
+        return _mix64((value + _ZOBRIST_SEED) & _MASK64)
+    
+    def check_win(self, row: int, col: int, stone_color: StoneColor) -> bool:
+        """
+        승리 조건을 확인합니다.
+        
+        (row, col)에 stone_color 돌이 있다고 보고 네 방향으로 연속된 돌을 셉니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 확인할 돌 색상
+        
+        Returns:
+            bool: 승리 여부
+        """
+        stones = self._stones
+        for dr, dc in DIRECTIONS:
+            count = 1
+            r, c = row + dr, col + dc
+            while stones.get((r, c)) == stone_color:
+                count += 1
+                r, c = r + dr, c + dc
+            r, c = row - dr, col - dc
+            while stones.get((r, c)) == stone_color:
+                count += 1
+                r, c = r - dr, c - dc
+            if count >= 5:
+                return True
+        return False
+    
+    def find_five(self, row: int, col: int, stone_color: StoneColor) -> Optional[Tuple[int, int]]:
+        """
+        (row, col)을 지나는 5칸 구간 중 stone_color 돌 넷과 빈칸 하나로 된 곳의 빈칸을 찾습니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 확인할 돌 색상
+        
+        Returns:
+            Optional[Tuple[int, int]]: 5목을 완성하는 빈칸 또는 None
+        """
+        stones = self._stones
+        for dr, dc in DIRECTIONS:
+            cells = [(row + k * dr, col + k * dc) for k in range(-4, 5)]
+            for start in range(5):
+                gaps = []
+                for r, c in cells[start:start + 5]:
+                    value = stones.get((r, c))
+                    if value is None and self.is_valid_position(r, c):
+                        gaps.append((r, c))
+                    elif value != stone_color:
+                        break
+                else:
+                    if len(gaps) == 1:
+                        return gaps[0]
+        return None
+    
+    def is_full(self) -> bool:
+        """
+        보드가 가득 찼는지 확인합니다.
+        
+        Returns:
+            bool: 보드가 가득 찬 여부 (무한 보드는 항상 False)
+        """
+        return self.size is not None and len(self._stones) == self.size * self.size
+    
+    def get_available_moves(self) -> List[Tuple[int, int]]:
+        """
+        가능한 모든 이동을 반환합니다.
+        
+        무한 보드에서는 모든 빈칸을 나열할 수 없으므로 후보 수(get_candidate_moves)를 반환합니다.
+        
+        Returns:
+            List[Tuple[int, int]]: 가능한 이동 목록
+        """
+        if self.size is None:
+            return self.get_candidate_moves()
+        stones = self._stones
+        return [(row, col) for row in range(self.size) for col in range(self.size)
+                if (row, col) not in stones]
+    
+    def get_candidate_moves(self) -> List[Tuple[int, int]]:
+        """
+        돌에서 frontier_distance 이내에 있는 빈칸을 후보 수로 반환합니다.
+        
+        Returns:
+            List[Tuple[int, int]]: 후보 수 목록 (빈 보드면 중앙 한 칸, 무한 보드의 중앙은 (0, 0))
+        """
+        if not self.move_history:
+            center = self.size // 2 if self.size is not None else 0
+            return [(center, center)]
+        return list(self._frontier)
+    
+    def _window_code(self, row: int, col: int, dr: int, dc: int, stone_color: StoneColor) -> int:
+        """
+        (row, col)을 가운데로 한 방향의 11칸 3진수 창 코드를 만듭니다.
+        
+        Board의 줄 인덱스와 같은 코드이며, 가운데 칸은 자기 돌로 둡니다.
+        """
+        stones = self._stones
+        size = self.size
+        window = 0
+        weight = 1
+        for k in range(-WINDOW_RADIUS, WINDOW_RADIUS + 1):
+            if k == 0:
+                digit = 1
+            else:
+                r, c = row + k * dr, col + k * dc
+                stone = stones.get((r, c))
+                if stone is None:
+                    inside = size is None or (0 <= r < size and 0 <= c < size)
+                    digit = 0 if inside else 2
+                else:
+                    digit = 1 if stone == stone_color else 2
+            window += digit * weight
+            weight *= 3
+        return window
+    
+    def get_line_shapes(self, row: int, col: int, stone_color: StoneColor) -> Tuple[int, int, int, int]:
+        """
+        해당 위치에 돌이 있다고 볼 때 네 방향의 줄 모양을 반환합니다.
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 확인할 돌 색상
+        
+        Returns:
+            Tuple[int, int, int, int]: DIRECTIONS 순서의 LineShape 값
+        """
+        shapes = []
+        for dr, dc in DIRECTIONS:
+            window = self._window_code(row, col, dr, dc, stone_color)
+            shape = _SHAPE_CACHE.get(window)
+            if shape is None:
+                shape = _classify_window(window)
+            shapes.append(shape)
+        return tuple(shapes)
+    
+    def check_double_three(self, row: int, col: int, stone_color: StoneColor) -> bool:
+        """
+        해당 위치에 돌을 놓으면 쌍삼이 되는지 확인합니다 (Board.check_double_three와 같은 규칙).
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 확인할 돌 색상
+        
+        Returns:
+            bool: 쌍삼 여부
+        """
+        if not self.is_empty(row, col):
+            return False
+        table = get_table()
+        threes = sum(1 for dr, dc in DIRECTIONS
+                     if table[self._window_code(row, col, dr, dc, stone_color)] & OPEN_THREE)
+        return threes >= 2
+    
+    def check_forbidden(self, row: int, col: int, stone_color: StoneColor) -> Optional[str]:
+        """
+        해당 위치가 렌주 규칙의 금수인지 확인합니다 (Board.check_forbidden과 같은 규칙).
+        
+        Args:
+            row (int): 행 인덱스
+            col (int): 열 인덱스
+            stone_color (StoneColor): 확인할 돌 색상
+        
+        Returns:
+            Optional[str]: ForbiddenType 값 또는 금수가 아니면 None
+        """
+        if stone_color != StoneColor.BLACK or not self.is_empty(row, col):
+            return None
+        table = get_table()
+        return forbidden_type([table[self._window_code(row, col, dr, dc, stone_color)]
+                               for dr, dc in DIRECTIONS])
+    
+    def clear_forbidden_cache(self):
+        """금수 판정 캐시를 비웁니다 (SparseBoard는 캐시하지 않으므로 아무것도 하지 않음)."""
+    
+    def get_forbidden_points(self) -> Dict[Tuple[int, int], str]:
+        """
+        흑의 금수 위치를 반환합니다.
+        
+        금수는 흑돌 주변에서만 생기므로 흑돌에서 WINDOW_RADIUS 이내의 네 줄 위 빈칸만 확인합니다.
+        
+        Returns:
+            Dict[Tuple[int, int], str]: (행, 열) -> ForbiddenType 값
+        """
+        cells = set()
+        for (row, col), stone in self._stones.items():
+            if stone != StoneColor.BLACK:
+                continue
+            for dr, dc in DIRECTIONS:
+                for k in range(-WINDOW_RADIUS + 1, WINDOW_RADIUS):
+                    cells.add((row + k * dr, col + k * dc))
+        
+        points = {}
+        for row, col in cells:
+            forbidden = self.check_forbidden(row, col, StoneColor.BLACK)
+            if forbidden:
+                points[(row, col)] = forbidden
+        return points
+    
+    def get_bounds(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        돌이 놓인 영역의 경계를 반환합니다.
+        
+        Returns:
+            Optional[Tuple[int, int, int, int]]: (최소 행, 최소 열, 최대 행, 최대 열) 또는 빈 보드면 None
+        """
+        if not self._stones:
+            return None
+        rows = [row for row, _ in self._stones]
+        cols = [col for _, col in self._stones]
+        return min(rows), min(cols), max(rows), max(cols)
+    
+    def reset(self):
+        """보드를 초기화합니다."""
+        self._stones: Dict[Tuple[int, int], StoneColor] = {}  # 돌이 놓인 좌표만 저장
+        self._hash = 0  # 조브리스트 해시
+        # 칸별로 frontier_distance 이내에 있는 돌의 수와, 그 수가 1 이상인 빈칸 집합
+        self._neighbor_counts: Dict[Tuple[int, int], int] = {}
+        self._frontier = set()
+        self.last_move = None
+        self.move_history = []  # 무르기를 위한 이동 기록
+    
+    def clone(self) -> "SparseBoard":
+        """
+        이동 기록과 해시까지 같은 독립된 보드를 만듭니다.
+        
+        Returns:
+            SparseBoard: 복사된 보드
+        """
+        board = SparseBoard.__new__(SparseBoard)
+        board.size = self.size
+        board.frontier_distance = self.frontier_distance
+        board._neighbor_offsets = self._neighbor_offsets
+        board._zobrist = self._zobrist
+        board._stones = self._stones.copy()
+        board._hash = self._hash
+        board._neighbor_counts = self._neighbor_counts.copy()
+        board._frontier = self._frontier.copy()
+        board.last_move = self.last_move
+        board.move_history = self.move_history[:]
+        return board
+    
+    def snapshot(self) -> tuple:
+        """
+        현재 상태를 저장합니다.
+        
+        Returns:
+            tuple: restore에 넘길 불투명한 스냅숏 (피클 가능)
+        """
+        return (self.size, self.frontier_distance, self._stones.copy(), self._hash,
+                self._neighbor_counts.copy(), frozenset(self._frontier), tuple(self.move_history))
+    
+    def restore(self, snapshot: tuple):
+        """
+        snapshot으로 저장한 상태로 되돌립니다. 같은 스냅숏을 여러 번 복원할 수 있습니다.
+        
+        Args:
+            snapshot (tuple): 같은 크기와 프런티어 거리의 보드에서 만든 스냅숏
+        
+        Raises:
+            ValueError: 보드 설정이 다른 경우
+        """
+        size, distance, stones, zobrist_hash, counts, frontier, history = snapshot
+        if size != self.size or distance != self.frontier_distance:
+            raise ValueError(f"스냅숏 보드 설정이 다릅니다: 크기 {size}, 프런티어 거리 {distance}")
+        self._stones = stones.copy()
+        self._hash = zobrist_hash
+        self._neighbor_counts = counts.copy()
+        self._frontier = set(frontier)
+        self.move_history = list(history)
+        self.last_move = (history[-1][0], history[-1][1]) if history else None
+    
+    def undo_last_move(self) -> Optional[Tuple[int, int, StoneColor]]:
+        """
+        마지막 이동을 되돌립니다.
+        
+        Returns:
+            Optional[Tuple[int, int, StoneColor]]: 되돌린 이동 정보 (행, 열, 돌색상) 또는 None
+        """
+        if not self.move_history:
+            return None
+        
+        last_move_info = self.move_history.pop()
+        row, col, stone_color = last_move_info
+        del self._stones[(row, col)]
+        self._hash ^= self.zobrist_key(row, col, stone_color)
+        
+        # 프런티어를 놓기 전 상태로 되돌림 (돌 수가 0이 된 칸은 딕셔너리에서 제거)
+        counts = self._neighbor_counts
+        for dr, dc in self._neighbor_offsets:
+            cell = (row + dr, col + dc)
+            count = counts[cell] - 1
+            if count:
+                counts[cell] = count
+            else:
+                del counts[cell]
+                self._frontier.discard(cell)
+        if counts.get((row, col)):
+            self._frontier.add((row, col))
+        
+        # last_move 업데이트
+        if self.move_history:
+            self.last_move = (self.move_history[-1][0], self.move_history[-1][1])
+        else:
+            self.last_move = None
+        
+        return last_move_info
+    
+    def get_board_state(self) -> List[List[Optional[StoneColor]]]:
+        """
+        현재 보드 상태를 반환합니다.
+        
+        무한 보드는 돌이 놓인 영역(get_bounds)만 반환합니다.
+        """
+        if self.size is not None:
+            top, left, bottom, right = 0, 0, self.size - 1, self.size - 1
+        else:
+            bounds = self.get_bounds()
+            if bounds is None:
+                return []
+            top, left, bottom, right = bounds
+        return [[self._stones.get((row, col)) for col in range(left, right + 1)]
+                for row in range(top, bottom + 1)]
+    
+    def __str__(self) -> str:
+        """보드 상태를 문자열로 반환합니다."""
+        symbols = {None: ".", StoneColor.BLACK: "●", StoneColor.WHITE: "○"}
+        return "\n".join(" ".join(symbols[cell] for cell in row) for row in self.get_board_state())
\ No newline at end of file
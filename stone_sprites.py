@@ -0,0 +1,112 @@
+"""
+돌 스프라이트 캐시
+Pillow로 그림자, 몸체, 하이라이트를 합친 안티에일리어싱 돌 이미지를 돌 반지름마다 한 번만 그려 두고,
+GUI는 돌 하나를 캔버스 이미지 항목 하나로 놓습니다 (타원 세 개 대신).
+
+Pillow가 설치되어 있지 않으면 PIL_AVAILABLE이 False이며, GUI는 기존 타원 그리기로 대신합니다.
+"""
+
+from functools import lru_cache
+from typing import Dict, Optional
+
+from player import StoneColor
+
+try:
+    from PIL import Image, ImageDraw, ImageFilter, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+# 고해상도로 그린 뒤 줄여서 가장자리를 부드럽게 만드는 배율
+SUPERSAMPLE = 4
+
+# 그림자 오프셋 (픽셀, 오른쪽 아래 방향)
+SHADOW_OFFSET = 2
+
+# 색상별 (몸체, 테두리, 하이라이트, 그림자) RGBA
+_STONE_STYLES = {
+    StoneColor.BLACK: ((0, 0, 0, 255), (26, 26, 26, 255), (110, 110, 110, 200), (40, 25, 10, 110)),
+    StoneColor.WHITE: ((228, 228, 226, 255), (190, 190, 190, 255), (255, 255, 255, 230), (40, 25, 10, 90)),
+}
+
+
+@lru_cache(maxsize=None)
+def render_stone(radius: int, stone_color: StoneColor) -> "Image.Image":
+    """
+    돌 하나의 RGBA 이미지를 그립니다 (반지름과 색상마다 한 번만 그림).
+    
+    이미지의 가운데가 돌의 중심이며, 그림자가 들어가도록 가장자리에 SHADOW_OFFSET만큼 여백을 둡니다.
+    
+    Args:
+        radius (int): 돌 반지름 (픽셀)
+        stone_color (StoneColor): 돌 색상
+    
+    Returns:
+        Image.Image: (2 * (radius + SHADOW_OFFSET) + 1) 크기의 정사각형 RGBA 이미지
+    """
+    body, outline, highlight, shadow = _STONE_STYLES[stone_color]
+    size = 2 * (radius + SHADOW_OFFSET) + 1
+    scale = SUPERSAMPLE
+    center = size * scale / 2
+    r = radius * scale
+    
+    # 그림자: 오른쪽 아래로 밀어 흐리게 그림
+    shadow_layer = Image.new("RGBA", (size * scale, size * scale), shadow[:3] + (0,))
+    offset = SHADOW_OFFSET * scale
+    ImageDraw.Draw(shadow_layer).ellipse(
+        (center - r + offset, center - r + offset, center + r + offset, center + r + offset), fill=shadow)
+    image = shadow_layer.filter(ImageFilter.GaussianBlur(scale))
+    
+    # 몸체와 테두리
+    draw = ImageDraw.Draw(image)
+    draw.ellipse((center - r, center - r, center + r, center + r), fill=body, outline=outline, width=2 * scale)
+    
+    # 하이라이트: 왼쪽 위에 흐린 작은 원
+    # 흐릴 때 가장자리가 어두워지지 않도록 투명 배경도 같은 색으로 채움
+    highlight_layer = Image.new("RGBA", image.size, highlight[:3] + (0,))
+    h = r / 3
+    hx, hy = center - r / 3, center - r / 3
+    ImageDraw.Draw(highlight_layer).ellipse((hx - h, hy - h, hx + h, hy + h), fill=highlight)
+    image = Image.alpha_composite(image, highlight_layer.filter(ImageFilter.GaussianBlur(h / 2)))
+    
+    return image.resize((size, size), Image.LANCZOS)
+
+
+class StoneSprites:
+    """캔버스에 놓을 돌 PhotoImage를 반지름별로 보관하는 캐시"""
+    
+    def __init__(self, master):
+        """
+        캐시 초기화
+        
+        Args:
+            master: PhotoImage를 소유할 Tk 위젯 (보통 캔버스)
+        """
+        self.master = master
+        self._images: Dict[tuple, "ImageTk.PhotoImage"] = {}
+    
+    def get(self, radius: int, stone_color: StoneColor) -> Optional["ImageTk.PhotoImage"]:
+        """
+        돌 이미지를 반환합니다.
+        
+        PhotoImage는 참조가 사라지면 캔버스에서도 지워지므로 캐시가 계속 들고 있습니다.
+        
+        Args:
+            radius (int): 돌 반지름 (픽셀)
+            stone_color (StoneColor): 돌 색상
+        
+        Returns:
+            Optional[ImageTk.PhotoImage]: 돌 이미지 (Pillow가 없으면 None)
+        """
+        if not PIL_AVAILABLE:
+            return None
+        key = (radius, stone_color)
+        image = self._images.get(key)
+        if image is None:
+            image = self._images[key] = ImageTk.PhotoImage(render_stone(radius, stone_color), master=self.master)
+        return image
+    
+    def clear(self):
+        """보관한 이미지를 모두 버립니다 (칸 크기가 바뀌었을 때)."""
+        self._images.clear()
\ No newline at end of file
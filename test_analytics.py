@@ -0,0 +1,51 @@
+"""
+대국 기록 병렬 분석 테스트
+"""
+
+import json
+
+import pytest
+
+from analytics import analyze_chunk, iter_records, run_analytics
+from game_record import GameRecordWriter, GameRecord, GameResult
+from selfplay import play_game
+
+
+# 마지막 흑 수 (7, 6)이 삼삼 금수로 거부되는 수순
+DOUBLE_THREE_MOVES = [(7, 5), (0, 0), (7, 8), (0, 2), (5, 6), (0, 4), (6, 6), (0, 6), (7, 6)]
+
+
+def make_archives(tmp_path):
+    """무작위 대국과 금수로 거부되는 대국을 바이너리 보관 파일과 JSON Lines 파일에 나눠 씁니다."""
+    records = []
+    for seed in range(40):
+        data = play_game(seed, "random", "random", seed)
+        result = {"black": GameResult.BLACK_WIN, "white": GameResult.WHITE_WIN}.get(data["result"], GameResult.DRAW)
+        records.append(GameRecord(15, "random", "random", result, [tuple(move) for move in data["moves"]]))
+    # 같은 오프닝이 여러 번 나오도록 일부를 되풀이하고, 흑의 삼삼 금수에서 멈추는 대국을 섞음
+    records += records[:10]
+    records += [GameRecord(15, "b", "w", GameResult.UNFINISHED, DOUBLE_THREE_MOVES)] * 3
+    
+    binary_path = str(tmp_path / "games.omok")
+    with GameRecordWriter(binary_path) as writer:
+        for record in records[::2]:
+            writer.write(record)
+    jsonl_path = str(tmp_path / "games.jsonl")
+    names = {GameResult.BLACK_WIN: "black", GameResult.WHITE_WIN: "white", GameResult.DRAW: "draw",
+             GameResult.UNFINISHED: "unfinished"}
+    with open(jsonl_path, "w", encoding="utf-8") as file:
+        for record in records[1::2]:
+            file.write(json.dumps({"board_size": 15, "result": names[record.result], "moves": record.moves}) + "\n")
+    return [binary_path, jsonl_path]
+
+
+@pytest.mark.parametrize("workers, chunk_size", [(1, 3), (2, 7), (3, 1000)])
+def test_chunked_totals_match_serial_pass(tmp_path, workers, chunk_size):
+    """묶음 크기와 워커 수와 관계없이 합친 통계가 모든 기록을 한 번에 분석한 결과와 같습니다."""
+    paths = make_archives(tmp_path)
+    serial = analyze_chunk([record for path in paths for record in iter_records(path)], opening_plies=2)
+    assert serial.games == 53 and serial.forbidden == {"double_three": 3}
+    
+    total, _ = run_analytics(paths, workers=workers, chunk_size=chunk_size, opening_plies=2)
+    assert total.openings == serial.openings
+    assert total.summary(top_openings=100) == serial.summary(top_openings=100)
\ No newline at end of file
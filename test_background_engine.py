@@ -0,0 +1,181 @@
+"""
+백그라운드 엔진의 미리 생각하기(ponder)와 세대 번호 처리 테스트
+
+워커 루프(_engine_main)를 프로세스 대신 스레드에서 돌리고 큐와 공유 값을 같은 프로세스의 객체로 바꿔,
+start_search/poll과 워커의 세대 번호, 적중, 이미 답한 요청 처리를 함께 확인합니다.
+"""
+
+import queue
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+import background_engine
+from background_engine import PONDER_TIME_LIMIT_MS, BackgroundEngine, _engine_main
+from engine import SearchResult
+from game import Game
+
+
+class LoggedQueue(queue.Queue):
+    """워커가 넣은 결과의 세대 번호를 순서대로 기록하는 큐"""
+    
+    def __init__(self):
+        super().__init__()
+        self.generations = []
+    
+    def put(self, item, block=True, timeout=None):
+        self.generations.append(item[0])
+        super().put(item, block, timeout)
+
+
+class ScriptedEngine:
+    """
+    워커가 부르는 AlphaBetaEngine 대신 쓰는 엔진
+    
+    일반 탐색은 첫 후보 수로 바로 답하고, 미리 생각하기 탐색은 should_stop이 참이 될 때까지 돌며,
+    예상 응수는 replies 목록에서 차례로 꺼냅니다 (다 쓰면 None).
+    """
+    
+    replies = []
+    calls = []
+    
+    def __init__(self, *options):
+        pass
+    
+    def search(self, board, stone_color, time_limit_ms, should_stop):
+        kind = "ponder" if time_limit_ms == PONDER_TIME_LIMIT_MS else "search"
+        self.calls.append((kind, board.get_move_count()))
+        while kind == "ponder" and not should_stop():
+            time.sleep(0.001)
+        return SearchResult(board.get_candidate_moves()[0], 0, 1, 1, 0.0)
+    
+    def predict_reply(self, board, stone_color, move):
+        return self.replies.pop(0) if self.replies else None
+
+
+def start_in_thread(engine, monkeypatch):
+    """engine.start가 워커 프로세스 대신 같은 프로세스의 스레드에서 _engine_main을 돌리게 합니다."""
+    def start():
+        if engine._process is not None:
+            return
+        engine._requests = queue.Queue()
+        engine._results = LoggedQueue()
+        engine._latest = SimpleNamespace(value=engine._generation)
+        engine._hit = SimpleNamespace(value=0)
+        engine._process = threading.Thread(
+            target=_engine_main, daemon=True,
+            args=(engine._requests, engine._results, engine._latest, engine._hit) + engine._engine_options)
+        engine._process.start()
+    monkeypatch.setattr(engine, "start", start)
+
+
+def wait_result(engine, timeout=10.0):
+    """poll이 결과를 돌려줄 때까지 기다립니다."""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        result = engine.poll()
+        if result is not None:
+            return result
+        time.sleep(0.005)
+    raise AssertionError("탐색 결과가 오지 않았습니다")
+
+
+def stop(engine):
+    """미리 생각하기를 취소하고 워커 스레드를 끝냅니다."""
+    engine.cancel()
+    engine._requests.put(None)
+    engine._process.join(timeout=10)
+    assert not engine._process.is_alive()
+
+
+# max_depth 2는 적중 전에 미리 생각하기가 끝나는 경우, 8은 미리 생각하는 도중에 적중하는 경우
+@pytest.mark.parametrize("max_depth", [2, 8])
+def test_ponder_hit_and_miss(monkeypatch, max_depth):
+    """적중하면 미리 생각한 탐색으로 한 번만 답하고, 실패하면 새 국면을 탐색합니다."""
+    engine = BackgroundEngine(time_limit_ms=100, max_depth=max_depth, max_branching=8, tt_size_bits=12, ponder=True)
+    start_in_thread(engine, monkeypatch)
+    game = Game()
+    assert game.make_move(7, 7)
+    
+    first = engine.start_search(game)
+    assert engine.thinking and not engine.pondering
+    result = wait_result(engine)
+    assert not engine.thinking and engine.pondering
+    
+    # 적중: 엔진의 수와 예상 응수를 그대로 둠
+    assert game.make_move(*result.move)
+    assert game.make_move(*engine.ponder_move)
+    time.sleep(0.2)
+    second = engine.start_search(game)
+    assert second == first + 1
+    assert (engine.ponder_hits, engine.ponder_misses) == (1, 0)
+    assert engine._hit.value == engine._latest.value == second
+    result = wait_result(engine)
+    assert game.board.is_empty(*result.move)
+    
+    # 실패: 예상 응수가 아닌 다른 후보 수를 둠
+    assert game.make_move(*result.move)
+    predicted = engine.ponder_move
+    reply = next(move for move in game.board.get_candidate_moves()
+                 if move != predicted and not game.board.check_forbidden(*move, game.get_current_player().get_stone_color()))
+    assert game.make_move(*reply)
+    third = engine.start_search(game)
+    assert (engine.ponder_hits, engine.ponder_misses) == (1, 1)
+    assert engine._hit.value == second
+    result = wait_result(engine)
+    assert game.board.is_empty(*result.move)
+    
+    stop(engine)
+    # 적중한 요청은 큐에서 다시 꺼내도 탐색하지 않으므로 세대마다 결과가 하나씩만 나옴
+    assert engine._results.generations == [first, second, third]
+
+
+def test_cancelled_and_stale_requests_are_dropped(monkeypatch):
+    """취소된 요청의 결과는 poll이 버리고, 새 요청의 결과만 돌려줍니다."""
+    engine = BackgroundEngine(time_limit_ms=50, max_depth=2, max_branching=8, tt_size_bits=12)
+    start_in_thread(engine, monkeypatch)
+    game = Game()
+    assert game.make_move(7, 7)
+    
+    first = engine.start_search(game)
+    engine.cancel()
+    assert not engine.thinking and engine.poll() is None
+    second = engine.start_search(game)
+    assert second == first + 2
+    result = wait_result(engine)
+    assert game.board.is_empty(*result.move) and not engine.pondering
+    
+    # 취소 전에 이미 끝난 이전 세대의 결과가 남아 있어도 무시함
+    engine._results.put((first, result, None))
+    third = engine.start_search(game)
+    assert wait_result(engine) is not None
+    assert engine._pending is None and engine._results.empty()
+    assert engine._results.generations[-1] == third
+    stop(engine)
+
+def test_hit_request_is_not_searched_again(monkeypatch):
+    """미리 생각하던 탐색으로 답한 적중 요청은 워커가 큐에서 꺼내도 다시 탐색하지 않습니다."""
+    monkeypatch.setattr(ScriptedEngine, "replies", [(0, 0), None])
+    monkeypatch.setattr(ScriptedEngine, "calls", [])
+    monkeypatch.setattr(background_engine, "AlphaBetaEngine", ScriptedEngine)
+    engine = BackgroundEngine(time_limit_ms=20, ponder=True)
+    start_in_thread(engine, monkeypatch)
+    game = Game()
+    assert game.make_move(7, 7)
+    
+    first = engine.start_search(game)
+    result = wait_result(engine)
+    assert engine.ponder_move == (0, 0)
+    assert game.make_move(*result.move) and game.make_move(0, 0)
+    second = engine.start_search(game)
+    wait_result(engine)
+    # 두 번째 예상 응수가 없으므로 워커는 적중 요청이 남은 큐로 돌아감
+    assert not engine.pondering
+    
+    third = engine.start_search(game)
+    wait_result(engine)
+    stop(engine)
+    assert engine._results.generations == [first, second, third]
+    assert ScriptedEngine.calls == [("search", 1), ("ponder", 3), ("search", 3)]
\ No newline at end of file
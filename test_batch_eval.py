@@ -0,0 +1,72 @@
+"""
+batch_eval 패턴 수 테스트
+"""
+
+import random
+
+import numpy as np
+
+from batch_eval import BLACK, WHITE, PATTERN_NAMES, _count_patterns, forbidden_maps, stack_boards
+from board import Board
+from player import StoneColor
+from renju import ForbiddenType
+
+
+def count_line(text, size=15):
+    """가운데 행에 text("X": 흑, "O": 백, ".": 빈칸)를 놓고 흑의 패턴 수를 이름별로 반환합니다."""
+    states = np.zeros((1, size, size), dtype=np.int8)
+    for col, symbol in enumerate(text, start=1):
+        if symbol == "X":
+            states[0, size // 2, col] = BLACK
+        elif symbol == "O":
+            states[0, size // 2, col] = WHITE
+    return dict(zip(PATTERN_NAMES, _count_patterns(states, BLACK)[0].tolist()))
+
+
+def test_five_is_not_counted_as_fours():
+    """5목은 옆의 4+1 구간을 사로 세지 않습니다."""
+    assert count_line(".XXXXX.") == {"five": 1, "open_four": 0, "four": 0, "open_three": 0}
+
+
+def test_three_inside_double_four_is_not_counted():
+    """X.XXX.X는 사 두 개이고 가운데 .XXX.를 열린 삼으로 세지 않습니다."""
+    assert count_line(".X.XXX.X.") == {"five": 0, "open_four": 0, "four": 2, "open_three": 0}
+
+
+def test_open_four_and_closed_four():
+    """열린 사는 하나로, 한쪽이 막힌 사는 사 하나로 셉니다."""
+    assert count_line(".XXXX.") == {"five": 0, "open_four": 1, "four": 0, "open_three": 0}
+    assert count_line("OXXXX.") == {"five": 0, "open_four": 0, "four": 1, "open_three": 0}
+
+
+def test_open_threes():
+    """연속 삼과 한 칸 띈 삼은 열린 삼 하나로 셉니다."""
+    assert count_line(".XXX.")["open_three"] == 1
+    assert count_line(".XX.X.")["open_three"] == 1
+    assert count_line("OXXX.")["open_three"] == 0
+
+def test_forbidden_maps_match_board():
+    """무작위 국면들에서 forbidden_maps가 Board.get_forbidden_points와 같은 칸과 종류를 냅니다."""
+    rng = random.Random(7)
+    boards = []
+    for _ in range(30):
+        board = Board(15)
+        # 가운데 7x7에 흑을 많이 두어 금수 모양이 자주 생기게 함
+        for _ in range(rng.randint(5, 30)):
+            row, col = rng.randint(4, 10), rng.randint(4, 10)
+            if board.is_empty(row, col):
+                board.place_stone(row, col, StoneColor.BLACK if rng.random() < 0.65 else StoneColor.WHITE)
+        boards.append(board)
+    
+    maps = forbidden_maps(stack_boards(boards))
+    names = ((maps.double_three, ForbiddenType.DOUBLE_THREE),
+             (maps.double_four, ForbiddenType.DOUBLE_FOUR),
+             (maps.overline, ForbiddenType.OVERLINE))
+    found = 0
+    for index, board in enumerate(boards):
+        points = {(int(row), int(col)): forbidden
+                  for layer, forbidden in names for row, col in zip(*np.nonzero(layer[index]))}
+        assert points == board.get_forbidden_points()
+        found += len(points)
+    assert found
+    assert not forbidden_maps(stack_boards(boards), WHITE).overline.any()
\ No newline at end of file
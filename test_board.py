@@ -0,0 +1,218 @@
+"""
+보드 복제와 스냅숏 테스트
+"""
+
+import random
+
+import pytest
+
+from board import Board
+from player import StoneColor
+from sparse_board import SparseBoard
+
+
+def random_board(board_type, size, stone_count, seed):
+    """고정 시드로 중앙 부근에 흑백을 번갈아 stone_count개 둔 보드를 만듭니다 (흑 금수는 건너뜀)."""
+    rng = random.Random(seed)
+    board = board_type(size)
+    color = StoneColor.BLACK
+    center = size // 2
+    while board.get_move_count() < stone_count:
+        row = center + rng.randint(-4, 4)
+        col = center + rng.randint(-4, 4)
+        if not board.is_empty(row, col) or board.check_forbidden(row, col, color):
+            continue
+        board.place_stone(row, col, color)
+        color = StoneColor.WHITE if color == StoneColor.BLACK else StoneColor.BLACK
+    return board
+
+
+def assert_same_state(board, other):
+    """해시, 이동 기록, 프런티어 후보, 금수 판정이 같은지 확인합니다."""
+    assert other.zobrist_hash == board.zobrist_hash
+    assert list(other.move_history) == list(board.move_history)
+    assert other.get_move_count() == board.get_move_count()
+    assert other.is_full() == board.is_full()
+    assert sorted(other.get_candidate_moves()) == sorted(board.get_candidate_moves())
+    assert other.get_forbidden_points() == board.get_forbidden_points()
+    assert other.get_board_state() == board.get_board_state()
+
+
+@pytest.mark.parametrize("board_type, size", [(Board, 15), (Board, 19), (SparseBoard, 15)])
+@pytest.mark.parametrize("stone_count", [0, 1, 12, 40])
+def test_snapshot_restore_round_trip(board_type, size, stone_count):
+    """스냅숏을 복원한 보드는 원래 보드와 같은 상태입니다."""
+    board = random_board(board_type, size, stone_count, seed=stone_count)
+    board.get_forbidden_points()  # 금수 캐시를 채운 상태에서도 같아야 함
+    
+    restored = random_board(board_type, size, 7, seed=99)
+    restored.restore(board.snapshot())
+    assert_same_state(board, restored)
+    
+    # 복원한 뒤에도 두고 무르기가 원래 보드와 같게 동작
+    row, col = board.get_candidate_moves()[0]
+    for target in (board, restored):
+        target.place_stone(row, col, StoneColor.WHITE)
+    assert_same_state(board, restored)
+    for target in (board, restored):
+        target.undo_last_move()
+        target.undo_last_move()
+    assert_same_state(board, restored)
+
+
+@pytest.mark.parametrize("board_type", [Board, SparseBoard])
+def test_clone_is_independent(board_type):
+    """복제한 보드는 같은 상태에서 시작하고 원래 보드와 따로 바뀝니다."""
+    board = random_board(board_type, 15, 20, seed=3)
+    board.get_forbidden_points()
+    clone = board.clone()
+    assert_same_state(board, clone)
+    
+    row, col = clone.get_candidate_moves()[0]
+    clone.place_stone(row, col, StoneColor.BLACK)
+    assert board.is_empty(row, col)
+    assert board.get_move_count() == 20
+    clone.undo_last_move()
+    assert_same_state(board, clone)
+
+
+def test_restore_rejects_other_board_settings():
+    """크기나 프런티어 거리가 다른 보드의 스냅숏, 잘린 스냅숏은 거부합니다."""
+    snapshot = random_board(Board, 15, 10, seed=1).snapshot()
+    with pytest.raises(ValueError):
+        Board(19).restore(snapshot)
+    with pytest.raises(ValueError):
+        Board(15, frontier_distance=1).restore(snapshot)
+    with pytest.raises(ValueError):
+        Board(15).restore(snapshot[:-1])
+
+@pytest.mark.parametrize("size", [15, 19])
+def test_sparse_board_hash_matches_board(size):
+    """크기가 같으면 SparseBoard와 Board는 같은 배치에 같은 조브리스트 해시를 냅니다."""
+    board = random_board(Board, size, 30, seed=size)
+    sparse = SparseBoard(size)
+    for row, col, stone_color in board.move_history:
+        sparse.place_stone(row, col, stone_color)
+        assert sparse.zobrist_key(row, col, stone_color) == board.zobrist_key(row, col, stone_color)
+    assert sparse.zobrist_hash == board.zobrist_hash
+    assert sparse.side_to_move_key == board.side_to_move_key
+    
+    for _ in range(10):
+        board.undo_last_move()
+        sparse.undo_last_move()
+    assert sparse.zobrist_hash == board.zobrist_hash
+
+def test_sparse_board_implements_board_interface():
+    """SparseBoard는 Board의 공개 메서드와 속성을 모두 갖추고 같은 국면에서 같은 답을 냅니다."""
+    public = {name for name in dir(Board) if not name.startswith("_")}
+    missing = {name for name in public if not hasattr(SparseBoard(15), name)}
+    assert not missing
+    
+    board = random_board(Board, 15, 40, seed=5)
+    sparse = SparseBoard(15)
+    for row, col, stone_color in board.move_history:
+        sparse.place_stone(row, col, stone_color)
+    assert sparse.get_move_count() == board.get_move_count()
+    assert sparse.get_last_move() == board.get_last_move()
+    assert sorted(sparse.get_available_moves()) == sorted(board.get_available_moves())
+    assert sorted(sparse.get_candidate_moves()) == sorted(board.get_candidate_moves())
+    assert sparse.get_forbidden_points() == board.get_forbidden_points()
+    for row in range(-1, 16):
+        for col in range(-1, 16):
+            assert sparse.is_valid_position(row, col) == board.is_valid_position(row, col)
+            assert sparse.is_empty(row, col) == board.is_empty(row, col)
+            if not board.is_valid_position(row, col):
+                continue
+            assert sparse.get_stone(row, col) == board.get_stone(row, col)
+            for stone_color in (StoneColor.BLACK, StoneColor.WHITE):
+                assert sparse.check_win(row, col, stone_color) == board.check_win(row, col, stone_color)
+                assert sparse.get_line_shapes(row, col, stone_color) == board.get_line_shapes(row, col, stone_color)
+                assert sparse.check_forbidden(row, col, stone_color) == board.check_forbidden(row, col, stone_color)
+
+@pytest.mark.parametrize("size", [15, 19])
+def test_edges_and_padding_column(size):
+    """가장자리 5목은 승리로, 패딩 열을 건너 다음 행으로 이어지는 5개는 승리로 세지 않습니다."""
+    last = size - 1
+    board = Board(size)
+    # 0행 끝 네 칸과 1행 첫 칸: 비트 인덱스로는 패딩 열 하나만 사이에 둠
+    wrapped = [(0, last - 3), (0, last - 2), (0, last - 1), (0, last), (1, 0)]
+    for row, col in wrapped:
+        board.place_stone(row, col, StoneColor.BLACK)
+    for row, col in wrapped:
+        assert board.get_stone(row, col) == StoneColor.BLACK
+        assert not board.check_win(row, col, StoneColor.BLACK)
+    assert board.check_win(0, last - 4, StoneColor.BLACK)
+    assert board.get_stone(0, size) is None and board.get_stone(1, -1) is None
+    
+    available = board.get_available_moves()
+    assert len(available) == size * size - len(wrapped)
+    assert all(board.is_valid_position(row, col) for row, col in available)
+    assert not set(wrapped) & set(available)
+    
+    # 마지막 열 세로, 마지막 행 가로, 모서리를 지나는 두 대각선
+    for line in ([(row, last) for row in range(last - 4, size)],
+                 [(last, col) for col in range(5)],
+                 [(index, index) for index in range(last - 4, size)],
+                 [(index, last - index) for index in range(5)]):
+        board = Board(size)
+        for row, col in line[:-1]:
+            board.place_stone(row, col, StoneColor.WHITE)
+        assert not board.check_win(*line[-1], StoneColor.BLACK)
+        assert board.check_win(*line[-1], StoneColor.WHITE)
+        board.place_stone(*line[-1], StoneColor.WHITE)
+        assert all(board.get_stone(row, col) == StoneColor.WHITE for row, col in line)
+
+@pytest.mark.parametrize("board_type", [Board, SparseBoard])
+def test_zobrist_hash_restored_by_undo(board_type):
+    """돌을 두고 무르면 해시가 두기 전 값으로 돌아가고, 두는 순서가 달라도 같은 배치면 해시가 같습니다."""
+    board = random_board(board_type, 15, 20, seed=11)
+    history = list(board.move_history)
+    hashes = [board.zobrist_hash]
+    for _ in range(len(history)):
+        board.undo_last_move()
+        hashes.append(board.zobrist_hash)
+    assert hashes[-1] == 0
+    assert len(set(hashes)) == len(hashes)
+    
+    for (row, col, stone_color), expected in zip(history, reversed(hashes[:-1])):
+        before = board.zobrist_hash
+        board.place_stone(row, col, stone_color)
+        assert board.zobrist_hash == expected
+        board.undo_last_move()
+        assert board.zobrist_hash == before
+        board.place_stone(row, col, stone_color)
+    
+    # 흑끼리, 백끼리 순서를 바꿔 두어도 같은 해시
+    reordered = board_type(15)
+    for row, col, stone_color in history[::-2] + history[-2::-2]:
+        reordered.place_stone(row, col, stone_color)
+    assert reordered.zobrist_hash == board.zobrist_hash
+
+def brute_force_frontier(board, distance):
+    """모든 빈칸에 대해 체비쇼프 거리 distance 이내에 돌이 있는지 직접 확인합니다."""
+    stones = [(row, col) for row, col, _ in board.move_history]
+    return {(row, col) for row in range(board.size) for col in range(board.size)
+            if board.is_empty(row, col)
+            and any(max(abs(row - r), abs(col - c)) <= distance for r, c in stones)}
+
+
+@pytest.mark.parametrize("board_type", [Board, SparseBoard])
+@pytest.mark.parametrize("distance", [1, 2, 3])
+def test_frontier_matches_brute_force_dilation(board_type, distance):
+    """두고 무르기를 섞어도 후보 수가 직접 계산한 팽창 결과와 같습니다 (가장자리와 패딩 열 포함)."""
+    rng = random.Random(distance)
+    board = board_type(15, distance)
+    assert board.get_candidate_moves() == [(7, 7)]
+    for step in range(150):
+        if board.get_move_count() and rng.random() < 0.35:
+            board.undo_last_move()
+        else:
+            # 가장자리 근처에 자주 두어 행 끝에서 다음 행으로 번지지 않는지 확인
+            row = rng.choice([0, 1, 13, 14, rng.randrange(15)])
+            col = rng.choice([0, 1, 13, 14, rng.randrange(15)])
+            if board.is_empty(row, col):
+                board.place_stone(row, col, rng.choice([StoneColor.BLACK, StoneColor.WHITE]))
+        if step % 2 and board.get_move_count():
+            candidates = board.get_candidate_moves()
+            assert len(candidates) == len(set(candidates))
+            assert set(candidates) == brute_force_frontier(board, distance)
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+게임 진행과 단계별 계측 테스트
+"""
+
+import instrumentation
+from game import Game
+from instrumentation import PhaseProfiler
+
+
+# 범위 밖, 이미 둔 곳, 흑의 삼삼 금수를 섞은 뒤 흑이 세로 5목으로 이기고, 끝난 뒤의 수는 거부되는 수순
+MOVES = [(7, 5), (0, 0), (7, 8), (0, 2), (5, 6), (0, 4), (6, 6), (0, 6), (15, 3), (7, 5), (7, 6),
+         (10, 12), (3, 0), (11, 12), (3, 2), (12, 12), (3, 4), (13, 12), (3, 6), (14, 12), (2, 2)]
+
+
+def play(game):
+    """MOVES를 두면서 매 수의 결과, 거부된 금수 종류, 콜백 호출을 기록해 반환합니다."""
+    events = []
+    game.on_state_change = lambda: events.append("state")
+    game.on_win = lambda winner: events.append(("win", winner.get_name()))
+    for row, col in MOVES:
+        events.append((game.make_move(row, col), game.last_forbidden))
+    return events
+
+
+def test_profiled_make_move_records_phases_and_behaves_the_same(monkeypatch):
+    """계측을 켜면 단계별 시간이 기록되고 make_move의 결과와 콜백은 계측하지 않을 때와 같습니다."""
+    expected_game = Game("흑", "백")
+    expected = play(expected_game)
+    assert ("win", "흑") in expected and (False, "double_three") in expected
+    
+    profiler = PhaseProfiler()
+    monkeypatch.setattr(instrumentation, "profiler", profiler)
+    game = Game("흑", "백")
+    assert play(game) == expected
+    assert list(game.board.move_history) == list(expected_game.board.move_history)
+    assert game.get_winner().get_name() == "흑"
+    
+    phases = profiler.phases
+    assert phases["make_move"].calls == len(MOVES)
+    assert phases["bounds"].calls == len(MOVES) - 1  # 이긴 뒤의 수는 범위 확인 전에 거부됨
+    for phase in ("empty", "forbidden", "place_stone", "check_win", "is_full", "callback:<lambda>"):
+        assert phases[phase].calls > 0
+    assert phases["place_stone"].calls == phases["check_win"].calls == game.board.get_move_count()
+    
+    # 대리 객체는 수마다 새로 만들지 않고, 보드나 계측기가 바뀔 때만 다시 만듦
+    timed_board = game._timed_board
+    game.reset_game()
+    game.make_move(7, 7)
+    assert game._timed_board is timed_board
+    monkeypatch.setattr(instrumentation, "profiler", PhaseProfiler())
+    game.make_move(8, 8)
+    assert game._timed_board is not timed_board
+
+def test_position_hash_includes_side_to_move():
+    """같은 배치라도 둘 차례가 다르면 position_hash가 다르고, 무르면 이전 값으로 돌아갑니다."""
+    game = Game()
+    empty = game.position_hash
+    assert empty == game.board.zobrist_hash
+    
+    assert game.make_move(7, 7)
+    after_black = game.position_hash
+    assert after_black == game.board.zobrist_hash ^ game.board.side_to_move_key
+    assert after_black != game.board.zobrist_hash
+    
+    # 흑이 (7, 7)에 두고 백 차례인 국면과, 그 돌만 놓인 보드에서 흑 차례인 국면은 다름
+    other = Game()
+    other.board.place_stone(7, 7, game.board.get_stone(7, 7))
+    assert other.position_hash == game.board.zobrist_hash != after_black
+    
+    assert game.make_move(7, 8)
+    assert game.position_hash == game.board.zobrist_hash
+    assert game.undo_move()
+    assert game.position_hash == after_black
+    assert game.undo_move()
+    assert game.position_hash == empty
\ No newline at end of file
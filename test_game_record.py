@@ -0,0 +1,98 @@
+"""
+대국 기록 바이너리 형식 테스트
+"""
+
+import os
+
+import pytest
+
+from game import Game
+from game_record import GameRecord, GameRecordWriter, GameResult, read_records
+
+
+def assert_same_record(record, other):
+    """두 기록의 모든 필드가 같은지 확인합니다."""
+    assert other.board_size == record.board_size
+    assert other.black_name == record.black_name
+    assert other.white_name == record.white_name
+    assert other.result == record.result
+    assert [tuple(move) for move in other.moves] == [tuple(move) for move in record.moves]
+
+
+def test_write_read_round_trip(tmp_path):
+    """쓴 기록을 같은 순서와 내용으로 다시 읽습니다 (빈 대국, 크기 255 포함)."""
+    game = Game("흑돌", "백돌")
+    for row, col in [(7, 7), (0, 0), (7, 8), (0, 1), (7, 9), (0, 2), (7, 10), (0, 3), (7, 11)]:
+        assert game.make_move(row, col)
+    records = [
+        GameRecord.from_game(Game()),
+        GameRecord.from_game(game),
+        GameRecord(255, "가" * 85, "", GameResult.UNFINISHED, [(254, 254), (0, 0), (128, 3), (3, 200)]),
+        GameRecord(255, "black", "white", GameResult.DRAW, []),
+        GameRecord(19, "b", "w", GameResult.WHITE_WIN, [(18, 0), (0, 18)]),
+    ]
+    assert records[0].moves == [] and records[0].result == GameResult.UNFINISHED
+    assert records[1].result == GameResult.BLACK_WIN
+    
+    path = str(tmp_path / "games.omok")
+    with GameRecordWriter(path) as writer:
+        for record in records:
+            writer.write(record)
+    
+    loaded = list(read_records(path))
+    assert len(loaded) == len(records)
+    for record, other in zip(records, loaded):
+        assert_same_record(record, other)
+    assert loaded[1].replay().get_winner().get_name() == "흑돌"
+
+
+def test_append_and_empty_archive(tmp_path):
+    """기록이 없는 보관 파일은 아무것도 돌려주지 않고, 이어 쓰면 헤더를 다시 쓰지 않습니다."""
+    path = str(tmp_path / "games.omok")
+    with GameRecordWriter(path):
+        pass
+    assert list(read_records(path)) == []
+    
+    first = GameRecord(15, "a", "b", GameResult.DRAW, [(7, 7)])
+    second = GameRecord(15, "c", "d", GameResult.WHITE_WIN, [(1, 1), (2, 2)])
+    with GameRecordWriter(path, append=True) as writer:
+        writer.write(first)
+    with GameRecordWriter(path, append=True) as writer:
+        writer.write(second)
+    
+    loaded = list(read_records(path))
+    assert len(loaded) == 2
+    assert_same_record(first, loaded[0])
+    assert_same_record(second, loaded[1])
+
+
+def test_long_names_are_truncated_on_character_boundary(tmp_path):
+    """255바이트를 넘는 이름은 글자 중간이 아닌 곳에서 잘립니다."""
+    path = str(tmp_path / "games.omok")
+    with GameRecordWriter(path) as writer:
+        writer.write(GameRecord(15, "한" * 100, "w", GameResult.DRAW, []))
+    
+    (loaded,) = read_records(path)
+    assert loaded.black_name == "한" * 85
+
+@pytest.mark.parametrize("cut", [1, 5, 20])
+def test_truncated_archive_raises_value_error(tmp_path, cut):
+    """파일 끝에서 잘린 기록은 앞의 온전한 기록을 돌려준 뒤 ValueError를 냅니다."""
+    path = str(tmp_path / "games.omok")
+    with GameRecordWriter(path) as writer:
+        writer.write(GameRecord(15, "a", "b", GameResult.DRAW, [(7, 7), (7, 8)]))
+        writer.write(GameRecord(19, "흑", "백", GameResult.BLACK_WIN, [(row, row) for row in range(19)]))
+    with open(path, "r+b") as file:
+        file.truncate(os.path.getsize(path) - cut)
+    
+    records = read_records(path)
+    assert next(records).moves == [(7, 7), (7, 8)]
+    with pytest.raises(ValueError, match="잘린 대국 기록"):
+        next(records)
+
+
+@pytest.mark.parametrize("board_size, moves", [(None, [(0, 0)]), (0, []), (256, [(0, 0)]), (15, [(15, 0)])])
+def test_unwritable_record_raises_value_error(board_size, moves):
+    """무한 보드, 크기 1~255 밖, 보드 밖의 수는 바이너리로 쓸 수 없습니다."""
+    with pytest.raises(ValueError):
+        GameRecord(board_size, "a", "b", GameResult.UNFINISHED, moves).to_bytes()
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+MCTS 롤아웃 테스트
+"""
+
+import random
+
+import pytest
+
+import mcts
+from player import StoneColor
+from sparse_board import SparseBoard
+
+
+@pytest.mark.parametrize("size", [100, None])
+@pytest.mark.parametrize("policy", [mcts.RolloutPolicy.RANDOM, mcts.RolloutPolicy.PATTERN])
+def test_rollout_stays_on_frontier(monkeypatch, size, policy):
+    """희소 보드의 롤아웃은 빈칸 전체를 나열하지 않고, 끝나면 보드를 되돌립니다."""
+    def fail(self):
+        raise AssertionError("롤아웃이 빈칸 전체를 나열했습니다")
+    monkeypatch.setattr(SparseBoard, "get_available_moves", fail)
+    
+    board = SparseBoard(size)
+    for row, col, stone_color in [(50, 50, StoneColor.BLACK), (50, 51, StoneColor.WHITE), (51, 50, StoneColor.BLACK)]:
+        board.place_stone(row, col, stone_color)
+    zobrist_hash = board.zobrist_hash
+    
+    rng = random.Random(7)
+    for _ in range(5):
+        mcts._rollout(board, StoneColor.WHITE, rng, policy)
+    assert board.zobrist_hash == zobrist_hash
+    assert board.get_move_count() == 3
\ No newline at end of file
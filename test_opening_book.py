@@ -0,0 +1,91 @@
+"""
+정석 북 대칭 정규화 테스트
+"""
+
+import random
+
+import pytest
+
+from board import Board
+from game_record import GameRecord, GameRecordWriter, GameResult
+from opening_book import OpeningBook, _INVERSE, _transforms, build_book, canonical_hash, canonical_move
+from player import StoneColor
+from sparse_board import SparseBoard
+
+
+SIZE = 15
+
+
+def board_from_moves(moves, board_type=Board):
+    """흑부터 번갈아 둔 보드를 만듭니다."""
+    board = board_type(SIZE)
+    colors = (StoneColor.BLACK, StoneColor.WHITE)
+    for number, (row, col) in enumerate(moves):
+        board.place_stone(row, col, colors[number % 2])
+    return board
+
+
+def test_transforms_are_permutations_with_inverses():
+    """8가지 변환은 모두 보드 칸의 일대일 대응이고 _INVERSE가 역변환입니다."""
+    transforms = _transforms(SIZE)
+    cells = [(row, col) for row in range(SIZE) for col in range(SIZE)]
+    images = set()
+    for symmetry, transform in enumerate(transforms):
+        mapped = [transform(row, col) for row, col in cells]
+        assert sorted(mapped) == cells
+        images.add(tuple(mapped))
+        inverse = transforms[_INVERSE[symmetry]]
+        for row, col in cells:
+            assert inverse(*transform(row, col)) == (row, col)
+    assert len(images) == 8
+
+
+def test_canonical_hash_is_symmetry_invariant():
+    """대칭 변환한 국면은 모두 같은 정규화 해시를 냅니다."""
+    rng = random.Random(4)
+    cells = [(row, col) for row in range(4, 11) for col in range(3, 12)]
+    moves = rng.sample(cells, 9)
+    key, _ = canonical_hash(board_from_moves(moves))
+    for transform in _transforms(SIZE):
+        transformed = board_from_moves([transform(row, col) for row, col in moves])
+        assert canonical_hash(transformed)[0] == key
+
+
+def test_equivalent_replies_share_one_entry():
+    """가운데 돌 하나에서 서로 대칭인 네 응수는 같은 정규화된 수가 됩니다."""
+    board = board_from_moves([(7, 7)])
+    key, symmetries = canonical_hash(board)
+    assert len(symmetries) == 8
+    replies = {canonical_move(SIZE, symmetries, row, col) for row, col in [(7, 8), (8, 7), (7, 6), (6, 7)]}
+    assert len(replies) == 1
+    diagonals = {canonical_move(SIZE, symmetries, row, col) for row, col in [(6, 6), (6, 8), (8, 6), (8, 8)]}
+    assert len(diagonals) == 1 and diagonals != replies
+
+
+@pytest.mark.parametrize("board_type", [Board, SparseBoard])
+def test_build_then_lookup_round_trip(tmp_path, board_type):
+    """대칭인 대국들로 만든 북은 각 국면에서 실제로 둔 수(또는 그와 같은 수)를 합친 횟수로 돌려줍니다."""
+    opening = [(7, 7), (7, 8), (6, 6), (8, 9)]
+    archive = str(tmp_path / "games.omok")
+    with GameRecordWriter(archive) as writer:
+        for transform in _transforms(SIZE):
+            moves = [transform(row, col) for row, col in opening]
+            writer.write(GameRecord(SIZE, "b", "w", GameResult.BLACK_WIN, moves))
+    book_path = str(tmp_path / "book.ombk")
+    build_book([archive], book_path, max_ply=4)
+    
+    with OpeningBook(book_path) as book:
+        # 빈 보드: 8판 모두 가운데 한 칸
+        (first,) = book.lookup(board_type(SIZE))
+        assert first.move == (7, 7) and first.games == 8 and first.wins == 8
+        
+        # 가운데 돌 뒤: 서로 대칭인 네 응수가 한 항목으로 합쳐짐
+        (second,) = book.lookup(board_from_moves(opening[:1], board_type))
+        assert second.games == 8 and second.wins == 0
+        assert second.move in [(7, 8), (8, 7), (7, 6), (6, 7)]
+        
+        # 대칭이 아닌 국면: 원래 대국의 수가 그대로 나옴
+        for transform in _transforms(SIZE):
+            moves = [transform(row, col) for row, col in opening]
+            (third,) = book.lookup(board_from_moves(moves[:3], board_type))
+            assert third.move == moves[3]
\ No newline at end of file
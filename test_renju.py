@@ -0,0 +1,132 @@
+"""
+렌주 금수 판정 테스트
+"""
+
+import os
+import random
+
+import pytest
+
+import renju
+from board import Board
+from player import StoneColor
+from renju import ForbiddenType
+from sparse_board import SparseBoard
+
+
+BOARD_TYPES = (Board, SparseBoard)
+
+
+def make_board(board_type, black=(), white=()):
+    """흑돌과 백돌 좌표 목록으로 15x15 보드를 만듭니다."""
+    board = board_type(15)
+    for row, col in black:
+        board.place_stone(row, col, StoneColor.BLACK)
+    for row, col in white:
+        board.place_stone(row, col, StoneColor.WHITE)
+    return board
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_split_three_makes_double_three(board_type):
+    """한 칸 띈 삼(XX.X)과 연속 삼이 겹치면 삼삼입니다."""
+    board = make_board(board_type, black=[(7, 5), (7, 8), (5, 6), (6, 6)])
+    assert board.check_forbidden(7, 6, StoneColor.BLACK) == ForbiddenType.DOUBLE_THREE
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_blocked_three_is_not_open(board_type):
+    """한쪽이 막혀 열린 사가 될 수 없는 삼은 삼삼으로 세지 않습니다."""
+    board = make_board(board_type, black=[(7, 5), (7, 8), (5, 6), (6, 6)], white=[(4, 6)])
+    assert board.check_forbidden(7, 6, StoneColor.BLACK) is None
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_double_four_on_one_line(board_type):
+    """X.XXX.X처럼 한 줄에 사가 두 개 생기면 사사입니다."""
+    board = make_board(board_type, black=[(7, 3), (7, 5), (7, 7), (7, 9)])
+    assert board.check_forbidden(7, 6, StoneColor.BLACK) == ForbiddenType.DOUBLE_FOUR
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_overline(board_type):
+    """6목 이상은 장목입니다."""
+    board = make_board(board_type, black=[(7, 2), (7, 3), (7, 4), (7, 6), (7, 7)])
+    assert board.check_forbidden(7, 5, StoneColor.BLACK) == ForbiddenType.OVERLINE
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_five_overrides_forbidden_shape(board_type):
+    """삼삼을 함께 만들어도 정확한 5목이 되는 수는 금수가 아닙니다."""
+    threes = [(5, 7), (6, 7), (6, 8), (5, 9)]
+    board = make_board(board_type, black=threes)
+    assert board.check_forbidden(7, 7, StoneColor.BLACK) == ForbiddenType.DOUBLE_THREE
+    
+    board = make_board(board_type, black=threes + [(7, 3), (7, 4), (7, 5), (7, 6)])
+    assert board.check_forbidden(7, 7, StoneColor.BLACK) is None
+    assert board.check_win(7, 7, StoneColor.BLACK)
+
+
+@pytest.mark.parametrize("board_type", BOARD_TYPES)
+def test_white_is_never_forbidden(board_type):
+    """백에게는 금수가 없습니다."""
+    board = make_board(board_type, white=[(7, 2), (7, 3), (7, 4), (7, 6), (7, 7), (5, 5), (6, 5)])
+    assert board.check_forbidden(7, 5, StoneColor.WHITE) is None
+    assert board.get_forbidden_points() == {}
+
+
+def test_table_rebuilt_when_cache_removed_or_corrupted(tmp_path, monkeypatch):
+    """캐시 파일이 없거나 손상되었으면 표를 다시 만들어 저장합니다."""
+    expected = renju.get_table()
+    monkeypatch.setenv("OMOK_CACHE_DIR", str(tmp_path))
+    path = renju.cache_path()
+    
+    monkeypatch.setattr(renju, "_table", None)
+    assert renju.get_table() == expected
+    assert os.path.exists(path)
+    
+    os.remove(path)
+    monkeypatch.setattr(renju, "_table", None)
+    assert renju.get_table() == expected
+    assert os.path.exists(path)
+    
+    with open(path, "r+b") as cache_file:
+        cache_file.truncate(len(expected) // 2)
+    monkeypatch.setattr(renju, "_table", None)
+    assert renju.get_table() == expected
+    assert os.path.getsize(path) == len(renju._CACHE_MAGIC) + len(expected)
+    
+    with open(path, "r+b") as cache_file:
+        cache_file.write(b"XXXX")
+    monkeypatch.setattr(renju, "_table", None)
+    assert renju.get_table() == expected
+    with open(path, "rb") as cache_file:
+        assert cache_file.read(len(renju._CACHE_MAGIC)) == renju._CACHE_MAGIC
+
+@pytest.mark.parametrize("seed", range(4))
+def test_forbidden_cache_matches_uncached_after_place_and_undo(seed):
+    """캐시를 채운 채 두고 무르기를 반복해도 캐시된 판정이 캐시를 비운 뒤의 판정과 같습니다."""
+    rng = random.Random(seed)
+    board = Board(15)
+    cells = [(row, col) for row in range(15) for col in range(15)]
+    seen_forbidden = 0
+    for step in range(120):
+        if board.get_move_count() and rng.random() < 0.3:
+            board.undo_last_move()
+        else:
+            row, col = rng.choice([(row, col) for row, col in board.get_available_moves()
+                                   if abs(row - 7) <= 3 and abs(col - 7) <= 3] or board.get_available_moves())
+            board.place_stone(row, col, rng.choice([StoneColor.BLACK, StoneColor.BLACK, StoneColor.WHITE]))
+        
+        # 캐시는 일부 칸만 채워 둔 채로 다음 수로 넘어가기도 함
+        if step % 3:
+            for row, col in rng.sample(cells, 60):
+                board.check_forbidden(row, col, StoneColor.BLACK)
+            continue
+        cached = {cell: board.check_forbidden(*cell, StoneColor.BLACK) for cell in cells}
+        cached_points = board.get_forbidden_points()
+        board.clear_forbidden_cache()
+        assert cached == {cell: board.check_forbidden(*cell, StoneColor.BLACK) for cell in cells}
+        assert cached_points == board.get_forbidden_points()
+        seen_forbidden += len(cached_points)
+    assert seen_forbidden
\ No newline at end of file
@@ -0,0 +1,21 @@
+"""
+자체 대국 재현성 테스트
+"""
+
+import random
+
+from selfplay import play_game
+
+
+def test_play_game_is_reproducible_without_touching_global_random():
+    """같은 시드의 대국은 같은 수순을 두고, 전역 random 상태는 바꾸지 않습니다."""
+    random.seed(123)
+    expected_state = random.getstate()
+    first = play_game(0, "random", "mcts:20", seed=5)
+    assert random.getstate() == expected_state
+    
+    second = play_game(0, "random", "random", seed=5)
+    third = play_game(0, "random", "random", seed=5)
+    assert second["moves"] == third["moves"]
+    assert second["moves"] != play_game(0, "random", "random", seed=6)["moves"]
+    assert first["result"] in ("black", "white", "draw", "unfinished")
@@ -0,0 +1,138 @@
+"""
+대국 서버 프로토콜 테스트
+"""
+
+import asyncio
+import json
+
+from server import GameServer, run_server_load_test
+
+
+class Client:
+    """테스트용 줄 단위 JSON 클라이언트"""
+    
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+    
+    def send(self, **request):
+        self.writer.write(json.dumps(request).encode() + b"\n")
+    
+    async def receive(self, message_type):
+        """presence 알림은 건너뛰고 다음 메시지가 message_type인지 확인해 반환합니다."""
+        while True:
+            message = json.loads(await asyncio.wait_for(self.reader.readline(), 5))
+            if message["type"] != "presence":
+                assert message["type"] == message_type, message
+                return message
+
+
+async def connect(server, room, name, role="player"):
+    """서버에 접속해 방에 들어가고 joined 메시지와 함께 클라이언트를 반환합니다."""
+    client = Client(*await asyncio.open_connection(server.host, server.port))
+    client.send(op="join", room=room, name=name, role=role)
+    return client, await client.receive("joined")
+
+
+def run_with_server(scenario):
+    """임의 포트로 서버를 띄워 scenario(server)를 실행합니다."""
+    async def main():
+        server = GameServer(port=0)
+        await server.start()
+        try:
+            await scenario(server)
+        finally:
+            await server.close()
+    asyncio.run(main())
+
+
+def test_join_assigns_colors_and_observers():
+    """먼저 들어온 두 명이 흑과 백, 그 뒤나 role=observer는 관전자가 되고 진행 중인 수를 받습니다."""
+    async def scenario(server):
+        black, joined = await connect(server, "r1", "철수")
+        assert joined["color"] == "black" and joined["moves"] == [] and joined["turn"] == "black"
+        white, joined = await connect(server, "r1", "영희")
+        assert joined["color"] == "white"
+        
+        black.send(op="move", row=7, col=7)
+        await black.receive("move")
+        _, joined = await connect(server, "r1", "민수")
+        assert joined["color"] is None and joined["moves"] == [[7, 7]] and joined["turn"] == "white"
+        _, joined = await connect(server, "r2", "관전", role="observer")
+        assert joined["color"] is None
+    
+    run_with_server(scenario)
+
+
+def test_move_is_broadcast_to_room():
+    """검증된 수는 같은 방의 플레이어와 관전자 모두에게 같은 move 메시지로 갑니다."""
+    async def scenario(server):
+        black, _ = await connect(server, "r1", "b")
+        white, _ = await connect(server, "r1", "w")
+        observer, _ = await connect(server, "r1", "o", role="observer")
+        
+        black.send(op="move", row=7, col=7)
+        messages = [await client.receive("move") for client in (black, white, observer)]
+        assert all(message == messages[0] for message in messages)
+        assert (messages[0]["row"], messages[0]["col"], messages[0]["color"]) == (7, 7, "black")
+        assert messages[0]["turn"] == "white" and messages[0]["winner"] is None
+    
+    run_with_server(scenario)
+
+
+def test_invalid_moves_are_rejected():
+    """차례가 아닌 수, 정수가 아닌 좌표(bool 포함), 이미 둔 곳, 관전자의 수는 error로 거부합니다."""
+    async def scenario(server):
+        black, _ = await connect(server, "r1", "b")
+        white, _ = await connect(server, "r1", "w")
+        observer, _ = await connect(server, "r1", "o", role="observer")
+        
+        white.send(op="move", row=7, col=7)
+        assert (await white.receive("error"))["message"] == "차례가 아닙니다."
+        for row, col in [("7", 7), (7.0, 7), (True, 7), (7, None)]:
+            black.send(op="move", row=row, col=col)
+            assert (await black.receive("error"))["message"] == "좌표는 정수여야 합니다."
+        black.send(op="move", row=15, col=0)
+        assert (await black.receive("error"))["message"] == "둘 수 없는 곳입니다."
+        observer.send(op="move", row=0, col=0)
+        assert (await observer.receive("error"))["message"] == "대국 중인 플레이어가 아닙니다."
+        
+        black.send(op="move", row=7, col=7)
+        await black.receive("move")
+        await white.receive("move")
+        white.send(op="move", row=7, col=7)
+        assert (await white.receive("error"))["message"] == "둘 수 없는 곳입니다."
+        assert server.rooms["r1"].game.get_board().get_move_count() == 1
+    
+    run_with_server(scenario)
+
+
+def test_only_last_mover_can_undo():
+    """마지막 수를 둔 플레이어만 무를 수 있고, 무르면 방 전체에 알리고 차례가 돌아갑니다."""
+    async def scenario(server):
+        black, _ = await connect(server, "r1", "b")
+        white, _ = await connect(server, "r1", "w")
+        
+        black.send(op="undo")
+        assert (await black.receive("error"))["message"] == "무를 수 없습니다."
+        black.send(op="move", row=7, col=7)
+        await black.receive("move")
+        await white.receive("move")
+        
+        white.send(op="undo")
+        assert (await white.receive("error"))["message"] == "상대의 수는 무를 수 없습니다."
+        black.send(op="undo")
+        for client in (black, white):
+            message = await client.receive("undo")
+            assert (message["row"], message["col"], message["turn"]) == (7, 7, "black")
+        assert server.rooms["r1"].game.get_board().get_move_count() == 0
+    
+    run_with_server(scenario)
+
+
+def test_load_test_reports_server_latency():
+    """별도 프로세스의 클라이언트로 부하 시험을 돌리고 서버 측 수 처리 시간을 함께 보고합니다."""
+    summary = asyncio.run(run_server_load_test(GameServer(port=0), games=3, think_ms=0, client_processes=2))
+    assert summary["moves"] == 3 * 20
+    assert 0 < summary["server_p50_ms"] <= summary["server_p99_ms"] <= summary["server_max_ms"]
+    assert summary["p50_ms"] <= summary["p99_ms"] <= summary["max_ms"]
\ No newline at end of file
@@ -7,10 +7,27 @@ import tkinter as tk
 from tkinter import messagebox
 from typing import Optional, Tuple, List
 import math
+import time
 
 from game import Game, GameState
 from player import StoneColor
 from nickname_dialog import get_nicknames
+from board_renderer import BoardRenderer, CanvasLayer
+from hover import HoverIndicator
+from background_engine import BackgroundEngine
+
+
+# 컴퓨터와 대전할 때 컴퓨터가 두는 돌 (두 번째 플레이어)
+COMPUTER_COLOR = StoneColor.WHITE
+
+# 컴퓨터의 한 수 탐색 시간 (밀리초)
+COMPUTER_TIME_LIMIT_MS = 1000
+
+# 탐색 결과 큐를 확인하는 주기 (밀리초, 약 한 프레임)
+ENGINE_POLL_MS = 16
+
+# 사람이 생각하는 동안 컴퓨터가 예상 응수를 미리 탐색할지 여부
+COMPUTER_PONDER = True
 
 
 class TkinterGUI:
@@ -36,9 +53,19 @@ class TkinterGUI:
         self.status_label: Optional[tk.Label] = None
         self.score_label: Optional[tk.Label] = None
         self.new_game_button: Optional[tk.Button] = None
+        self.thinking_label: Optional[tk.Label] = None
+        
+        # 컴퓨터 대전 (엔진은 별도 프로세스에서 탐색하고, 결과는 root.after로 큐를 확인해 받음)
+        self.vs_computer = tk.BooleanVar(master=root, value=False)
+        self.engine: Optional[BackgroundEngine] = None
+        self._thinking_started = 0.0
         
-        # 쌍삼 표시
-        self.double_three_indicator: Optional[int] = None
+        # 층별 캔버스 렌더러와 금수 호버 표시 (캔버스를 만든 뒤 생성)
+        self.renderer: Optional[BoardRenderer] = None
+        self.hover: Optional[HoverIndicator] = None
+        
+        # 승리 강조 표시 항목들 (새 게임 시작 시 제거)
+        self.winning_highlights: List[int] = []
         
         # 닉네임 입력
         self.get_player_nicknames()
@@ -68,7 +95,7 @@ class TkinterGUI:
                 on_win=self.handle_win,
                 on_draw=self.handle_draw
             )
-            
+        
         except Exception as e:
             print(f"닉네임 입력 오류: {e}")
             # 기본 닉네임 사용
@@ -112,6 +139,16 @@ class TkinterGUI:
         )
         self.score_label.pack()
         
+        # 컴퓨터 생각 중 표시 (탐색 중에만 글자가 보임)
+        self.thinking_label = tk.Label(
+            status_frame,
+            text="",
+            font=("Segoe UI", 12, "italic"),
+            fg="#2f4f4f",
+            bg="#f5e6d3"
+        )
+        self.thinking_label.pack()
+        
         # 캔버스 프레임
         canvas_frame = tk.Frame(main_frame, bg="#34495e", relief="raised", bd=3)
         canvas_frame.pack(pady=20)
@@ -125,10 +162,13 @@ class TkinterGUI:
             highlightthickness=0
         )
         self.canvas.pack(padx=10, pady=10)
+        self.renderer = BoardRenderer(self.canvas, self.board_size, self.cell_size, self.stone_radius)
+        self.hover = HoverIndicator(self.root, self.renderer, lambda: self.game)
         
         # 마우스 이벤트 바인딩
         self.canvas.bind("<Button-1>", self.on_canvas_click)
         self.canvas.bind("<Motion>", self.on_canvas_motion)
+        self.canvas.bind("<Leave>", self.hover.on_leave)
         
         # 버튼 프레임
         button_frame = tk.Frame(main_frame, bg="#f5e6d3")
@@ -175,12 +215,26 @@ class TkinterGUI:
             bd=2,
             padx=20,
             pady=8,
-            command=self.root.quit
+            command=self.quit
         )
         exit_button.pack(side="left", padx=10)
         
-        # 무르기 버튼 참조 저장
+        # 무르기, 종료 버튼 참조 저장
         self.undo_button = undo_button
+        self.exit_button = exit_button
+        
+        # 컴퓨터 대전 선택 (컴퓨터는 백)
+        vs_computer_check = tk.Checkbutton(
+            main_frame,
+            text="컴퓨터와 대전 (컴퓨터: 백)",
+            font=("Segoe UI", 11),
+            variable=self.vs_computer,
+            bg="#f5e6d3",
+            activebackground="#f5e6d3",
+            command=self.on_vs_computer_toggle
+        )
+        vs_computer_check.pack()
+        self.root.protocol("WM_DELETE_WINDOW", self.quit)
         
         # 버튼 호버 효과 설정
         self.setup_button_hover_effects()
@@ -203,7 +257,7 @@ class TkinterGUI:
             else:
                 event.widget.config(bg="#b8860b")
         
-        for button in [self.new_game_button, self.undo_button, self.root.winfo_children()[0].winfo_children()[-1].winfo_children()[-1]]:
+        for button in [self.new_game_button, self.undo_button, self.exit_button]:
             button.bind("<Enter>", on_enter)
             button.bind("<Leave>", on_leave)
     
@@ -226,114 +280,22 @@ class TkinterGUI:
         self.root.geometry(f"{window_width}x{window_height}+{x}+{y}")
     
     def draw_board(self):
-        """오목판을 그립니다."""
-        if not self.canvas:
-            return
-        
-        # 격자선 그리기
-        for i in range(self.board_size + 1):
-            x = (i + 1) * self.cell_size
-            
-            # 세로선
-            self.canvas.create_line(
-                x, self.cell_size, x, self.canvas_height - self.cell_size,
-                fill="#000000", width=2
-            )
-            
-            # 가로선
-            self.canvas.create_line(
-                self.cell_size, x, self.canvas_width - self.cell_size, x,
-                fill="#000000", width=2
-            )
-        
-        # 화점 그리기
-        star_points = [3, 7, 11]
-        for i in star_points:
-            for j in star_points:
-                x = (i + 1) * self.cell_size
-                y = (j + 1) * self.cell_size
-                
-                # 화점 (별 모양)
-                self.canvas.create_oval(
-                    x - 4, y - 4, x + 4, y + 4,
-                    fill="#000000", outline="#000000"
-                )
-        
-        # 3D 효과 추가
-        self.create_3d_board_effects()
-    
-    def create_3d_board_effects(self):
-        """오목판에 3D 효과를 추가합니다."""
-        # 오목판 가장자리 그림자
-        shadow_color = "#654321"
-        self.canvas.create_rectangle(
-            5, 5, self.canvas_width - 5, self.canvas_height - 5,
-            outline=shadow_color, width=3
-        )
-        
-        # 격자선에 미묘한 그림자 효과
-        for i in range(self.board_size + 1):
-            x = (i + 1) * self.cell_size
-            
-            # 세로선 그림자
-            self.canvas.create_line(
-                x + 1, self.cell_size, x + 1, self.canvas_height - self.cell_size,
-                fill="#8b4513", width=1
-            )
-            
-            # 가로선 그림자
-            self.canvas.create_line(
-                self.cell_size, x + 1, self.canvas_width - self.cell_size, x + 1,
-                fill="#8b4513", width=1
-            )
+        """오목판을 그립니다 (격자선과 화점은 고정 층에 한 번만 그림)."""
+        if self.renderer:
+            self.renderer.draw_static()
     
     def draw_stone(self, row: int, col: int, stone_color: StoneColor):
         """돌을 그립니다."""
-        if not self.canvas:
-            return
-        
-        # 보드 좌표를 캔버스 좌표로 변환
-        x = (col + 1) * self.cell_size
-        y = (row + 1) * self.cell_size
-        
-        # 돌 색상 설정
-        if stone_color == StoneColor.BLACK:
-            fill_color = "#000000"
-            outline_color = "#1a1a1a"
-            shadow_color = "#1a1a1a"
-            highlight_color = "#333333"
-        else:
-            fill_color = "#ffffff"
-            outline_color = "#f0f0f0"
-            shadow_color = "#f0f0f0"
-            highlight_color = "#ffffff"
-        
-        # 그림자 효과 (3D 느낌)
-        self.canvas.create_oval(
-            x - self.stone_radius + 2, y - self.stone_radius + 2,
-            x + self.stone_radius + 2, y + self.stone_radius + 2,
-            fill=shadow_color, outline=shadow_color
-        )
-        
-        # 메인 돌
-        self.canvas.create_oval(
-            x - self.stone_radius, y - self.stone_radius,
-            x + self.stone_radius, y + self.stone_radius,
-            fill=fill_color, outline=outline_color, width=2
-        )
-        
-        # 하이라이트 효과 (3D 느낌)
-        highlight_radius = self.stone_radius // 3
-        self.canvas.create_oval(
-            x - highlight_radius, y - highlight_radius,
-            x + highlight_radius, y + highlight_radius,
-            fill=highlight_color, outline="", stipple="gray50"
-        )
+        if self.renderer:
+            self.renderer.draw_stone(row, col, stone_color)
     
     def on_canvas_click(self, event):
         """캔버스 클릭 이벤트를 처리합니다."""
         if not self.game or self.game.is_game_over():
             return
+        # 컴퓨터 차례에는 클릭을 무시 (호버 표시는 계속 동작)
+        if self.is_computer_turn():
+            return
         
         # 클릭 위치를 보드 좌표로 변환
         col = round((event.x - self.cell_size) / self.cell_size)
@@ -341,72 +303,115 @@ class TkinterGUI:
         
         # 유효한 위치인지 확인
         if 0 <= row < self.board_size and 0 <= col < self.board_size:
-            # 현재 플레이어의 돌 색상 저장
-            current_stone_color = self.game.get_current_player().get_stone_color()
-            
-            if self.game.make_move(row, col):
-                # 돌을 그리기 (승리하지 않은 경우에만)
-                if self.game.get_game_state() == GameState.PLAYING:
-                    # 맥/윈도우 차이를 해결하기 위해 약간의 지연 후 돌을 그림
-                    self.root.after(10, lambda: self.draw_stone(row, col, current_stone_color))
-                # 승리한 경우에는 handle_win에서 돌을 그리므로 여기서는 그리지 않음
+            if self.place_move(row, col):
+                self.start_computer_turn()
             else:
                 # 잘못된 이동 표시
                 self.show_invalid_move_indicator(row, col)
     
-    def on_canvas_motion(self, event):
-        """캔버스 마우스 움직임 이벤트를 처리합니다."""
-        if not self.game or self.game.is_game_over():
+    def place_move(self, row: int, col: int) -> bool:
+        """
+        현재 플레이어의 돌을 놓고 그립니다 (사람의 클릭과 컴퓨터의 수가 함께 사용).
+        
+        Returns:
+            bool: 돌을 놓았는지 여부
+        """
+        # 현재 플레이어의 돌 색상 저장
+        current_stone_color = self.game.get_current_player().get_stone_color()
+        
+        if not self.game.make_move(row, col):
+            return False
+        if self.hover:
+            self.hover.refresh()
+        # 돌을 그리기 (승리하지 않은 경우에만)
+        if self.game.get_game_state() == GameState.PLAYING:
+            # 맥/윈도우 차이를 해결하기 위해 약간의 지연 후 돌을 그림
+            self.root.after(10, lambda: self._draw_placed_stone(row, col, current_stone_color))
+        # 승리한 경우에는 handle_win에서 돌을 그리므로 여기서는 그리지 않음
+        return True
+    
+    def _draw_placed_stone(self, row: int, col: int, stone_color: StoneColor):
+        """지연 그리기 사이에 무르기나 새 게임으로 돌이 사라지지 않았을 때만 돌을 그립니다."""
+        if self.game and self.game.get_board().get_stone(row, col) == stone_color:
+            self.draw_stone(row, col, stone_color)
+    
+    def is_computer_turn(self) -> bool:
+        """컴퓨터 대전 중이고 컴퓨터가 둘 차례인지 확인합니다."""
+        return (self.vs_computer.get() and self.game is not None and not self.game.is_game_over() and
+                self.game.get_current_player().get_stone_color() == COMPUTER_COLOR)
+    
+    def on_vs_computer_toggle(self):
+        """컴퓨터 대전을 켜거나 끕니다."""
+        if self.vs_computer.get():
+            if self.engine is None:
+                self.engine = BackgroundEngine(COMPUTER_TIME_LIMIT_MS, ponder=COMPUTER_PONDER)
+            # 프로세스를 미리 띄워 두어 첫 수의 생각 시간에 더해지지 않게 함
+            self.engine.start()
+            self.start_computer_turn()
+        else:
+            self.cancel_computer_turn()
+    
+    def start_computer_turn(self):
+        """
+        컴퓨터 차례이면 백그라운드 탐색을 요청하고 결과 확인을 예약합니다.
+        
+        미리 생각하던 예상 응수를 사람이 두었으면 엔진이 그 탐색을 이어 쓰고, 아니면 그 탐색은 바로 멈춥니다.
+        컴퓨터 차례가 아니면(게임 종료, 무르기 후) 미리 생각하기를 멈춥니다.
+        """
+        if self.engine is None or self.engine.thinking:
             return
-        
-        # 마우스 위치를 보드 좌표로 변환
-        col = round((event.x - self.cell_size) / self.cell_size)
-        row = round((event.y - self.cell_size) / self.cell_size)
-        
-        # 유효한 위치인지 확인
-        if 0 <= row < self.board_size and 0 <= col < self.board_size:
-            if self.game.get_board().is_empty(row, col):
-                stone_color = self.game.get_current_player().get_stone_color()
-                if self.game.get_board().check_double_three(row, col, stone_color):
-                    self.show_double_three_indicator(row, col)
-                else:
-                    self.clear_double_three_indicator()
+        if not self.is_computer_turn():
+            self.cancel_computer_turn()
+            return
+        self.engine.start_search(self.game)
+        self._thinking_started = time.monotonic()
+        self.update_thinking_indicator()
+        self.root.after(ENGINE_POLL_MS, self._poll_engine)
     
-    def show_double_three_indicator(self, row: int, col: int):
-        """쌍삼 표시기를 보여줍니다."""
-        self.clear_double_three_indicator()
-        
-        if not self.canvas:
+    def cancel_computer_turn(self):
+        """진행 중인 컴퓨터의 탐색이나 미리 생각하기를 취소하고 생각 중 표시를 지웁니다."""
+        if self.engine is not None:
+            self.engine.cancel()
+        self.update_thinking_indicator()
+    
+    def _poll_engine(self):
+        """탐색 결과 큐를 기다리지 않고 확인합니다 (결과가 없으면 다음 프레임에 다시 확인)."""
+        if self.engine is None or not self.engine.thinking:
+            return  # 취소됨 (무르기, 새 게임, 컴퓨터 대전 끄기)
+        try:
+            result = self.engine.poll()
+        except RuntimeError as e:
+            self.vs_computer.set(False)
+            self.update_thinking_indicator()
+            messagebox.showerror("컴퓨터 오류", str(e))
             return
         
-        # 보드 좌표를 캔버스 좌표로 변환
-        x = (col + 1) * self.cell_size
-        y = (row + 1) * self.cell_size
-        
-        # 반투명 빨간색 원
-        self.double_three_indicator = self.canvas.create_oval(
-            x - self.stone_radius, y - self.stone_radius,
-            x + self.stone_radius, y + self.stone_radius,
-            fill="#ff0000", outline="#cc0000", width=2,
-            stipple="gray25"  # 반투명 효과
-        )
+        if result is None:
+            self.update_thinking_indicator()
+            self.root.after(ENGINE_POLL_MS, self._poll_engine)
+            return
         
-        # X 표시
-        x_size = self.stone_radius // 2
-        self.canvas.create_line(
-            x - x_size, y - x_size, x + x_size, y + x_size,
-            fill="#ffffff", width=3
-        )
-        self.canvas.create_line(
-            x - x_size, y + x_size, x + x_size, y - x_size,
-            fill="#ffffff", width=3
-        )
+        self.update_thinking_indicator()
+        if result.move is not None and self.is_computer_turn():
+            self.place_move(*result.move)
+    
+    def update_thinking_indicator(self):
+        """컴퓨터가 생각 중이면 경과 시간과 함께 표시하고, 아니면 지웁니다."""
+        if not self.thinking_label:
+            return
+        if self.engine is not None and self.engine.thinking:
+            elapsed = time.monotonic() - self._thinking_started
+            text = "컴퓨터가 생각 중" + "." * (int(elapsed * 3) % 4)
+        else:
+            text = ""
+        # 글자가 바뀔 때만 위젯을 갱신
+        if self.thinking_label.cget("text") != text:
+            self.thinking_label.config(text=text)
     
-    def clear_double_three_indicator(self):
-        """쌍삼 표시기를 제거합니다."""
-        if self.double_three_indicator and self.canvas:
-            self.canvas.delete(self.double_three_indicator)
-            self.double_three_indicator = None
+    def on_canvas_motion(self, event):
+        """캔버스 마우스 움직임 이벤트를 처리합니다 (유휴 시점에 한 번만 금수 표시를 갱신)."""
+        if self.hover:
+            self.hover.on_motion(event)
     
     def show_invalid_move_indicator(self, row: int, col: int):
         """잘못된 이동 표시기를 보여줍니다."""
@@ -422,7 +427,7 @@ class TkinterGUI:
             x - self.stone_radius, y - self.stone_radius,
             x + self.stone_radius, y + self.stone_radius,
             fill="#ff0000", outline="#cc0000", width=2,
-            stipple="gray25"
+            stipple="gray25", tags=CanvasLayer.OVERLAY
         )
         
         # 1초 후 제거
@@ -454,12 +459,10 @@ class TkinterGUI:
             highlight = self.canvas.create_oval(
                 x - self.stone_radius - 3, y - self.stone_radius - 3,
                 x + self.stone_radius + 3, y + self.stone_radius + 3,
-                outline="#ff0000", width=3, fill=""
+                outline="#ff0000", width=3, fill="", tags=CanvasLayer.OVERLAY
             )
             
             # 승리 표시기 저장 (새 게임 시작 시 제거)
-            if not hasattr(self, 'winning_highlights'):
-                self.winning_highlights = []
             self.winning_highlights.append(highlight)
     
     def find_winning_positions(self, row: int, col: int, stone_color: StoneColor) -> List[Tuple[int, int]]:
@@ -554,63 +557,62 @@ class TkinterGUI:
     
     def new_game(self):
         """새 게임을 시작합니다."""
-        # 기존 돌들 제거
-        if self.canvas:
-            # 격자선과 화점을 제외한 모든 요소 제거
-            for item in self.canvas.find_all():
-                if item != self.double_three_indicator:
-                    self.canvas.delete(item)
-            
-            # 보드 다시 그리기
-            self.draw_board()
+        self.cancel_computer_turn()
         
-        # 쌍삼 표시기 제거
-        self.clear_double_three_indicator()
-        
-        # 승리 표시기 제거
-        if hasattr(self, 'winning_highlights'):
-            for highlight in self.winning_highlights:
-                if highlight in self.canvas.find_all():
-                    self.canvas.delete(highlight)
-            self.winning_highlights = []
+        # 돌 층과 덧그림 층(승리 표시기 등)만 지우고 격자는 그대로 둠
+        if self.renderer:
+            self.renderer.clear_stones()
+        self.winning_highlights = []
         
         # 게임 재시작
         self.game.reset_game()
         
         # 화면 업데이트
         self.update_display()
+        if self.hover:
+            self.hover.refresh()
     
     def undo_move(self):
         """마지막 이동을 되돌립니다."""
         if not self.game or self.game.is_game_over():
             return
         
-        # 무르기 실행
-        if self.game.undo_move():
-            # 화면에서 마지막 돌 제거
-            if self.canvas:
-                # 모든 돌 제거 후 다시 그리기
-                for item in self.canvas.find_all():
-                    if item != self.double_three_indicator:
-                        self.canvas.delete(item)
-                
-                # 보드 다시 그리기
-                self.draw_board()
-                
-                # 기존 돌들 다시 그리기
-                board_state = self.game.get_board().get_board_state()
-                for row in range(self.board_size):
-                    for col in range(self.board_size):
-                        stone_color = board_state[row][col]
-                        if stone_color:
-                            self.draw_stone(row, col, stone_color)
+        # 컴퓨터 대전에서는 사람의 차례로 돌아가도록 컴퓨터의 수까지 함께 무름
+        # (컴퓨터가 생각 중이면 탐색을 취소하고 사람의 마지막 수만 무름)
+        undo_count = 1
+        if self.vs_computer.get():
+            if not self.is_computer_turn() and self.game.get_board().get_move_count() >= 2:
+                undo_count = 2
+            self.cancel_computer_turn()
+        
+        # 무르기 실행 (되돌린 돌 하나의 항목만 지움)
+        undone = False
+        for _ in range(undo_count):
+            last_move = self.game.get_last_move()
+            if not self.game.undo_move():
+                break
+            undone = True
+            if self.renderer and last_move:
+                self.renderer.remove_stone(*last_move)
+        
+        if undone:
+            if self.hover:
+                self.hover.refresh()
             
             # 화면 업데이트
             self.update_display()
+            self.start_computer_turn()
         else:
             # 무르기 실패 시 메시지
             messagebox.showinfo("무르기", "무를 수 있는 이동이 없습니다.")
     
+    def quit(self):
+        """엔진 프로세스를 종료하고 GUI를 끝냅니다."""
+        if self.engine is not None:
+            self.engine.close()
+            self.engine = None
+        self.root.quit()
+    
     def run(self):
         """GUI를 실행합니다."""
         self.root.mainloop()